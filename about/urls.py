@@ -1,6 +1,8 @@
 from django.urls import path
-from .views import AboutView
+from .views import AboutView, about, about_async
 
 urlpatterns = [
+      path('', about, name='about'),
       path('api/about/', AboutView, name='about_api'),
+      path('api/async/about/', about_async, name='about_api_async'),
 ]
\ No newline at end of file
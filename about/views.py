@@ -1,8 +1,10 @@
 from django.shortcuts import render
+from django.views.decorators.http import require_safe
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
 from .models import About
 from .serializers import AboutSerializer
+from fameuxarte.async_api import render_json
 
 # HTML view
 def about(request):
@@ -15,4 +17,12 @@ def AboutView(request):
     if about:
         serializer = AboutSerializer(about)
         return Response(serializer.data)
-    return Response({"message": "No about section found."}, status=404)  # ✅ Fixed
\ No newline at end of file
+    return Response({"message": "No about section found."}, status=404)  # ✅ Fixed
+
+# Async API view (for ASGI workers)
+@require_safe
+async def about_async(request):
+    about = await About.objects.afirst()
+    if about:
+        return render_json(AboutSerializer(about).data)
+    return render_json({"message": "No about section found."}, status=404)
@@ -0,0 +1,120 @@
+import copy
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+CLAIMS_AT = 'claims_at'  # When the user claims in a token were read from the database
+_local_users = {}  # str(user id) -> (expires, User), per process
+LOCAL_MAX_USERS = 10000
+
+
+def user_key(user_id):
+    return f'auth:user:{user_id}'
+
+
+def changed_key(user_id):
+    return f'auth:user-changed:{user_id}'
+
+
+def get_cached_user(user_id):
+    """
+    The User for ``user_id`` from a few seconds' in-process cache, then the
+    shared cache, then the database. Returns a copy, so callers can't change
+    the cached instance. None if the user does not exist.
+    """
+    user_id = str(user_id)  # Token claims carry the id as a string
+    now = time.monotonic()
+    hit = _local_users.get(user_id)
+    if hit is not None and hit[0] > now:
+        return copy.copy(hit[1])
+    user = cache.get(user_key(user_id))
+    if user is None:
+        user = User.objects.filter(pk=user_id).first()
+        if user is None:
+            return None
+        cache.set(user_key(user_id), user, settings.AUTH_USER_CACHE_TIMEOUT)
+    if len(_local_users) >= LOCAL_MAX_USERS:
+        _local_users.clear()
+    _local_users[user_id] = (now + settings.AUTH_USER_LOCAL_TIMEOUT, user)
+    return copy.copy(user)
+
+
+def invalidate_user(user_id):
+    """
+    Drop a changed user from both caches and mark the claims in tokens issued
+    before now as stale (other processes keep their local copy for at most
+    AUTH_USER_LOCAL_TIMEOUT seconds).
+    """
+    _local_users.pop(str(user_id), None)
+    cache.delete(user_key(user_id))
+    # Refreshed access tokens carry the refresh token's claims, so remember for that long
+    cache.set(changed_key(user_id), time.time(), int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds()))
+
+
+def claims_are_current(validated_token):
+    claims_at = validated_token.get(CLAIMS_AT)
+    if claims_at is None:
+        return False
+    changed_at = cache.get(changed_key(validated_token[api_settings.USER_ID_CLAIM]))
+    return changed_at is None or changed_at < claims_at
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Puts what read-only requests need to know about the user into the token itself."""
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token['username'] = user.username
+        token['is_staff'] = user.is_staff
+        token['is_superuser'] = user.is_superuser
+        token[CLAIMS_AT] = time.time()
+        return token
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication without a user query per request.
+
+    GET/HEAD/OPTIONS requests get a TokenUser built from the verified token's
+    claims (id, username, is_staff, is_superuser), unless the user changed
+    after those claims were issued. Everything else gets the full User from
+    get_cached_user(), with the same is_active and password-change checks as
+    JWTAuthentication.
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        if request.method in SAFE_METHODS and claims_are_current(validated_token):
+            return TokenUser(validated_token), validated_token
+        return self.get_user(validated_token), validated_token
+
+    def get_user(self, validated_token):
+        user = get_cached_user(validated_token[api_settings.USER_ID_CLAIM])
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+        return user
@@ -0,0 +1,27 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import invalidate_user
+
+
+# Any change to a user (profile fields, is_active, password, groups) invalidates the cached
+# copy and the claims in their outstanding tokens
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def user_permissions_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action.startswith('post_'):
+            invalidate_user(instance.pk)
+    elif action == 'pre_clear':  # group.user_set.clear() does not say which users it removes
+        for user_id in instance.user_set.values_list('pk', flat=True):
+            invalidate_user(user_id)
+    elif action in ('post_add', 'post_remove'):
+        for user_id in pk_set:
+            invalidate_user(user_id)
@@ -1,3 +1,62 @@
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.models import TokenUser
+
+from .authentication import CachedJWTAuthentication, _local_users
 
 # Create your tests here.
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        _local_users.clear()
+        self.user = User.objects.create_user('collector', password='pw', is_staff=True)
+        response = self.client.post('/api/token/', {'username': 'collector', 'password': 'pw'})
+        self.access = response.json()['access']
+        _local_users.clear()
+
+    def authenticate(self, method='get'):
+        request = getattr(APIRequestFactory(), method)('/api/shop/products/', HTTP_AUTHORIZATION=f'Bearer {self.access}')
+        return CachedJWTAuthentication().authenticate(request)
+
+    def test_reads_trust_the_claims(self):
+        with self.assertNumQueries(0):
+            user, token = self.authenticate()
+        self.assertIsInstance(user, TokenUser)
+        self.assertEqual((user.pk, user.username, user.is_staff), (str(self.user.pk), 'collector', True))
+
+    def test_writes_load_the_user_once(self):
+        with self.assertNumQueries(1):
+            user, token = self.authenticate('post')
+        self.assertIsInstance(user, User)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.authenticate('post')[0], self.user)
+        _local_users.clear()
+        with self.assertNumQueries(0):  # From the shared cache
+            self.assertEqual(self.authenticate('post')[0], self.user)
+
+    def test_changed_users_are_reloaded(self):
+        self.authenticate('post')
+        self.user.is_staff = False
+        self.user.save()
+        with self.assertNumQueries(1):
+            user, token = self.authenticate()  # The claims are stale: full lookup even for a read
+        self.assertIsInstance(user, User)
+        self.assertFalse(user.is_staff)
+
+    def test_group_changes_make_claims_stale(self):
+        group = Group.objects.create(name='curators')
+        group.user_set.add(self.user)
+        self.assertIsInstance(self.authenticate()[0], User)
+
+    def test_inactive_and_deleted_users(self):
+        self.user.is_active = False
+        self.user.save()
+        with self.assertRaisesMessage(AuthenticationFailed, 'inactive'):
+            self.authenticate('post')
+        self.user.delete()
+        with self.assertRaisesMessage(AuthenticationFailed, 'not found'):
+            self.authenticate()
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-19 18:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('artists', '0002_artist_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='artist',
+            name='featured',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -7,6 +7,8 @@ class Artist(models.Model):
     bio = models.TextField()
     image = models.ImageField(upload_to='artists/')
     website = models.URLField(blank=True, null=True)
+    featured = models.BooleanField(default=False) # Shown on the home page
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
\ No newline at end of file
@@ -1,7 +1,9 @@
 from rest_framework import serializers
+from fameuxarte.sparse import SparseFieldsMixin
+from uploads.serializers import ChunkedUploadFieldMixin
 from .models import Artist
 
-class ArtistSerializer(serializers.ModelSerializer):
+class ArtistSerializer(SparseFieldsMixin, ChunkedUploadFieldMixin, serializers.ModelSerializer):  # image or upload=<chunked upload id>
     class Meta:
         model = Artist
         fields = '__all__'
\ No newline at end of file
@@ -1,7 +1,10 @@
 from django.urls import path
 from .views import ArtistListCreateView, ArtistRetrieveUpdateDestroyView  # Ensure the name matches exactly
+from .views import artist_list_async, artist_detail_async
 
 urlpatterns = [
     path('artists/', ArtistListCreateView.as_view(), name='artist-list-create'),
     path('artists/<int:pk>/', ArtistRetrieveUpdateDestroyView.as_view(), name='artist-detail'),
+    path('async/artists/', artist_list_async, name='artist-list-async'),
+    path('async/artists/<int:pk>/', artist_detail_async, name='artist-detail-async'),
 ]
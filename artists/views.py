@@ -1,13 +1,25 @@
+from django.views.decorators.http import require_safe
 from rest_framework import generics
+from fameuxarte.async_api import detail_response, list_response
+from fameuxarte.sparse import SparseFieldsViewMixin
 from .models import Artist
 from .serializers import ArtistSerializer
 
 # List & Create Artists
-class ArtistListCreateView(generics.ListCreateAPIView):
+class ArtistListCreateView(SparseFieldsViewMixin, generics.ListCreateAPIView):
     queryset = Artist.objects.all()
     serializer_class = ArtistSerializer
 
 # Retrieve, Update & Delete a Single Artist (Corrected Name)
-class ArtistRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+class ArtistRetrieveUpdateDestroyView(SparseFieldsViewMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Artist.objects.all()
     serializer_class = ArtistSerializer
+
+# Async read-only API (for ASGI workers)
+@require_safe
+async def artist_list_async(request):
+    return await list_response(request, Artist.objects.all(), ArtistSerializer)
+
+@require_safe
+async def artist_detail_async(request, pk):
+    return await detail_response(request, Artist.objects.all(), ArtistSerializer, pk=pk)
@@ -1,5 +1,7 @@
 from django.contrib import admin
 from .models import Post, Category, Tag, Comment
+from fameuxarte.admin_tools import EstimatedCountPaginator, LatestInline
+from . import moderation
 
 # Category Admin
 @admin.register(Category)
@@ -13,25 +15,45 @@ class TagAdmin(admin.ModelAdmin):
     list_display = ('name', 'slug')
     prepopulated_fields = {'slug': ('name',)}
 
-# Comment Inline for Post Admin
-class CommentInline(admin.TabularInline):  # Can also use `admin.StackedInline`
+# Latest comments inside the Post page (read-only; moderate them under Comments)
+class CommentInline(LatestInline, admin.TabularInline):
     model = Comment
-    extra = 1  # Number of empty comment fields to show
+    fields = ('author', 'email', 'body', 'approved', 'is_spam', 'created_at')
+    readonly_fields = ('created_at',)
+    ordering = ('-created_at',)
 
 # Post Admin
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
     list_display = ('title', 'author', 'created_at', 'published_at')
-    list_filter = ('author', 'created_at', 'published_at')
+    list_select_related = ('author',)
+    list_filter = (('author', admin.RelatedOnlyFieldListFilter), 'created_at', 'published_at')  # Only users who wrote posts
     search_fields = ('title', 'content', 'author__username')
     prepopulated_fields = {'slug': ('title',)}
+    autocomplete_fields = ('author',)
     ordering = ('-published_at',)
-    inlines = [CommentInline]  # Allows adding comments inside the post admin page
+    inlines = [CommentInline]
 
 # Comment Admin
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
-    list_display = ('post', 'author', 'email', 'created_at', 'approved')
-    list_filter = ('approved', 'created_at')
+    list_display = ('post', 'author', 'email', 'created_at', 'approved', 'is_spam', 'spam_score')
+    list_select_related = ('post',)
+    list_filter = ('approved', 'is_spam', 'created_at')  # The first two are the blog_comment_moderation index
     search_fields = ('author', 'email', 'body')
-    actions = ['approve_comments']
+    autocomplete_fields = ('post',)
+    ordering = ('-created_at',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    actions = ['approve_comments', 'reject_comments']
+
+    # Both actions are a single UPDATE over the selection
+    @admin.action(description="Approve selected comments")
+    def approve_comments(self, request, queryset):
+        count = moderation.approve(queryset)
+        self.message_user(request, f"{count} comment(s) approved.")
+
+    @admin.action(description="Reject selected comments as spam")
+    def reject_comments(self, request, queryset):
+        count = moderation.reject(queryset)
+        self.message_user(request, f"{count} comment(s) rejected.")
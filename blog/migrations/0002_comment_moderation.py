@@ -0,0 +1,31 @@
+# Generated by Django 5.1.15 on 2026-10-19 18:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='is_spam',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='spam_score',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', 'approved'], name='blog_comment_post_approved'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['approved', 'is_spam'], name='blog_comment_moderation'),
+        ),
+    ]
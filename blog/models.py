@@ -37,6 +37,7 @@ class Meta:
 class Tag(models.Model):      # Model for tags (for categorizing posts)
         name = models.CharField(max_length=100, unique=True)
         slug = models.SlugField(max_length=100, unique=True)
+        updated_at = models.DateTimeField(auto_now=True) # Used as the sitemap lastmod
 
         def __str__(self):
             return self.name
@@ -50,6 +51,15 @@ class Comment(models.Model):
         body = models.TextField()
         created_at = models.DateTimeField(auto_now_add=True)
         approved = models.BooleanField(default=False) # For comment maderation
+        is_spam = models.BooleanField(default=False) # Rejected by a moderator or the spam scorer
+        spam_score = models.FloatField(blank=True, null=True) # Filled in by blog.moderation when the comment is ingested
+
+        class Meta:
+            indexes = [
+                models.Index(fields=['post', 'approved'], name='blog_comment_post_approved'), # Approved comments of a post
+                models.Index(fields=['approved', 'is_spam'], name='blog_comment_moderation'), # Moderation queue
+                models.Index(fields=['-created_at'], name='blog_comment_recent'), # Admin changelist
+            ]
 
         def __str__(self):
             return self.body
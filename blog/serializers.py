@@ -1,29 +1,32 @@
 from rest_framework import serializers
+from fameuxarte.sparse import SparseFieldsMixin
 from .models import Post, Category, Tag, Comment
 from django.contrib.auth.models import User  # ✅ Import User model
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = '__all__'
 
-class TagSerializer(serializers.ModelSerializer):
+class TagSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Tag
         fields = '__all__'
 
-class CommentSerializer(serializers.ModelSerializer):
+# Public comments: the spam scorer's verdict stays in the admin
+class CommentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Comment
-        fields = '__all__'
+        exclude = ['is_spam', 'spam_score']
+        read_only_fields = ['approved']
 
 # ✅ Custom Serializer for Author
-class AuthorSerializer(serializers.ModelSerializer):
+class AuthorSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ["username", "first_name", "last_name"]
 
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     author = AuthorSerializer(read_only=True)  # ✅ Now returns an object (not string)
     category = CategorySerializer(read_only=True)
     tags = TagSerializer(many=True, read_only=True)
@@ -1,3 +1,71 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from fameuxarte.batching import BatchWriter
+from .models import Comment, Post
+from .moderation import comment_writer, heuristic_score
 
 # Create your tests here.
+
+class CommentTestCase(TestCase):
+    def setUp(self):
+        author = User.objects.create_user('writer')
+        self.post = Post.objects.create(title='Studio notes', slug='studio-notes', author=author, content='...')
+
+    def comment(self, body, author='Ana'):
+        return Comment(post=self.post, author=author, email='ana@example.com', body=body)
+
+
+class BatchWriterTests(CommentTestCase):
+    def test_a_failing_row_only_drops_itself(self):
+        written = []
+        writer = BatchWriter(Comment, after_write=written.extend)
+        batch = [self.comment('First'), self.comment(None), self.comment('Third')]  # body is NOT NULL
+        with self.assertLogs('fameuxarte.batching', 'ERROR'):
+            writer.write(batch)
+        self.assertEqual(sorted(Comment.objects.values_list('body', flat=True)), ['First', 'Third'])
+        self.assertEqual([comment.body for comment in written], ['First', 'Third'])
+
+    def test_a_single_failing_row_raises(self):
+        with self.assertRaises(Exception):
+            BatchWriter(Comment).write([self.comment(None)])
+
+    def test_flush_writes_queued_objects(self):
+        writer = BatchWriter(Comment, batch_size=2)
+        for body in ['a comment', 'another one', 'a third one']:
+            writer._queue.put(self.comment(body))  # Queued without starting the background thread
+        writer.flush()
+        self.assertEqual(Comment.objects.count(), 3)
+        self.assertEqual(writer.pending(), 0)
+
+
+class ModerationTests(CommentTestCase):
+    def test_heuristic_score(self):
+        self.assertLess(heuristic_score(self.comment("Lovely brushwork on the second piece.")), 0.2)
+        self.assertGreater(heuristic_score(self.comment("FREE MONEY casino http://x.io http://y.io click here")), 0.8)
+
+    def test_thresholds_are_applied_after_the_insert(self):
+        comment_writer.write([
+            self.comment("Lovely brushwork on the second piece."),
+            self.comment("Win bitcoin at the casino, click here http://spam.example", author='www.spam.example'),
+        ])
+        clean, spam = Comment.objects.order_by('pk')
+        self.assertTrue(clean.approved)
+        self.assertTrue(spam.is_spam)
+        self.assertFalse(spam.approved)
+
+    @override_settings(COMMENT_MODERATION_ASYNC=False)
+    def test_api_accepts_comments(self):
+        response = self.client.post('/api/blog/comments/', {
+            'post': self.post.pk, 'author': 'Ana', 'email': 'ana@example.com', 'body': "Where can I see it in person?",
+        })
+        self.assertEqual(response.status_code, 202)
+        self.assertIsNotNone(Comment.objects.get().spam_score)
+
+    def test_public_payloads_hide_the_spam_verdict(self):
+        comment_writer.write([self.comment("Lovely brushwork on the second piece.")])
+        public = {'id', 'post', 'author', 'email', 'body', 'created_at', 'approved'}
+        post = self.client.get(f'/api/blog/posts/{self.post.pk}/').json()
+        self.assertEqual(set(post['comments'][0]), public)
+        self.assertEqual(set(self.client.get('/api/blog/comments/').json()[0]), public)
+        self.assertEqual(set(self.client.get(f'/api/blog/async/posts/{self.post.pk}/').json()['comments'][0]), public)
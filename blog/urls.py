@@ -1,6 +1,7 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import PostViewSet, CategoryViewSet, TagViewSet, CommentViewSet
+from .views import PostViewSet, CategoryViewSet, TagViewSet, CommentViewSet, PostBySlugViewSet, TagBySlugViewSet
+from .views import post_list_async, post_detail_async
 
 # Set up DRF router
 router = DefaultRouter()
@@ -9,4 +10,12 @@ router.register(r'tags', TagViewSet)
 router.register(r'posts', PostViewSet)  # ✅ Corrects `/api/posts/`
 router.register(r'comments', CommentViewSet)
 
-urlpatterns = router.urls
+urlpatterns = [
+    # Read by slug
+    path('posts/slug/<slug:slug>/', PostBySlugViewSet.as_view({'get': 'retrieve'}), name='post-detail-slug'),
+    path('tags/slug/<slug:slug>/', TagBySlugViewSet.as_view({'get': 'retrieve'}), name='tag-detail-slug'),
+
+    # Async read-only versions
+    path('async/posts/', post_list_async, name='post-list-async'),
+    path('async/posts/<int:pk>/', post_detail_async, name='post-detail-async'),
+] + router.urls
@@ -1,23 +1,57 @@
-from rest_framework import viewsets
+from django.db.models import Prefetch
+from django.views.decorators.http import require_safe
+from rest_framework import status, viewsets
+from rest_framework.response import Response
 from .models import Post, Category, Tag, Comment
 from .serializers import PostSerializer, CategorySerializer, TagSerializer, CommentSerializer
+from .moderation import enqueue_comment
+from fameuxarte.async_api import detail_response, list_response
+from fameuxarte.sparse import SparseFieldsViewMixin
+from slugs.lookup import SlugLookupMixin
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(SparseFieldsViewMixin, viewsets.ModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
 
-class TagViewSet(viewsets.ModelViewSet):
+class TagViewSet(SparseFieldsViewMixin, viewsets.ModelViewSet):
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
 
-class PostViewSet(viewsets.ModelViewSet):
-    queryset = Post.objects.all()
+# Only approved comments go into the post payload, so a spam burst sitting in
+# the moderation queue never makes post reads bigger or slower.
+POST_QUERYSET = Post.objects.select_related('author').prefetch_related(
+    'tags',
+    Prefetch('comments', queryset=Comment.objects.filter(approved=True)),
+)
+
+class PostViewSet(SparseFieldsViewMixin, viewsets.ModelViewSet):
+    queryset = POST_QUERYSET
     serializer_class = PostSerializer
 
-class CommentViewSet(viewsets.ModelViewSet):
+# /posts/slug/<slug>/ and /tags/slug/<slug>/ (former slugs redirect)
+class PostBySlugViewSet(SlugLookupMixin, PostViewSet):
+    pass
+
+class TagBySlugViewSet(SlugLookupMixin, TagViewSet):
+    pass
+
+class CommentViewSet(SparseFieldsViewMixin, viewsets.ModelViewSet):
     queryset = Comment.objects.all()
     serializer_class = CommentSerializer
 
+    def create(self, request, *args, **kwargs):
+        # New comments are scored and inserted in batches by blog.moderation
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        enqueue_comment(Comment(**serializer.validated_data))
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
 
 
+# Async read-only API (for ASGI workers, see fameuxarte/async_api.py)
+@require_safe
+async def post_list_async(request):
+    return await list_response(request, POST_QUERYSET.all(), PostSerializer)
 
+@require_safe
+async def post_detail_async(request, pk):
+    return await detail_response(request, POST_QUERYSET.all(), PostSerializer, pk=pk)
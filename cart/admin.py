@@ -1,3 +1,31 @@
 from django.contrib import admin
+from fameuxarte.admin_tools import EstimatedCountPaginator
+from .models import Cart, CartItem, Discount, Shipping
 
 # Register your models here.
+
+class CartItemInline(admin.TabularInline):
+    model = CartItem
+    autocomplete_fields = ('product',)
+    extra = 0
+
+class ShippingInline(admin.StackedInline):
+    model = Shipping
+    extra = 0
+
+@admin.register(Cart)
+class CartAdmin(admin.ModelAdmin):
+    list_display = ('id', 'user', 'session_key', 'discount', 'created_at')
+    list_select_related = ('user', 'discount')
+    search_fields = ('=id', 'session_key', 'user__username')
+    autocomplete_fields = ('user', 'discount')
+    ordering = ('-id',)  # Newest first on the primary key; created_at has no index
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    inlines = [CartItemInline, ShippingInline]
+
+@admin.register(Discount)
+class DiscountAdmin(admin.ModelAdmin):
+    list_display = ('code', 'percentage', 'active')
+    list_filter = ('active',)
+    search_fields = ('code',)
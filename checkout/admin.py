@@ -1,3 +1,25 @@
 from django.contrib import admin
+from fameuxarte.admin_tools import EstimatedCountPaginator
+from .models import Order, OrderItem
 
 # Register your models here.
+
+class OrderItemInline(admin.TabularInline):
+    model = OrderItem
+    fields = ('product', 'price', 'quantity')
+    readonly_fields = ('price',)  # Taken from the product when the line is created
+    autocomplete_fields = ('product',)
+    extra = 0
+
+@admin.register(Order)
+class OrderAdmin(admin.ModelAdmin):
+    list_display = ('id', 'user', 'first_name', 'last_name', 'email', 'created_at', 'paid', 'total_price')
+    list_select_related = ('user',)
+    list_filter = ('paid',)  # With the newest-first ordering: the checkout_order_paid_recent index
+    search_fields = ('=id', 'email', 'last_name', 'user__username')
+    autocomplete_fields = ('user',)
+    readonly_fields = ('created_at', 'total_price', 'confirmation_sent_at', 'co_purchases_counted')
+    ordering = ('-created_at',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    inlines = [OrderItemInline]
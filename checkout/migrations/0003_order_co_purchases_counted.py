@@ -0,0 +1,24 @@
+# Generated by Django 5.1.15 on 2026-10-19 19:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('checkout', '0002_order_confirmation_sent_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='co_purchases_counted',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('co_purchases_counted', False), ('paid', True)), fields=['id'], name='checkout_order_uncounted'),
+        ),
+    ]
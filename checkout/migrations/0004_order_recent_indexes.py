@@ -0,0 +1,23 @@
+# Generated by Django 5.1.15 on 2026-10-19 19:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('checkout', '0003_order_co_purchases_counted'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['-created_at'], name='checkout_order_recent'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['paid', '-created_at'], name='checkout_order_paid_recent'),
+        ),
+    ]
@@ -15,8 +15,20 @@ class Order(models.Model):
     paid = models.BooleanField(default=False)
     total_price = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)  # Store total price
     shipping_cost = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)  # Store shipping cost
+    confirmation_sent_at = models.DateTimeField(blank=True, null=True)  # Set once the confirmation mail went out
+    co_purchases_counted = models.BooleanField(default=False)  # Counted into recommendations (see recommendations/build.py)
     # Add other order-related fields (e.g., order status, shipping method, etc.)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['id'], name='checkout_order_uncounted',
+                condition=models.Q(paid=True, co_purchases_counted=False),
+            ),  # Paid orders the recommendations build has not seen yet
+            models.Index(fields=['-created_at'], name='checkout_order_recent'),  # Admin list, newest first
+            models.Index(fields=['paid', '-created_at'], name='checkout_order_paid_recent'),  # ...filtered by paid
+        ]
+
     def __str__(self):
         return f"Order {self.id}"
 
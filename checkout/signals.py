@@ -0,0 +1,12 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Order
+from .tasks import send_order_confirmation
+
+
+# Paid orders get their confirmation mail from the job worker
+@receiver(post_save, sender=Order)
+def queue_confirmation(sender, instance, **kwargs):
+    if instance.paid and instance.confirmation_sent_at is None:
+        send_order_confirmation.enqueue(args=[instance.pk], unique_key=f'order-confirmation-{instance.pk}')
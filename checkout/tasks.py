@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.core.mail import send_mail
+from django.utils import timezone
+
+from jobs.registry import task
+from .models import Order
+
+
+@task(priority=10)
+def send_order_confirmation(order_id):
+    """Email the customer their paid order; runs once per order."""
+    order = Order.objects.filter(pk=order_id, confirmation_sent_at__isnull=True).first()
+    if order is None:
+        return
+    lines = [
+        f"{item.quantity} x {item.product.name if item.product else 'Item'}: {item.get_subtotal()}"
+        for item in order.items.select_related('product')
+    ]
+    send_mail(
+        subject=f"Your FameuxArte order {order.id}",
+        message=(
+            f"Dear {order.first_name},\n\nThank you for your order.\n\n" + "\n".join(lines)
+            + f"\n\nShipping: {order.shipping_cost}\nTotal: {order.total_price}\n"
+        ),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipient_list=[order.email],
+    )
+    Order.objects.filter(pk=order.pk).update(confirmation_sent_at=timezone.now())
@@ -1,3 +1,26 @@
 from django.contrib import admin
+from fameuxarte.admin_tools import EstimatedCountPaginator
+from .models import ContactMessage
 
 # Register your models here.
+
+@admin.register(ContactMessage)
+class ContactMessageAdmin(admin.ModelAdmin):
+    list_display = ('name', 'email', 'subject', 'sent_at', 'is_read')
+    list_filter = ('is_read',)  # Unread + newest first is served by the contact_msg_unread_recent index
+    search_fields = ('email', 'subject')
+    ordering = ('-sent_at',)
+    paginator = EstimatedCountPaginator  # No COUNT(*) over the whole inbox for the unfiltered list
+    show_full_result_count = False  # Skip the extra COUNT(*) over the whole table on filtered views
+    readonly_fields = ('name', 'email', 'phone', 'subject', 'message', 'sent_at')
+    actions = ['mark_read', 'mark_unread']
+
+    @admin.action(description="Mark selected messages as read")
+    def mark_read(self, request, queryset):
+        updated = queryset.filter(is_read=False).update(is_read=True)  # One UPDATE, even for "select all"
+        self.message_user(request, f"{updated} message(s) marked as read.")
+
+    @admin.action(description="Mark selected messages as unread")
+    def mark_unread(self, request, queryset):
+        updated = queryset.filter(is_read=True).update(is_read=False)
+        self.message_user(request, f"{updated} message(s) marked as unread.")
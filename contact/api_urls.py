@@ -0,0 +1,6 @@
+from django.urls import path
+from .api_views import ContactMessageCreateView
+
+urlpatterns = [
+    path('', ContactMessageCreateView.as_view(), name='contact-api'),
+]
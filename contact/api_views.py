@@ -0,0 +1,20 @@
+from rest_framework import generics, status
+from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle
+from .ingest import enqueue_message
+from .models import ContactMessage
+from .serializers import ContactMessageSerializer
+
+# Public contact form API: validated, rate limited per client, inserted in batches
+class ContactMessageCreateView(generics.CreateAPIView):
+    serializer_class = ContactMessageSerializer
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'contact'
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = dict(serializer.validated_data)
+        if not data.pop('website', ''):  # Bots get the same answer but nothing is stored
+            enqueue_message(ContactMessage(**data))
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
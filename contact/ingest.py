@@ -0,0 +1,27 @@
+from django.conf import settings
+
+from fameuxarte.batching import BatchWriter
+from .models import ContactMessage
+from .tasks import notify_staff
+
+
+def queue_notifications(saved):
+    # bulk_create sends no post_save, so one notification job covers the whole batch
+    notify_staff.delay([message.pk for message in saved])
+
+
+message_writer = BatchWriter(
+    ContactMessage,
+    batch_size=settings.CONTACT_BATCH_SIZE,
+    flush_interval=settings.CONTACT_FLUSH_INTERVAL,
+    after_write=queue_notifications,
+    name='contact-ingest',
+)
+
+
+def enqueue_message(message):
+    """Queue a new, unsaved contact message for a batched insert."""
+    if settings.CONTACT_INGEST_ASYNC:
+        message_writer.submit(message)
+    else:
+        message_writer.write([message])
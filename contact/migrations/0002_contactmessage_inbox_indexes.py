@@ -0,0 +1,21 @@
+# Generated by Django 5.1.15 on 2026-10-19 18:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['-sent_at'], name='contact_msg_recent'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['is_read', '-sent_at'], name='contact_msg_unread_recent'),
+        ),
+    ]
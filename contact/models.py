@@ -20,6 +20,10 @@ class ContactMessage(models.Model):
     
     class Meta: 
         ordering = ['-sent_at'] # Order messages by most recent first
+        indexes = [
+            models.Index(fields=['-sent_at'], name='contact_msg_recent'), # Inbox, newest first
+            models.Index(fields=['is_read', '-sent_at'], name='contact_msg_unread_recent'), # Unread / read views
+        ]
 
 # Other Considerations:
 # Spam Prevention: Consider adding some basic spam prevention measures, 
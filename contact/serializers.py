@@ -0,0 +1,16 @@
+from rest_framework import serializers
+from .models import ContactMessage
+
+class ContactMessageSerializer(serializers.ModelSerializer):
+    # Honeypot: hidden in the form, so only bots fill it in
+    website = serializers.CharField(write_only=True, required=False, allow_blank=True)
+
+    class Meta:
+        model = ContactMessage
+        fields = '__all__'
+        read_only_fields = ['is_read', 'response', 'sent_at']
+
+    def validate_message(self, value):
+        if len(value.strip()) < 10:
+            raise serializers.ValidationError("Please write a little more.")
+        return value
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import ContactMessage
+from .tasks import notify_staff
+
+
+# The email goes out from the job worker, not the request that saved the message
+@receiver(post_save, sender=ContactMessage)
+def queue_notification(sender, instance, created, **kwargs):
+    if created:
+        notify_staff.delay([instance.pk])
@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.mail import send_mass_mail
+
+from jobs.registry import task
+from .models import ContactMessage
+
+
+@task(priority=5)
+def notify_staff(message_ids):
+    """Email new contact messages to CONTACT_NOTIFY_EMAILS, over one SMTP connection."""
+    if not settings.CONTACT_NOTIFY_EMAILS:
+        return
+    send_mass_mail([
+        (
+            f"[Contact] {message.subject}",
+            f"From: {message.name} <{message.email}>\nPhone: {message.phone or '-'}\n\n{message.message}",
+            settings.DEFAULT_FROM_EMAIL,
+            settings.CONTACT_NOTIFY_EMAILS,
+        )
+        for message in ContactMessage.objects.filter(pk__in=message_ids)
+    ])
@@ -1,3 +1,59 @@
-from django.test import TestCase
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from fameuxarte.admin_tools import EstimatedCountPaginator
+from jobs.models import Job
+from .models import ContactMessage
 
 # Create your tests here.
+
+MESSAGE = {'name': 'Ana', 'email': 'ana@example.com', 'subject': 'Commission', 'message': "Do you take commissions?"}
+
+
+@override_settings(CONTACT_INGEST_ASYNC=False)
+class ContactApiTests(TestCase):
+    def setUp(self):
+        cache.clear()  # Throttle history
+
+    def test_message_is_stored_and_staff_notified(self):
+        response = self.client.post('/api/contact/', MESSAGE)
+        self.assertEqual(response.status_code, 202)
+        message = ContactMessage.objects.get()
+        self.assertEqual(message.subject, 'Commission')
+        self.assertEqual(Job.objects.get(name='contact.notify_staff').args, [[message.pk]])
+
+    def test_honeypot_stores_nothing(self):
+        response = self.client.post('/api/contact/', dict(MESSAGE, website='http://spam.example'))
+        self.assertEqual(response.status_code, 202)
+        self.assertFalse(ContactMessage.objects.exists())
+
+    def test_invalid_message(self):
+        self.assertEqual(self.client.post('/api/contact/', dict(MESSAGE, email='nope')).status_code, 400)
+
+    def test_rate_limited_per_client(self):
+        for _ in range(5):
+            self.assertEqual(self.client.post('/api/contact/', MESSAGE).status_code, 202)
+        self.assertEqual(self.client.post('/api/contact/', MESSAGE).status_code, 429)
+
+
+@override_settings(STORAGES={
+    **settings.STORAGES, 'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+})  # No collectstatic manifest in tests
+class InboxAdminTests(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'pw'))
+        self.messages = [ContactMessage.objects.create(**MESSAGE) for _ in range(3)]
+
+    def test_changelist_estimates_its_size(self):
+        response = self.client.get('/admin/contact/contactmessage/')
+        self.assertIsInstance(response.context['cl'].paginator, EstimatedCountPaginator)
+        self.assertContains(response, 'Commission')
+
+    def test_mark_read(self):
+        response = self.client.post('/admin/contact/contactmessage/', {
+            'action': 'mark_read', '_selected_action': [message.pk for message in self.messages[:2]],
+        }, follow=True)
+        self.assertContains(response, '2 message(s) marked as read.')
+        self.assertEqual(ContactMessage.objects.filter(is_read=True).count(), 2)
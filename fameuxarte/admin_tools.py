@@ -0,0 +1,71 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.forms.models import BaseInlineFormSet
+from django.utils.functional import cached_property
+
+# Helpers for admin pages over large tables (products, reviews, orders, carts).
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Uses the planner's row estimate instead of COUNT(*) for an unfiltered
+    changelist of a big PostgreSQL table, where counting means reading the
+    whole table. Filtered lists, small tables and other databases are counted
+    as usual. Use it together with ``show_full_result_count = False``.
+    """
+
+    estimate_above = 100_000  # rows; below this the exact count is cheap enough
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        query = getattr(queryset, 'query', None)
+        if query is not None and not query.where and connections[queryset.db].vendor == 'postgresql':
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [queryset.model._meta.db_table])
+                row = cursor.fetchone()
+            if row and row[0] > self.estimate_above:
+                return row[0]
+        return super().count
+
+
+class LatestInlineFormSet(BaseInlineFormSet):
+    """Only the ``max_shown`` first rows (in the inline's ordering) of the parent's related objects."""
+
+    max_shown = 20
+
+    def get_queryset(self):
+        if not hasattr(self, '_latest'):
+            self._latest = super().get_queryset()[:self.max_shown]
+        return self._latest
+
+
+class LatestInline:
+    """
+    Read-only inline capped at ``max_shown`` rows, for relations that can grow
+    without bound (reviews of a product, comments of a post). Each row links to
+    its own change page; the full list is on the related model's changelist.
+    """
+
+    formset = LatestInlineFormSet
+    max_shown = 20
+    select_related = ()  # Relations shown in the rows, fetched in the same query
+    extra = 0
+    show_change_link = True
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related(*self.select_related)
+
+    def get_formset(self, request, obj=None, **kwargs):
+        formset = super().get_formset(request, obj, **kwargs)
+        formset.max_shown = self.max_shown
+        return formset
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,31 @@
+from django.http import HttpResponse
+from rest_framework.settings import api_settings
+
+# Async read-only endpoints for ASGI deployments.
+#
+# The DRF views hold a worker thread for as long as Postgres takes to answer; these
+# await the async ORM instead and then run the very same serializer over objects that
+# are already loaded, so the JSON is identical to the DRF endpoint's. Querysets passed
+# in must select_related/prefetch_related everything the serializer touches, otherwise
+# Django raises SynchronousOnlyOperation instead of quietly querying from the event loop.
+
+
+def render_json(data, status=200):
+    renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    return HttpResponse(renderer.render(data), status=status, content_type=renderer.media_type)
+
+
+def not_found(model):
+    return render_json({'detail': f'No {model._meta.object_name} matches the given query.'}, status=404)
+
+
+async def list_response(request, queryset, serializer_class):
+    objects = [obj async for obj in queryset]
+    return render_json(serializer_class(objects, many=True, context={'request': request}).data)
+
+
+async def detail_response(request, queryset, serializer_class, **lookup):
+    obj = await queryset.filter(**lookup).afirst()
+    if obj is None:
+        return not_found(queryset.model)
+    return render_json(serializer_class(obj, context={'request': request}).data)
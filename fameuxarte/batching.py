@@ -0,0 +1,105 @@
+import atexit
+import logging
+import queue
+import threading
+
+from django.db import DatabaseError, close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+
+class BatchWriter:
+    """
+    Buffers model instances and writes them with ``bulk_create`` from a
+    background thread, so a burst of submissions costs a handful of INSERTs
+    instead of one round trip per request.
+
+    ``prepare`` runs on the worker thread with the list of pending objects
+    just before they are written, and ``after_write`` runs with the saved
+    objects right after. Either may be ``None``.
+
+    If the INSERT of a batch fails, its objects are retried one at a time and
+    only the ones that still fail are dropped (and logged). Queued objects live
+    in memory until written: they are flushed at a normal interpreter exit,
+    but a killed process loses them, so keep the synchronous path for data
+    that must never be lost.
+    """
+
+    def __init__(self, model, batch_size=100, flush_interval=1.0, prepare=None, after_write=None, name=None):
+        self.model = model
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.prepare = prepare
+        self.after_write = after_write
+        self.name = name or f"{model._meta.label_lower}-writer"
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def submit(self, obj):
+        self._ensure_started()
+        self._queue.put(obj)
+
+    def flush(self):
+        """Write everything that is currently queued, on the calling thread."""
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        for start in range(0, len(batch), self.batch_size):
+            self.write(batch[start:start + self.batch_size])
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def _ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                if self._thread is None:
+                    atexit.register(self.flush)
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            # Collect whatever else arrives within the flush window, up to a full batch.
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get(timeout=self.flush_interval))
+                except queue.Empty:
+                    break
+            close_old_connections()
+            try:
+                self.write(batch)
+            except Exception:
+                logger.exception("%s failed to write a batch of %d objects", self.name, len(batch))
+            finally:
+                close_old_connections()
+
+    def write(self, batch):
+        """Prepare, insert and post-process ``batch`` right away on the calling thread."""
+        if not batch:
+            return
+        if self.prepare is not None:
+            self.prepare(batch)
+        try:
+            with transaction.atomic():  # A savepoint when called inside a transaction, so the retries can still run
+                saved = self.model.objects.bulk_create(batch, batch_size=self.batch_size)
+        except DatabaseError:
+            if len(batch) == 1:
+                raise
+            # One bad row (a constraint, a too-long value) must not take the rest of the batch with it
+            saved = []
+            for obj in batch:
+                try:
+                    with transaction.atomic():
+                        saved += self.model.objects.bulk_create([obj])
+                except DatabaseError:
+                    logger.exception("%s dropped an object of a batch of %d it could not save", self.name, len(batch))
+        if self.after_write is not None and saved:
+            self.after_write(saved)
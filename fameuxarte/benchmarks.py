@@ -0,0 +1,167 @@
+import gc
+import logging
+import platform
+import statistics
+import time
+import tracemalloc
+from contextlib import ExitStack
+
+import django
+from django.conf import settings
+from django.db import connection, connections
+from django.test import Client
+from django.utils import timezone
+
+# Endpoints exercised by `manage.py run_benchmarks`. "{product}", "{post}" etc. are
+# replaced with the pk of an existing row, so detail endpoints hit real data.
+ENDPOINTS = {
+    'product-list': '/api/shop/products/',
+    'product-detail': '/api/shop/products/{product}/',
+    'category-list': '/api/shop/categories/',
+    'review-list': '/api/shop/reviews/',
+    'post-list': '/api/blog/posts/',
+    'post-detail': '/api/blog/posts/{post}/',
+    'artist-list': '/api/artists/artists/',
+    'gallery-list': '/api/gallery/gallery/',
+    'about-api': '/about/api/about/',
+    'home-page': '/home/',
+    'about-page': '/about/',
+}
+
+
+def sample_ids():
+    from blog.models import Post
+    from shop.models import Product
+    return {
+        'product': Product.objects.order_by('pk').values_list('pk', flat=True).first() or 0,
+        'post': Post.objects.order_by('pk').values_list('pk', flat=True).first() or 0,
+    }
+
+
+class EndpointError(Exception):
+    """An endpoint answered with an error, so its timings would not mean anything."""
+
+
+def bench_host():
+    """A Host header ALLOWED_HOSTS accepts, so requests reach the views instead of a DisallowedHost 400."""
+    allowed = settings.ALLOWED_HOSTS or (['.localhost', '127.0.0.1', '[::1]'] if settings.DEBUG else [])
+    for host in allowed:
+        host = host.lstrip('.')
+        if host and host != '*':
+            return host
+    return 'testserver'  # The test client's default, accepted by '*'
+
+
+class QueryCounter:
+    """Database execute wrapper that only counts (unlike connection.queries, which is capped at 9000)."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def bench_endpoint(client, url, iterations, warmup=2):
+    """
+    Latency percentiles, query count and memory allocations for one URL.
+    Allocations are measured on a separate pass, because tracemalloc slows
+    every allocation down and would distort the timings.
+    """
+    status = None
+    for _ in range(max(warmup, 1)):
+        status = client.get(url).status_code
+        if not 200 <= status < 300:
+            raise EndpointError(f"{url} answered {status}")
+
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        client.get(url)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+
+    # Count queries on every alias, so reads routed to a replica are included
+    counter = QueryCounter()
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(counter))
+        client.get(url)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        client.get(url)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'url': url,
+        'status': status,
+        'iterations': iterations,
+        'mean_ms': round(statistics.mean(timings), 3),
+        'p50_ms': round(percentile(timings, 50), 3),
+        'p95_ms': round(percentile(timings, 95), 3),
+        'p99_ms': round(percentile(timings, 99), 3),
+        'queries': counter.count,
+        'retained_kb': round((after - before) / 1024, 1),
+        'peak_kb': round((peak - before) / 1024, 1),
+    }
+
+
+def run(names=None, iterations=50):
+    ids = sample_ids()
+    client = Client(HTTP_HOST=bench_host())
+    results = {}
+    request_logger = logging.getLogger('django.request')
+    level = request_logger.level
+    request_logger.setLevel(logging.ERROR)  # Don't log a "Not Found" line per iteration
+    try:
+        for name, pattern in ENDPOINTS.items():
+            if names and name not in names:
+                continue
+            results[name] = bench_endpoint(client, pattern.format(**ids), iterations)
+    finally:
+        request_logger.setLevel(level)
+    return {
+        'meta': {
+            'created_at': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'iterations': iterations,
+        },
+        'endpoints': results,
+    }
+
+
+def compare(current, baseline, threshold=10.0):
+    """
+    Rows of (endpoint, metric, baseline, current, change %) and whether any
+    latency or query count got worse by more than ``threshold`` percent.
+    """
+    rows = []
+    regressed = False
+    for name, result in current['endpoints'].items():
+        old = baseline.get('endpoints', {}).get(name)
+        if not old:
+            continue
+        for metric in ('p50_ms', 'p95_ms', 'p99_ms', 'queries', 'peak_kb'):
+            if old.get(metric) in (None, 0) or result.get(metric) is None:
+                continue
+            change = (result[metric] - old[metric]) / old[metric] * 100
+            rows.append((name, metric, old[metric], result[metric], change))
+            if metric != 'peak_kb' and change > threshold:
+                regressed = True
+    return rows, regressed
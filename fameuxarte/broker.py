@@ -0,0 +1,184 @@
+import asyncio
+import json
+import logging
+import threading
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+try:
+    import redis
+except ImportError:  # Optional: only needed by RedisBackend
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# In-process publish/subscribe for live updates (see shop/live.py).
+#
+# Publishers call ``publish(channel, message)`` from ordinary sync code such as
+# model signals. The backend carries each message to every process once;
+# the broker in each process then hands it to that process's subscribers,
+# so a thousand clients watching a product cost one delivery per process plus a
+# queue put each. LocalBackend only reaches the current process; with several
+# web/worker processes set LIVE_BROKER_BACKEND to RedisBackend.
+
+
+class Subscription:
+    """
+    Messages on one channel, optionally only those whose ``key`` is in ``keys``.
+    Read it with ``await get()`` on the event loop it was created on.
+    ``closed`` becomes True when the subscriber fell too far behind.
+    """
+
+    def __init__(self, broker, channel, keys=None, max_pending=100):
+        self.broker = broker
+        self.channel = channel
+        self.keys = frozenset(keys) if keys else None
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(max_pending)
+        self.closed = False
+
+    def put(self, message):
+        """Runs on self.loop."""
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:  # A slow client: drop it, it reconnects and starts from fresh values
+            self.close()
+
+    async def get(self, timeout=None):
+        """The next message, or None after ``timeout`` seconds."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self.closed = True
+        self.broker.unsubscribe(self)
+
+
+class Broker:
+    def __init__(self, backend_class):
+        self.backend = backend_class(self)
+        self.lock = threading.Lock()
+        self.channels = {}  # channel -> {'all': set of subscriptions, 'keys': {key: set}}
+
+    def publish(self, channel, message):
+        """Send ``message`` (a JSON-serializable dict with a "key") to every process."""
+        self.backend.publish(channel, message)
+
+    def subscribe(self, channel, keys=None, max_pending=100):
+        """Must be called from a running event loop."""
+        subscription = Subscription(self, channel, keys, max_pending)
+        with self.lock:
+            listeners = self.channels.setdefault(channel, {'all': set(), 'keys': {}})
+            if subscription.keys is None:
+                listeners['all'].add(subscription)
+            for key in subscription.keys or ():
+                listeners['keys'].setdefault(key, set()).add(subscription)
+        self.backend.listen(channel)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            listeners = self.channels.get(subscription.channel)
+            if listeners is None:
+                return
+            listeners['all'].discard(subscription)
+            for key in subscription.keys or ():
+                watchers = listeners['keys'].get(key)
+                if watchers is not None:
+                    watchers.discard(subscription)
+                    if not watchers:
+                        del listeners['keys'][key]
+
+    def deliver(self, channel, message):
+        """Fan a message out to this process's subscribers; called by the backend from any thread."""
+        with self.lock:
+            listeners = self.channels.get(channel)
+            if listeners is None:
+                return
+            targets = listeners['all'] | listeners['keys'].get(message.get('key'), set())
+        by_loop = {}
+        for subscription in targets:
+            by_loop.setdefault(subscription.loop, []).append(subscription)
+        for loop, subscriptions in by_loop.items():  # One wake-up per event loop, not per subscriber
+            try:
+                loop.call_soon_threadsafe(put_all, subscriptions, message)
+            except RuntimeError:  # Loop already closed
+                for subscription in subscriptions:
+                    self.unsubscribe(subscription)
+
+
+def put_all(subscriptions, message):
+    for subscription in subscriptions:
+        subscription.put(message)
+
+
+class LocalBackend:
+    """Delivers within the current process only (development, or a single ASGI process doing all writes)."""
+
+    def __init__(self, broker):
+        self.broker = broker
+
+    def publish(self, channel, message):
+        self.broker.deliver(channel, message)
+
+    def listen(self, channel):
+        pass
+
+
+class RedisBackend:
+    """
+    Redis pub/sub between processes (needs `pip install redis`). Each process
+    keeps one listener thread and connection for all of its subscribers.
+    LIVE_BROKER_REDIS_URL picks the server.
+    """
+
+    def __init__(self, broker):
+        if redis is None:
+            raise ImproperlyConfigured("RedisBackend needs the redis package (`pip install redis`).")
+        self.broker = broker
+        self.client = redis.Redis.from_url(settings.LIVE_BROKER_REDIS_URL)
+        self.pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        self.channels = set()
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def publish(self, channel, message):
+        self.client.publish(channel, json.dumps(message))
+
+    def listen(self, channel):
+        with self.lock:
+            if channel not in self.channels:
+                self.pubsub.subscribe(channel)
+                self.channels.add(channel)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name='live-broker-redis', daemon=True)
+                self.thread.start()
+
+    def run(self):
+        while True:
+            try:
+                for item in self.pubsub.listen():
+                    if item['type'] == 'message':
+                        self.broker.deliver(item['channel'].decode(), json.loads(item['data']))
+            except redis.RedisError:
+                logger.exception("Live broker lost its Redis connection, reconnecting")
+                threading.Event().wait(1)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = Broker(import_string(settings.LIVE_BROKER_BACKEND))
+    return _broker
@@ -0,0 +1,92 @@
+import statistics
+import time
+
+from django.core import signals
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure per-request database overhead with fresh, persistent and pooled connections. "
+        "Point it at a local Postgres, e.g. DB_HOST=localhost DB_SSLMODE=disable DB_POOL=none."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help="Simulated requests per mode.")
+        parser.add_argument('--queries', type=int, default=3, help="Queries issued by each simulated request.")
+        parser.add_argument('--database', default='default')
+        parser.add_argument(
+            '--modes', default='fresh,persistent,pool',
+            help="Comma separated subset of fresh, persistent and pool.",
+        )
+
+    def handle(self, *args, **options):
+        alias = options['database']
+        connection = connections[alias]
+        if connection.vendor != 'postgresql':
+            raise CommandError(f"'{alias}' is a {connection.vendor} database; this benchmark needs Postgres.")
+
+        results = {}
+        for mode in options['modes'].split(','):
+            timings = self.run_mode(alias, mode.strip(), options['requests'], options['queries'])
+            if timings:
+                results[mode] = timings
+
+        baseline = statistics.mean(results['fresh']) if 'fresh' in results else None
+        self.stdout.write(f"{'mode':<12}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'saved ms':>10}")
+        for mode, timings in results.items():
+            timings.sort()
+            mean = statistics.mean(timings)
+            p95 = timings[int(len(timings) * 0.95) - 1]
+            saved = f"{baseline - mean:10.2f}" if baseline is not None else f"{'-':>10}"
+            self.stdout.write(f"{mode:<12}{mean:10.2f}{statistics.median(timings):10.2f}{p95:10.2f}{saved}")
+
+    def run_mode(self, alias, mode, requests, queries):
+        connection = connections[alias]
+        connection.close()
+        settings_dict = connection.settings_dict
+        original = (settings_dict['CONN_MAX_AGE'], settings_dict['CONN_HEALTH_CHECKS'], settings_dict['OPTIONS'].get('pool'))
+
+        if mode == 'fresh':
+            settings_dict['CONN_MAX_AGE'] = 0
+            settings_dict['OPTIONS'].pop('pool', None)
+        elif mode == 'persistent':
+            settings_dict['CONN_MAX_AGE'] = None
+            settings_dict['CONN_HEALTH_CHECKS'] = True
+            settings_dict['OPTIONS'].pop('pool', None)
+        elif mode == 'pool':
+            try:
+                import psycopg_pool  # noqa: F401
+            except ImportError:
+                self.stderr.write("Skipping pool mode: psycopg_pool is not installed.")
+                return None
+            settings_dict['CONN_MAX_AGE'] = 0
+            settings_dict['CONN_HEALTH_CHECKS'] = True
+            settings_dict['OPTIONS'].setdefault('pool', {'min_size': 1, 'max_size': 4})
+        else:
+            raise CommandError(f"Unknown mode '{mode}'.")
+
+        timings = []
+        try:
+            for _ in range(requests):
+                # The same signals Django sends around every real request decide whether
+                # the connection is closed, reused or handed back to the pool.
+                start = time.perf_counter()
+                signals.request_started.send(sender=self.__class__)
+                with connection.cursor() as cursor:
+                    for _ in range(queries):
+                        cursor.execute('SELECT 1')
+                        cursor.fetchone()
+                signals.request_finished.send(sender=self.__class__)
+                timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            connection.close()
+            if mode == 'pool':
+                connection.close_pool()
+            settings_dict['CONN_MAX_AGE'], settings_dict['CONN_HEALTH_CHECKS'] = original[:2]
+            if original[2] is None:
+                settings_dict['OPTIONS'].pop('pool', None)
+            else:
+                settings_dict['OPTIONS']['pool'] = original[2]
+        return timings
@@ -0,0 +1,74 @@
+import time
+from datetime import timedelta
+from decimal import Decimal
+from io import BytesIO
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from fameuxarte.parsers import FastJSONParser
+from fameuxarte.renderers import FastJSONRenderer, orjson
+from gallery.models import GalleryImage
+from gallery.serializers import GalleryImageSerializer
+from shop.models import Category, Product
+from shop.serializers import ProductSerializer
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+class Command(BaseCommand):
+    help = "Compare DRF's JSON renderer/parser with the orjson-backed ones on large list payloads."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--items', type=int, default=10000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            raise CommandError("orjson is not installed, so FastJSONRenderer falls back to DRF's renderer.")
+        n = options['items']
+        now = timezone.now()
+        category = Category(pk=1, name='Oil paintings', slug='oil-paintings', updated_at=now)
+        products = [
+            Product(pk=i, name=f'Nocturne — étude n°{i}', slug=f'nocturne-{i}', description='Oil on linen, 60×80 cm',
+                    price=Decimal(i % 5000) + Decimal('0.99'), category=category, stock=i % 3, available=bool(i % 7),
+                    created_at=now - timedelta(seconds=i, microseconds=i), updated_at=now)
+            for i in range(1, n + 1)
+        ]
+        gallery = [
+            GalleryImage(pk=i, title=f'Study {i}', image=f'gallery/study-{i}.jpg', description='Charcoal',
+                         uploaded_at=now - timedelta(minutes=i), updated_at=now)
+            for i in range(1, n + 1)
+        ]
+        payloads = {
+            'products (serialized)': ProductSerializer(products, many=True).data,
+            'gallery (serialized)': GalleryImageSerializer(gallery, many=True).data,
+            # Raw values() rows make the encoder itself handle Decimal and datetime objects
+            'products (raw values)': [
+                {'id': p.pk, 'name': p.name, 'price': p.price, 'created_at': p.created_at, 'available': p.available}
+                for p in products
+            ],
+        }
+
+        self.stdout.write(f"{'payload':<24}{'bytes':>10}{'drf ms':>9}{'fast ms':>9}{'x':>6}"
+                          f"{'parse drf':>11}{'parse fast':>11}{'x':>6}  identical")
+        for name, data in payloads.items():
+            drf, fast = JSONRenderer(), FastJSONRenderer()
+            expected, actual = drf.render(data), fast.render(data)
+            render_drf = best_of(options['repeat'], lambda: drf.render(data))
+            render_fast = best_of(options['repeat'], lambda: fast.render(data))
+            parse_drf = best_of(options['repeat'], lambda: JSONParser().parse(BytesIO(expected)))
+            parse_fast = best_of(options['repeat'], lambda: FastJSONParser().parse(BytesIO(expected)))
+            self.stdout.write(
+                f"{name:<24}{len(expected):>10}{render_drf:9.1f}{render_fast:9.1f}{render_drf / render_fast:6.1f}"
+                f"{parse_drf:11.1f}{parse_fast:11.1f}{parse_drf / parse_fast:6.1f}  {expected == actual}"
+            )
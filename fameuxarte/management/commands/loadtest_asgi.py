@@ -0,0 +1,88 @@
+import asyncio
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+
+from fameuxarte.asgi import application
+
+
+async def asgi_get(path, query_string=b''):
+    """Send one GET through the ASGI application in-process and return (status, body)."""
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'http',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': query_string,
+        'root_path': '',
+        'headers': [(b'host', b'localhost')],
+        'client': ('127.0.0.1', 50000),
+        'server': ('localhost', 80),
+    }
+    done = asyncio.Event()
+    sent_request = False
+    status = None
+    body = []
+
+    async def receive():
+        nonlocal sent_request
+        if not sent_request:
+            sent_request = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await done.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        nonlocal status
+        if message['type'] == 'http.response.start':
+            status = message['status']
+        elif message['type'] == 'http.response.body':
+            body.append(message.get('body', b''))
+            if not message.get('more_body'):
+                done.set()
+
+    await application(scope, receive, send)
+    return status, b''.join(body)
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive endpoints through the ASGI application in-process with many concurrent clients "
+        "and report throughput, e.g. to compare /api/shop/products/ with /api/shop/async/products/."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+', help="URL paths to load test, one after the other.")
+        parser.add_argument('--concurrency', type=int, default=50)
+        parser.add_argument('--requests', type=int, default=1000, help="Requests per path.")
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'path':<40}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}")
+        for path in options['paths']:
+            rate, timings, errors = asyncio.run(self.run_path(path, options['concurrency'], options['requests']))
+            timings.sort()
+            p95 = timings[max(int(len(timings) * 0.95) - 1, 0)]
+            self.stdout.write(f"{path:<40}{rate:10.1f}{statistics.median(timings):10.2f}{p95:10.2f}{errors:8d}")
+
+    async def run_path(self, path, concurrency, total):
+        await asgi_get(path)  # Warm up URL resolution, imports and connections
+        remaining = iter(range(total))
+        timings = []
+        errors = 0
+
+        async def client():
+            nonlocal errors
+            for _ in remaining:
+                start = time.perf_counter()
+                status, _body = await asgi_get(path)
+                timings.append((time.perf_counter() - start) * 1000)
+                if status != 200:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        return total / (time.perf_counter() - start), timings, errors
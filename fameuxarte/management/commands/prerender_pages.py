@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from fameuxarte.prerender import build
+
+
+class Command(BaseCommand):
+    help = "Render the cacheable template pages to content-hashed static HTML files."
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*', help="URL paths to render (defaults to PRERENDER_PAGES).")
+        parser.add_argument('--root', help="Output directory (defaults to PRERENDER_ROOT).")
+        parser.add_argument('--prune', action='store_true', help="Delete rendered files no longer in the manifest.")
+
+    def handle(self, *args, **options):
+        manifest, skipped = build(root=options['root'], paths=options['paths'] or None, prune=options['prune'])
+        for path, filename in manifest.items():
+            self.stdout.write(f"{path} -> {filename}")
+        for path, reason in skipped.items():
+            self.stdout.write(self.style.WARNING(f"skipped {path}: {reason}"))
+        self.stdout.write(self.style.SUCCESS(f"{len(manifest)} page(s) pre-rendered."))
@@ -0,0 +1,52 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from fameuxarte import benchmarks
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the main API and template endpoints in-process: p50/p95/p99 latency, "
+        "query count and allocations. Seed data first with `manage.py seed_catalog`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('endpoints', nargs='*', help=f"Subset of: {', '.join(benchmarks.ENDPOINTS)}.")
+        parser.add_argument('--iterations', type=int, default=50)
+        parser.add_argument('--output', help="Write the results to this JSON file.")
+        parser.add_argument('--baseline', help="Compare against a JSON file from an earlier run.")
+        parser.add_argument('--threshold', type=float, default=10.0,
+                            help="Percent slowdown (or extra queries) that counts as a regression.")
+
+    def handle(self, *args, **options):
+        unknown = set(options['endpoints']) - set(benchmarks.ENDPOINTS)
+        if unknown:
+            raise CommandError(f"Unknown endpoint(s): {', '.join(sorted(unknown))}")
+
+        try:
+            results = benchmarks.run(options['endpoints'], options['iterations'])
+        except benchmarks.EndpointError as e:  # Never report (or save as a baseline) an error page's timings
+            raise CommandError(f"{e}; fix the endpoint or seed data with `manage.py seed_catalog` first.")
+
+        self.stdout.write(f"{'endpoint':<16}{'status':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+                          f"{'queries':>9}{'peak KB':>10}")
+        for name, r in results['endpoints'].items():
+            self.stdout.write(f"{name:<16}{r['status']:>7}{r['p50_ms']:10.2f}{r['p95_ms']:10.2f}{r['p99_ms']:10.2f}"
+                              f"{r['queries']:9d}{r['peak_kb']:10.1f}")
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+        if options['baseline']:
+            with open(options['baseline'], encoding='utf-8') as f:
+                baseline = json.load(f)
+            rows, regressed = benchmarks.compare(results, baseline, options['threshold'])
+            self.stdout.write(f"\n{'endpoint':<16}{'metric':<9}{'baseline':>10}{'current':>10}{'change':>9}")
+            for name, metric, old, new, change in rows:
+                line = f"{name:<16}{metric:<9}{old:10.2f}{new:10.2f}{change:+8.1f}%"
+                self.stdout.write(self.style.ERROR(line) if change > options['threshold'] else line)
+            if regressed:
+                raise CommandError(f"Regression of more than {options['threshold']}% against {options['baseline']}.")
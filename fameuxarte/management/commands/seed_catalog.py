@@ -0,0 +1,147 @@
+import random
+import time
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from artists.models import Artist
+from blog.models import Comment, Post, Tag
+from cart.models import Cart, CartItem
+from checkout.models import Order, OrderItem
+from gallery.models import GalleryImage
+from shop.models import Category, Product, Review
+
+WORDS = (
+    'azure crimson golden silent morning river garden harbour portrait still life abstract '
+    'nocturne meadow city rain light shadow bloom ember tide horizon echo velvet marble '
+    'saffron indigo willow lantern orchard festival dancer mountain window').split()
+MEDIA = ['Oil on canvas', 'Acrylic', 'Watercolour', 'Charcoal', 'Mixed media', 'Ink', 'Gouache']
+CITIES = ['Mumbai', 'Paris', 'Chennai', 'Lisbon', 'Delhi', 'Berlin', 'Kochi', 'Madrid']
+
+# Rows per model at --scale 1. --scale 100 gives about 5 million rows in total.
+BASE_COUNTS = {
+    'users': 500,
+    'categories': 20,
+    'products': 10000,
+    'reviews': 15000,
+    'artists': 500,
+    'gallery': 5000,
+    'tags': 100,
+    'posts': 1000,
+    'comments': 5000,
+    'orders': 5000,
+    'carts': 2000,
+}
+
+
+class Command(BaseCommand):
+    help = "Bulk-create a large, realistic catalog (products, reviews, posts, orders, ...) for load testing."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=float, default=1.0, help="Multiplier for the default row counts.")
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--seed', type=int, default=42, help="Random seed, for reproducible data sets.")
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.run = timezone.now().strftime('%Y%m%d%H%M%S')  # Keeps slugs unique across runs
+        counts = {name: max(1, int(count * options['scale'])) for name, count in BASE_COUNTS.items()}
+        started = time.monotonic()
+
+        user_ids = self.create('users', User, counts['users'], lambda i: User(
+            username=f'collector-{self.run}-{i}', email=f'collector{i}@example.com', password='!',
+        ))
+        category_ids = self.create('categories', Category, counts['categories'], lambda i: Category(
+            name=f'{self.title(2)} {self.run}-{i}', slug=f'category-{self.run}-{i}',
+        ))
+        product_ids = self.create('products', Product, counts['products'], lambda i: Product(
+            name=self.title(3), slug=f'artwork-{self.run}-{i}', description=self.sentence(30),
+            price=Decimal(self.rng.randrange(500, 500000)) / 100, category_id=self.rng.choice(category_ids),
+            image=f'products/artwork-{i % 97}.jpg', stock=self.rng.choice([0, 1, 1, 1, 2, 5]),
+            available=self.rng.random() > 0.1,
+        ))
+        self.create('reviews', Review, counts['reviews'], lambda i: Review(
+            product_id=self.rng.choice(product_ids), author_id=self.rng.choice(user_ids),
+            content=self.sentence(20), rating=self.rng.choice([3, 4, 4, 5, 5, 5]),
+        ))
+        self.create('artists', Artist, counts['artists'], lambda i: Artist(
+            name=self.title(2), bio=self.sentence(60), image=f'artists/artist-{i % 53}.jpg',
+            website=f'https://artist{i}.example.com' if i % 3 else None,
+        ))
+        self.create('gallery', GalleryImage, counts['gallery'], lambda i: GalleryImage(
+            title=self.title(3)[:100], image=f'gallery/gallery-{i % 89}.jpg',
+            description=f'{self.rng.choice(MEDIA)}, {self.rng.choice(CITIES)}',
+        ))
+        tag_ids = self.create('tags', Tag, counts['tags'], lambda i: Tag(
+            name=f'{self.rng.choice(WORDS)}-{self.run}-{i}', slug=f'tag-{self.run}-{i}',
+        ))
+        post_ids = self.create('posts', Post, counts['posts'], lambda i: Post(
+            title=self.title(6), slug=f'post-{self.run}-{i}', author_id=self.rng.choice(user_ids),
+            content=self.sentence(400), image=f'image/post-{i % 31}.jpg' if i % 2 else None,
+        ))
+        self.create('post tags', Post.tags.through, len(post_ids), lambda i: Post.tags.through(
+            post_id=post_ids[i], tag_id=self.rng.choice(tag_ids),
+        ), return_ids=False)
+        self.create('comments', Comment, counts['comments'], lambda i: Comment(
+            post_id=self.rng.choice(post_ids), author=self.title(2), email=f'reader{i}@example.com',
+            body=self.sentence(25), approved=self.rng.random() > 0.2,
+        ), return_ids=False)
+        self.create_orders(counts['orders'], user_ids, product_ids)
+        self.create_carts(counts['carts'], user_ids, product_ids)
+
+        self.stdout.write(self.style.SUCCESS(f"Done in {time.monotonic() - started:.1f}s."))
+
+    def create(self, label, model, count, build, return_ids=True):
+        """bulk_create ``count`` rows in batches and return the new primary keys."""
+        started = time.monotonic()
+        ids = []
+        for start in range(0, count, self.batch_size):
+            batch = [build(i) for i in range(start, min(start + self.batch_size, count))]
+            with transaction.atomic():
+                created = model.objects.bulk_create(batch, batch_size=self.batch_size)
+            if return_ids:
+                ids.extend(obj.pk for obj in created)
+        if return_ids and ids and ids[0] is None:
+            # Backends that cannot return ids from bulk inserts: read back the newest rows
+            ids = list(model.objects.order_by('-pk').values_list('pk', flat=True)[:count])
+        self.stdout.write(f"{label:<12}{count:>10} rows  {time.monotonic() - started:6.1f}s")
+        return ids
+
+    def create_orders(self, count, user_ids, product_ids):
+        order_ids = self.create('orders', Order, count, lambda i: Order(
+            user_id=self.rng.choice(user_ids), first_name=self.rng.choice(WORDS).title(),
+            last_name=self.rng.choice(WORDS).title(), email=f'buyer{i}@example.com',
+            address=f'{self.rng.randrange(1, 300)} {self.title(2)} Road', city=self.rng.choice(CITIES),
+            postal_code=str(self.rng.randrange(100000, 999999)), paid=self.rng.random() > 0.15,
+            total_price=0, shipping_cost=Decimal('150.00'),
+        ))
+        prices = dict(
+            Product.objects.filter(pk__gte=min(product_ids)).values_list('pk', 'price').iterator(chunk_size=10000)
+        )
+        lines = [(order_id, product_id) for order_id in order_ids
+                 for product_id in self.rng.sample(product_ids, min(len(product_ids), self.rng.randint(1, 4)))]
+        # bulk_create skips OrderItem.save(), so the price snapshot is filled in here
+        self.create('order items', OrderItem, len(lines), lambda i: OrderItem(
+            order_id=lines[i][0], product_id=lines[i][1], price=prices[lines[i][1]], quantity=self.rng.randint(1, 2),
+        ), return_ids=False)
+
+    def create_carts(self, count, user_ids, product_ids):
+        cart_ids = self.create('carts', Cart, count, lambda i: Cart(
+            user_id=self.rng.choice(user_ids) if i % 2 else None,
+            session_key=None if i % 2 else f'{self.run}{i:020d}'[:40],
+        ))
+        lines = [(cart_id, product_id) for cart_id in cart_ids
+                 for product_id in self.rng.sample(product_ids, min(len(product_ids), self.rng.randint(1, 3)))]
+        self.create('cart items', CartItem, len(lines), lambda i: CartItem(
+            cart_id=lines[i][0], product_id=lines[i][1], quantity=1,
+        ), return_ids=False)
+
+    def title(self, words):
+        return ' '.join(self.rng.choice(WORDS) for _ in range(words)).title()
+
+    def sentence(self, words):
+        return ' '.join(self.rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import logging
+import os
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.http import FileResponse
+from django.template import TemplateDoesNotExist
+from django.test import RequestFactory
+from django.urls import Resolver404, resolve
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def page_filename(path, content):
+    """``/about/`` with content hash ``ab12..`` becomes ``about.ab12cd34ef56.html``."""
+    name = path.strip('/').replace('/', '-') or 'index'
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    return f'{name}.{digest}.html'
+
+
+def render_page(path):
+    """Render ``path`` as an anonymous visitor would see it, without going through the middleware."""
+    request = RequestFactory().get(path)
+    request.user = AnonymousUser()
+    match = resolve(path)
+    response = match.func(request, *match.args, **match.kwargs)
+    if hasattr(response, 'render'):
+        response.render()
+    if response.status_code != 200:
+        raise ValueError(f'{path} returned HTTP {response.status_code}')
+    return response.content
+
+
+def build(root=None, paths=None, prune=False):
+    """
+    Render every page in PRERENDER_PAGES to ``root`` under a content-hashed
+    filename and write a manifest mapping URL path to file. Files are only
+    rewritten when their content changed, so unchanged pages keep their name
+    (and their CDN cache entries).
+    """
+    root = root or settings.PRERENDER_ROOT
+    paths = paths or settings.PRERENDER_PAGES
+    os.makedirs(root, exist_ok=True)
+    manifest = {}
+    skipped = {}
+
+    for path in paths:
+        try:
+            content = render_page(path)
+        except (Resolver404, TemplateDoesNotExist, ValueError) as e:
+            if isinstance(e, Resolver404):
+                reason = 'no such URL'
+            elif isinstance(e, TemplateDoesNotExist):
+                reason = f'template {e} does not exist'
+            else:
+                reason = str(e)
+            logger.warning('Not pre-rendering %s: %s', path, reason)
+            skipped[path] = reason
+            continue
+        filename = page_filename(path, content)
+        target = os.path.join(root, filename)
+        if not os.path.exists(target):
+            with open(target + '.tmp', 'wb') as f:
+                f.write(content)
+            os.replace(target + '.tmp', target)
+        manifest[path] = filename
+
+    with open(os.path.join(root, MANIFEST_NAME + '.tmp'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(os.path.join(root, MANIFEST_NAME + '.tmp'), os.path.join(root, MANIFEST_NAME))
+
+    if prune:
+        keep = set(manifest.values()) | {MANIFEST_NAME}
+        for filename in os.listdir(root):
+            if filename.endswith('.html') and filename not in keep:
+                os.remove(os.path.join(root, filename))
+    return manifest, skipped
+
+
+class PrerenderedPageMiddleware:
+    """
+    Answers anonymous GETs for pre-rendered pages straight from disk.
+    Does nothing until ``manage.py prerender_pages`` has written a manifest.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.manifest_path = os.path.join(settings.PRERENDER_ROOT, MANIFEST_NAME)
+        self._manifest = {}
+        self._mtime = None
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def manifest(self):
+        try:
+            mtime = os.path.getmtime(self.manifest_path)
+        except OSError:
+            return {}
+        if mtime != self._mtime:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                self._manifest = json.load(f)
+            self._mtime = mtime
+        return self._manifest
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.serve(request) or self.get_response(request)
+
+    async def __acall__(self, request):
+        return self.serve(request) or await self.get_response(request)
+
+    def serve(self, request):
+        if request.method in ('GET', 'HEAD') and not request.GET and not request.COOKIES.get(settings.SESSION_COOKIE_NAME):
+            filename = self.manifest().get(request.path_info)
+            if filename:
+                path = os.path.join(settings.PRERENDER_ROOT, filename)
+                if os.path.exists(path):
+                    response = FileResponse(open(path, 'rb'), content_type='text/html; charset=utf-8')
+                    response['Cache-Control'] = f'public, max-age={settings.PRERENDER_MAX_AGE}'
+                    return response
+        return None
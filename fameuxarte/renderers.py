@@ -0,0 +1,66 @@
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # Optional: without it everything falls back to DRF's json.dumps path
+    orjson = None
+
+
+_drf_default = JSONEncoder().default
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    orjson-backed drop-in for DRF's JSONRenderer.
+
+    The output is byte-for-byte what JSONRenderer produces with the default
+    COMPACT_JSON / UNICODE_JSON settings: datetimes, Decimals, lazy strings and
+    anything else orjson does not know natively go through DRF's own encoder,
+    and U+2028/U+2029 are escaped the same way. Indented output, non-default
+    settings and values orjson cannot encode (e.g. integers wider than 64 bits)
+    use JSONRenderer itself. Known differences, both limited to floats: very
+    large or small values are written as 1e16 rather than 1e+16 (same number),
+    and NaN/Infinity come out as null instead of the non-standard tokens.
+    """
+
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if (orjson is None or not self.compact or self.ensure_ascii
+                or self.get_indent(accepted_media_type, renderer_context or {})):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=_drf_default, option=self.options)
+        except (orjson.JSONEncodeError, TypeError):
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same escaping as JSONRenderer, so the result is safe inside <script> tags
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+def dumps(data):
+    """Encode one value the way FastJSONRenderer would."""
+    return FastJSONRenderer().render(data)
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Newline-delimited JSON, one list item per line (``?format=ndjson`` or
+    ``Accept: application/x-ndjson``). List views that use NDJSONStreamingMixin
+    stream rows instead of building the whole list first.
+    """
+
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if not isinstance(data, list):
+            data = [data]
+        return b''.join(dumps(item) + b'\n' for item in data)
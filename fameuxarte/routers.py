@@ -0,0 +1,133 @@
+import random
+import time
+from contextvars import ContextVar
+
+import jwt
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+# Set by ReplicaPinningMiddleware for the duration of a request that must read from the primary.
+_pinned = ContextVar('pinned_to_primary', default=False)
+
+
+def is_pinned():
+    return _pinned.get()
+
+
+def pin_key(user_id):
+    return f'replica-pin:user:{user_id}'
+
+
+def bearer_user_id(request):
+    """
+    The user id claimed by the request's JWT, read without verifying it: it
+    only decides which database serves the reads, the view still authenticates.
+    """
+    header = request.META.get(jwt_settings.AUTH_HEADER_NAME, '').split()
+    if len(header) != 2 or header[0] not in jwt_settings.AUTH_HEADER_TYPES:
+        return None
+    try:
+        return jwt.decode(header[1], options={'verify_signature': False}).get(jwt_settings.USER_ID_CLAIM)
+    except jwt.InvalidTokenError:
+        return None
+
+
+class ReplicaRouter:
+    """
+    Sends reads of the catalog and content apps (REPLICA_APPS) to one of the
+    DATABASE_REPLICAS aliases, picked at random per query. Everything else,
+    every write and every read made while pinned to the primary goes to
+    'default'. All aliases are the same database, so relations are allowed
+    across them and migrations only run on the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not settings.DATABASE_REPLICAS or is_pinned():
+            return None
+        if connections['default'].in_atomic_block:
+            return None  # Reads inside a transaction on the primary must see its writes
+        if model._meta.app_label not in settings.REPLICA_APPS:
+            return None
+        instance = hints.get('instance')
+        if instance is not None and instance._state.db:
+            return instance._state.db  # Keep following a related object on the db it came from
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in settings.DATABASE_REPLICAS
+
+
+class ReplicaPinningMiddleware:
+    """
+    Read-your-writes for the replica router.
+
+    Unsafe requests and cart/checkout pages always use the primary. After a
+    write, the client's next requests also read from the primary until the
+    replicas have caught up (REPLICA_PIN_SECONDS): browsers are recognised by a
+    short-lived cookie, API clients by the user id in their JWT. Works under WSGI and ASGI: the pin is a context
+    variable, which sync views run through sync_to_async inherit.
+    """
+
+    sync_capable = True
+    async_capable = True
+    cookie_name = 'pin_primary'
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = _pinned.set(True) if self.should_pin(request) else None
+        try:
+            response = self.get_response(request)
+        finally:
+            if token is not None:
+                _pinned.reset(token)
+        return self.remember_write(request, response)
+
+    async def __acall__(self, request):
+        token = _pinned.set(True) if self.should_pin(request) else None
+        try:
+            response = await self.get_response(request)
+        finally:
+            if token is not None:
+                _pinned.reset(token)
+        return self.remember_write(request, response)
+
+    def remember_write(self, request, response):
+        if request.method not in ('GET', 'HEAD', 'OPTIONS') and response.status_code < 400:
+            response.set_cookie(
+                self.cookie_name, str(int(time.time()) + settings.REPLICA_PIN_SECONDS),
+                max_age=settings.REPLICA_PIN_SECONDS, httponly=True, samesite='Lax',
+            )
+            user = getattr(request, 'user', None)  # Set by DRF's authentication, JWT included
+            if settings.DATABASE_REPLICAS and user is not None and user.is_authenticated:
+                cache.set(pin_key(user.pk), True, settings.REPLICA_PIN_SECONDS)
+        return response
+
+    def should_pin(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return False
+        if request.method not in ('GET', 'HEAD', 'OPTIONS'):
+            return True
+        if any(request.path_info.startswith(prefix) for prefix in settings.PRIMARY_ONLY_PATHS):
+            return True
+        try:
+            if int(request.COOKIES.get(self.cookie_name, 0)) > time.time():
+                return True
+        except ValueError:
+            pass
+        user_id = bearer_user_id(request)
+        return user_id is not None and cache.get(pin_key(user_id), False)
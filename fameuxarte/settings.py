@@ -51,6 +51,7 @@ ALLOWED_HOSTS = []
 
 INSTALLED_APPS = [
     'corsheaders',   
+    'fameuxarte',  # Project-wide management commands
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -67,6 +68,13 @@ INSTALLED_APPS = [
     'checkout',
     'account',
     'about',
+    'sitemap',
+    'mediastore',
+    'uploads',
+    'jobs',
+    'imagery',  # Colour search needs `pip install numpy`
+    'recommendations',
+    'slugs',
     'rest_framework',
     'rest_framework_simplejwt',
     'django_extensions',
@@ -74,13 +82,42 @@ INSTALLED_APPS = [
 ]
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # Trusts token claims on reads and caches user rows (see account/authentication.py)
+        'account.authentication.CachedJWTAuthentication',
     ),
+    # orjson-backed JSON (same bytes as DRF's renderer, see fameuxarte/renderers.py); needs `pip install orjson`
+    'DEFAULT_RENDERER_CLASSES': (
+        'fameuxarte.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'fameuxarte.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+    'DEFAULT_THROTTLE_RATES': {
+        'contact': '5/hour',  # Per user or client IP, counted in the default cache
+        'uploads': '30/hour',  # Chunked uploads started
+        'upload_chunks': '300/minute',  # Chunk PUTs and status checks, ~2.4 GB/minute at UPLOAD_CHUNK_MAX_SIZE
+    },
 }
 
+# Comment moderation (see blog/moderation.py)
+# New comments are queued, scored by COMMENT_SPAM_SCORER on a background thread
+# and bulk inserted; scores at or below / above the thresholds are approved / rejected.
+COMMENT_MODERATION_ASYNC = True
+COMMENT_SPAM_SCORER = 'blog.moderation.heuristic_score'
+COMMENT_AUTO_APPROVE_BELOW = 0.2
+COMMENT_AUTO_REJECT_ABOVE = 0.8
+COMMENT_BATCH_SIZE = 100
+COMMENT_FLUSH_INTERVAL = 2.0  # seconds
+
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'fameuxarte.static.StaticAssetMiddleware',
+    'fameuxarte.prerender.PrerenderedPageMiddleware',
+    'fameuxarte.routers.ReplicaPinningMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -107,6 +144,75 @@ TEMPLATES = [
     },
 ]
 
+# Cache shared by the API payload caches, throttles and other lookups.
+# Point CACHE_BACKEND/CACHE_LOCATION at Redis or Memcached in production so every worker shares it.
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'fameuxarte'),
+    }
+}
+
+# JWT auth: tokens from /api/token/ carry username/is_staff claims, so reads need no user query.
+SIMPLE_JWT = {
+    'TOKEN_OBTAIN_SERIALIZER': 'account.authentication.ClaimsTokenObtainPairSerializer',
+}
+AUTH_USER_CACHE_TIMEOUT = 300  # seconds in the shared cache, invalidated when the user changes
+AUTH_USER_LOCAL_TIMEOUT = 10  # seconds in each process's own cache
+
+# Background jobs (see jobs/): run `manage.py run_jobs` next to the web workers.
+JOBS_WORKERS = 4  # threads per run_jobs process
+JOBS_TIMEOUT = 600  # seconds before a running job is assumed dead and queued again
+JOBS_RETRY_BASE_DELAY = 10  # seconds, doubled after every failed attempt
+JOBS_RETRY_MAX_DELAY = 3600  # seconds
+
+# Contact form API (see contact/ingest.py): messages are inserted in batches from a background thread
+CONTACT_INGEST_ASYNC = True
+CONTACT_BATCH_SIZE = 200
+CONTACT_FLUSH_INTERVAL = 1.0  # seconds
+
+# Email
+DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'FameuxArte <no-reply@fameuxarte.com>')
+CONTACT_NOTIFY_EMAILS = [e for e in os.environ.get('CONTACT_NOTIFY_EMAILS', '').split(',') if e]
+
+# Aggregated home page API (see home/api.py)
+HOME_API_CACHE_TIMEOUT = 600  # seconds; edits invalidate it earlier
+HOME_API_LIMITS = {
+    'featured_products': 8,
+    'new_products': 8,
+    'posts': 3,
+    'artists': 6,
+    'gallery': 12,
+}
+
+# Live stock/price stream (see shop/live.py and fameuxarte/broker.py)
+# LocalBackend reaches only the process that saved the product; use RedisBackend when several processes write.
+LIVE_BROKER_BACKEND = os.environ.get('LIVE_BROKER_BACKEND', 'fameuxarte.broker.LocalBackend')
+LIVE_BROKER_REDIS_URL = os.environ.get('LIVE_BROKER_REDIS_URL', 'redis://localhost:6379/0')
+LIVE_HEARTBEAT = 15  # seconds between keep-alive comments
+LIVE_RETRY_MS = 3000  # client reconnect delay
+LIVE_MAX_PENDING = 100  # undelivered events before a slow client is disconnected
+
+# Widths of the resized product images in listing documents (see shop/images.py)
+SHOP_IMAGE_VARIANT_WIDTHS = [320, 640, 1280]
+
+# Price buckets of the product filter sidebar (see shop/filters.py): lower edges, the last one is open-ended
+SHOP_PRICE_FACETS = [0, 50, 100, 250, 500, 1000, 2500, 5000]
+
+# "Collectors also bought" (see recommendations/build.py)
+RECOMMENDATIONS_TOP_N = 12
+RECOMMENDATIONS_BATCH_ORDERS = 2000  # orders counted per transaction; bounds the build's memory
+RECOMMENDATIONS_MAX_ORDER_ITEMS = 50  # larger orders are left out of the counts
+RECOMMENDATIONS_BUILD_DELAY = 3600  # seconds between a paid order and the build that counts it
+
+# Static pre-rendering (see fameuxarte/prerender.py)
+# `manage.py prerender_pages` renders these to PRERENDER_ROOT; the middleware serves them to anonymous visitors.
+# Only pages that change on deploy belong here: /home/ follows the banner schedule and
+# /cart/ and /checkout/ depend on the visitor, so they are always rendered per request.
+PRERENDER_PAGES = ['/about/', '/contact/']
+PRERENDER_ROOT = os.path.join(BASE_DIR, 'prerendered')
+PRERENDER_MAX_AGE = 300  # seconds
+
 WSGI_APPLICATION = 'fameuxarte.wsgi.application'
 
 
@@ -116,17 +222,64 @@ WSGI_APPLICATION = 'fameuxarte.wsgi.application'
 DATABASES = {
        'default': {
         'ENGINE': 'django.db.backends.postgresql',
-        'NAME': 'postgres ',
-        'USER': 'postgres ',
-        'PASSWORD': 'Go2hell##',
-        'HOST': 'oqslvwynlppuacdrhlxl.supabase.co',  # something like db.abc.supabase.co
-        'PORT': '5432',
+        'NAME': os.environ.get('DB_NAME', 'postgres '),
+        'USER': os.environ.get('DB_USER', 'postgres '),
+        'PASSWORD': os.environ.get('DB_PASSWORD', 'Go2hell##'),
+        'HOST': os.environ.get('DB_HOST', 'oqslvwynlppuacdrhlxl.supabase.co'),  # something like db.abc.supabase.co
+        'PORT': os.environ.get('DB_PORT', '5432'),
         'OPTIONS': {
-            'sslmode': 'require',  # <- this is crucial for Supabase
+            'sslmode': os.environ.get('DB_SSLMODE', 'require'),  # <- this is crucial for Supabase
         }
     }
 }
 
+# Connection reuse. Every new connection to Supabase costs a TCP + TLS + auth handshake,
+# so by default connections are kept open between requests and health-checked before reuse.
+#   DB_POOL=persistent  one long-lived connection per worker thread (CONN_MAX_AGE seconds)
+#   DB_POOL=psycopg     psycopg 3's native connection pool (pip install "psycopg[pool]")
+#   DB_POOL=none        connect and disconnect on every request (the old behaviour)
+# Benchmark the modes with `manage.py bench_db_connections`.
+DB_POOL = os.environ.get('DB_POOL', 'persistent')
+if DB_POOL == 'psycopg':
+    DATABASES['default']['CONN_MAX_AGE'] = 0  # Django refuses persistent connections on top of a pool
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+        'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+        'timeout': float(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        'max_idle': float(os.environ.get('DB_POOL_MAX_IDLE', 300)),
+    }
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True  # Django passes the pool its own check, run before lending a connection out
+elif DB_POOL == 'persistent':
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', 600))
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+else:
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+
+# PgBouncer in transaction mode (e.g. Supabase's pooler on port 6543).
+# Server-side cursors keep working as long as they are used inside transaction.atomic(),
+# which is how the streaming code in this project uses them; set DB_DISABLE_SERVER_SIDE_CURSORS=1
+# if something iterates outside a transaction. Django already turns psycopg 3's prepared
+# statements off; PgBouncer >= 1.21 with max_prepared_statements can take them back with
+# DB_PREPARE_THRESHOLD=5.
+DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = os.environ.get('DB_DISABLE_SERVER_SIDE_CURSORS') == '1'
+if os.environ.get('DB_PREPARE_THRESHOLD'):
+    DATABASES['default']['OPTIONS']['prepare_threshold'] = int(os.environ['DB_PREPARE_THRESHOLD'])
+
+# Read replicas (see fameuxarte/routers.py)
+# DB_REPLICA_HOSTS=host1,host2 adds 'replica1', 'replica2', ... with the primary's credentials.
+# Reads from REPLICA_APPS go to a replica; writes, transactions, PRIMARY_ONLY_PATHS and
+# clients that wrote in the last REPLICA_PIN_SECONDS stay on the primary.
+DATABASE_REPLICAS = []
+for number, host in enumerate(filter(None, os.environ.get('DB_REPLICA_HOSTS', '').split(',')), start=1):
+    alias = f'replica{number}'
+    DATABASES[alias] = dict(DATABASES['default'], HOST=host.strip(), OPTIONS=dict(DATABASES['default']['OPTIONS']))
+    DATABASES[alias]['TEST'] = {'MIRROR': 'default'}
+    DATABASE_REPLICAS.append(alias)
+DATABASE_ROUTERS = ['fameuxarte.routers.ReplicaRouter']
+REPLICA_APPS = {'shop', 'blog', 'artists', 'gallery', 'home', 'about'}
+PRIMARY_ONLY_PATHS = ['/cart/', '/checkout/', '/admin/']
+REPLICA_PIN_SECONDS = 5
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -166,9 +319,36 @@ STATIC_URL = 'static/'
 STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'frontend', 'out'),  # Serve Next.js build files
 ]
+# `collectstatic` copies everything here with content-hashed names plus .br/.gz siblings
+# (fameuxarte/storage.py); StaticAssetMiddleware serves them with long-lived immutable caching.
+# Install `brotli` to get .br files as well as .gz.
+STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
+STORAGES = {
+    'default': {
+        # Uploads are stored once per distinct content (see mediastore/storage.py)
+        'BACKEND': 'mediastore.storage.ContentAddressedStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'fameuxarte.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+# Sitemaps (see sitemap/builder.py)
+# `manage.py generate_sitemaps` writes the shards here; run it from cron.
+SITE_URL = os.environ.get('SITE_URL', 'https://fameuxarte.com')
+SITEMAP_ROOT = os.path.join(BASE_DIR, 'sitemaps')
+SITEMAP_URL_PREFIX = '/sitemaps/'
+SITEMAP_PATHS = {}  # Per-section overrides of the frontend URL, e.g. {'gallery': '/gallery/{pk}'}
+
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR / 'media') 
 
+# Chunked, resumable uploads (see uploads/views.py); chunks are assembled here before
+# being attached to an image field. `manage.py purge_uploads` clears abandoned ones.
+UPLOAD_TEMP_DIR = os.environ.get('UPLOAD_TEMP_DIR', os.path.join(BASE_DIR, 'tmp_uploads'))
+UPLOAD_MAX_SIZE = 500 * 1024 * 1024  # bytes
+UPLOAD_CHUNK_MAX_SIZE = 8 * 1024 * 1024  # bytes
+UPLOAD_EXPIRY_HOURS = 24
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
@@ -0,0 +1,139 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+# Sparse fieldsets for read requests:
+#
+#   ?fields=id,name,price            only these fields
+#   ?fields=id,category.name         dotted names reach into a relation (and expand it)
+#   ?expand=category                 nest these relations
+#
+# Once either parameter is present, nested relations that are not expanded are
+# returned as ids. Without them the output is exactly what it always was. Views
+# opt in with SparseFieldsViewMixin, which also trims the queryset: columns that
+# are not rendered are deferred and relations that are not rendered are neither
+# joined nor prefetched.
+
+
+def split_param(value):
+    return [part.strip() for part in (value or '').split(',') if part.strip()]
+
+
+def is_nested(field):
+    return isinstance(getattr(field, 'child', field), serializers.BaseSerializer)
+
+
+class SparseFieldsMixin:
+    """Serializer side of sparse fieldsets; use it on every serializer that may be nested too."""
+
+    def sparse_params(self):
+        """(field names or None for all, relation names to expand), or None when not requested."""
+        path, root = [], self
+        while root.parent is not None:
+            if root.field_name:
+                path.insert(0, root.field_name)
+            root = root.parent
+        request = root.context.get('request')
+        view = root.context.get('view')
+        if request is None or not getattr(view, 'sparse_fieldsets', False) or request.method not in SAFE_METHODS:
+            return None
+        params = getattr(request, 'query_params', request.GET)
+        if 'fields' not in params and 'expand' not in params:
+            return None
+
+        prefix = ''.join(f'{name}.' for name in path)
+        fields = [name[len(prefix):] for name in split_param(params.get('fields')) if name.startswith(prefix)]
+        expand = [name[len(prefix):] for name in split_param(params.get('expand')) if name.startswith(prefix)]
+        only = {name.split('.')[0] for name in fields} or None
+        expand = {name.split('.')[0] for name in expand} | {name.split('.')[0] for name in fields if '.' in name}
+        return only, expand
+
+    def get_fields(self):
+        fields = super().get_fields()
+        params = self.sparse_params()
+        if params is None:
+            return fields
+        only, expand = params
+        for name, field in list(fields.items()):
+            if field.write_only:
+                continue
+            if only is not None and name not in only:
+                del fields[name]
+            elif is_nested(field) and name not in expand:
+                many = isinstance(field, serializers.ListSerializer)
+                kwargs = {'source': field.source} if field.source and field.source != name else {}
+                fields[name] = serializers.PrimaryKeyRelatedField(read_only=True, many=many, **kwargs)
+        return fields
+
+
+def plan(model, serializer, prefix=''):
+    """
+    What ``serializer`` reads from ``model``: (columns for only(), or None when
+    they can't be worked out safely; select_related paths; prefetch paths).
+    """
+    columns, joins, prefetches = {prefix + model._meta.pk.name}, [], []
+    safe = True
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        source = field.source
+        try:
+            model_field = model._meta.get_field(source)
+        except FieldDoesNotExist:  # '*', dotted sources, properties and methods
+            safe = False
+            continue
+        path = prefix + source
+        if model_field.many_to_many or model_field.one_to_many:
+            prefetches.append(path)  # Ids need the prefetch too
+        elif model_field.is_relation and not model_field.concrete:  # Reverse one-to-one
+            safe = False
+            joins.append(path)
+        elif model_field.is_relation:
+            columns.add(path)
+            if is_nested(field):
+                joins.append(path)
+                nested_columns, nested_joins, nested_prefetches = plan(model_field.related_model, field, f'{path}__')
+                if nested_columns is None:
+                    safe = False
+                else:
+                    columns |= nested_columns
+                joins += nested_joins
+                prefetches += nested_prefetches
+            elif not isinstance(field, serializers.PrimaryKeyRelatedField):
+                joins.append(path)  # e.g. StringRelatedField renders the related object
+        else:
+            columns.add(path)
+    return (columns if safe else None), joins, prefetches
+
+
+def sparse_queryset(queryset, serializer):
+    """Trim ``queryset`` to what a sparse ``serializer`` renders; unchanged when no sparse params were sent."""
+    serializer = getattr(serializer, 'child', serializer)
+    if serializer.sparse_params() is None:
+        return queryset
+    columns, joins, prefetches = plan(queryset.model, serializer)
+    # Keep the view's own Prefetch objects (e.g. approved comments only) for relations still rendered
+    kept = [
+        lookup for lookup in queryset._prefetch_related_lookups
+        if getattr(lookup, 'prefetch_to', lookup) in prefetches
+    ]
+    missing = [path for path in prefetches if path not in {getattr(lookup, 'prefetch_to', lookup) for lookup in kept}]
+    queryset = queryset.select_related(None).prefetch_related(None)
+    if joins:
+        queryset = queryset.select_related(*joins)
+    if kept or missing:
+        queryset = queryset.prefetch_related(*kept, *missing)
+    if columns is not None:
+        queryset = queryset.only(*columns)
+    return queryset
+
+
+class SparseFieldsViewMixin:
+    """For generic views whose serializer uses SparseFieldsMixin."""
+
+    sparse_fieldsets = True
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        serializer = self.get_serializer_class()(context=self.get_serializer_context())
+        return sparse_queryset(queryset, serializer)
@@ -0,0 +1,103 @@
+import mimetypes
+import os
+import re
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+# Names produced by ManifestStaticFilesStorage ("app.3f2a9c1b7d4e.css"), Next.js build
+# output under _next/static/ and content-addressed media all change whenever their
+# content does, so they can be cached forever.
+HASHED_NAME_RE = re.compile(r'(\.[0-9a-f]{12}\.[^/]+$)|(^_next/static/)|(^cas/)')
+IMMUTABLE = 'public, max-age=31536000, immutable'
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def accepted_encodings(request):
+    header = request.META.get('HTTP_ACCEPT_ENCODING', '')
+    accepted = set()
+    for part in header.split(','):
+        name, *params = [piece.strip() for piece in part.split(';')]
+        quality = 1.0
+        for param in params:
+            if param.startswith('q='):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if name and quality > 0:
+            accepted.add(name.lower())
+    if '*' in accepted:
+        accepted.update(name for name, _ in ENCODINGS)
+    return accepted
+
+
+def serve_file(request, root, path, max_age=60):
+    """
+    Serve ``path`` under ``root`` with a precompressed sibling (.br, then .gz)
+    when the client accepts it. Hashed names get a year-long immutable
+    Cache-Control; others a short max-age plus Last-Modified revalidation.
+    Returns None when the file does not exist.
+    """
+    try:
+        fullpath = safe_join(root, path)
+    except SuspiciousFileOperation:  # Path escapes the root
+        return None
+    if not os.path.isfile(fullpath):
+        return None
+
+    stat = os.stat(fullpath)
+    if not was_modified_since(request.META.get('HTTP_IF_MODIFIED_SINCE'), stat.st_mtime):
+        return HttpResponseNotModified()
+
+    content_type, _ = mimetypes.guess_type(fullpath)
+    serve_path, encoding = fullpath, None
+    accepted = accepted_encodings(request)
+    for name, suffix in ENCODINGS:
+        if name in accepted and os.path.isfile(fullpath + suffix):
+            serve_path, encoding = fullpath + suffix, name
+            break
+
+    response = FileResponse(open(serve_path, 'rb'), content_type=content_type or 'application/octet-stream')
+    if encoding:
+        response['Content-Encoding'] = encoding
+    response['Vary'] = 'Accept-Encoding'
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    response['Cache-Control'] = IMMUTABLE if HASHED_NAME_RE.search(path) else f'public, max-age={max_age}'
+    return response
+
+
+class StaticAssetMiddleware:
+    """
+    Serves collected static files from STATIC_ROOT before the rest of the
+    middleware runs, with content negotiation over the .br/.gz files written by
+    CompressedManifestStaticFilesStorage. Requests for files that are not in
+    STATIC_ROOT continue down the stack unchanged. Works under WSGI and ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.prefix = '/' + settings.STATIC_URL.lstrip('/')
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.serve(request) or self.get_response(request)
+
+    async def __acall__(self, request):
+        return self.serve(request) or await self.get_response(request)
+
+    def serve(self, request):
+        if request.method in ('GET', 'HEAD') and request.path_info.startswith(self.prefix) and settings.STATIC_ROOT:
+            return serve_file(request, settings.STATIC_ROOT, request.path_info[len(self.prefix):])
+        return None
@@ -0,0 +1,53 @@
+import gzip
+import os
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+try:
+    import brotli
+except ImportError:  # Optional: without it only .gz siblings are written
+    brotli = None
+
+# Already compressed formats gain nothing from another pass
+COMPRESSIBLE_EXTENSIONS = {
+    '.css', '.js', '.mjs', '.map', '.json', '.html', '.htm', '.txt', '.xml', '.svg', '.ico',
+    '.webmanifest', '.wasm', '.ttf', '.otf', '.eot',
+}
+MIN_COMPRESS_SIZE = 256  # bytes
+
+
+def compress_file(path):
+    """
+    Write ``path.gz`` and (with brotli installed) ``path.br`` next to ``path``,
+    keeping each only if it is actually smaller. Returns the siblings written.
+    """
+    with open(path, 'rb') as f:
+        content = f.read()
+    if len(content) < MIN_COMPRESS_SIZE:
+        return []
+    variants = [('.gz', gzip.compress(content, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(content, quality=11)))
+    written = []
+    for suffix, compressed in variants:
+        if len(compressed) < len(content):
+            with open(path + suffix, 'wb') as f:
+                f.write(compressed)
+            written.append(path + suffix)
+    return written
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    ManifestStaticFilesStorage that also writes pre-compressed Brotli and gzip
+    siblings of every hashed text asset at collectstatic time, so
+    fameuxarte.static.StaticAssetMiddleware never has to compress on the fly.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+        if dry_run:
+            return
+        for hashed_name in set(self.hashed_files.values()):
+            if os.path.splitext(hashed_name)[1].lower() in COMPRESSIBLE_EXTENSIONS:
+                compress_file(self.path(hashed_name))
@@ -0,0 +1,429 @@
+import asyncio
+import gzip
+import json
+import os
+import runpy
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from decimal import Decimal
+from io import BytesIO, StringIO
+from pathlib import Path
+from unittest import mock, skipUnless
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models import F
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.tokens import AccessToken
+
+from checkout.models import OrderItem
+from shop.models import Category, Product, Review
+from .admin_tools import EstimatedCountPaginator
+from .benchmarks import ENDPOINTS, bench_host, compare, percentile
+from .broker import Broker, LocalBackend
+from .parsers import FastJSONParser
+from .prerender import PrerenderedPageMiddleware, build
+from .renderers import FastJSONRenderer, NDJSONRenderer
+from .routers import ReplicaPinningMiddleware, ReplicaRouter, is_pinned
+from .static import HASHED_NAME_RE, StaticAssetMiddleware, accepted_encodings, serve_file
+from .storage import brotli, compress_file
+
+SETTINGS_FILE = Path(__file__).with_name('settings.py')
+
+
+def load_settings(**environ):
+    with mock.patch.dict(os.environ, environ):
+        return runpy.run_path(str(SETTINGS_FILE))
+
+
+class ConnectionPoolSettingsTests(SimpleTestCase):
+    def test_psycopg_pool_uses_djangos_health_check(self):
+        database = load_settings(DB_POOL='psycopg')['DATABASES']['default']
+        self.assertEqual(database['CONN_MAX_AGE'], 0)
+        self.assertTrue(database['CONN_HEALTH_CHECKS'])
+        # Django passes check= to ConnectionPool itself; a second one is a TypeError
+        self.assertNotIn('check', database['OPTIONS']['pool'])
+
+    def test_persistent_connections(self):
+        database = load_settings(DB_POOL='persistent', DB_CONN_MAX_AGE='60')['DATABASES']['default']
+        self.assertEqual(database['CONN_MAX_AGE'], 60)
+        self.assertTrue(database['CONN_HEALTH_CHECKS'])
+        self.assertNotIn('pool', database['OPTIONS'])
+
+
+class BenchDbConnectionsTests(TransactionTestCase):
+    @skipUnless(connection.vendor != 'postgresql', "Only meaningful on a non-Postgres test database")
+    def test_refuses_other_databases(self):
+        with self.assertRaises(CommandError):
+            call_command('bench_db_connections', requests=1)
+
+    @skipUnless(connection.vendor == 'postgresql', "Needs Postgres")
+    def test_all_modes(self):
+        out = StringIO()
+        call_command('bench_db_connections', requests=5, stdout=out, stderr=StringIO())
+        self.assertIn('fresh', out.getvalue())
+        self.assertIn('persistent', out.getvalue())
+
+
+class AsyncMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+
+    @override_settings(DEBUG=True)
+    def test_asgi_stack_needs_no_adapters(self):
+        with self.assertNoLogs('django.request', 'DEBUG'):
+            ASGIHandler()
+
+    def test_static_assets(self):
+        with open(os.path.join(self.root, 'app.0123456789ab.css'), 'w') as f:
+            f.write('body {}')
+
+        async def view(request):
+            return HttpResponse('from the view')
+
+        middleware = StaticAssetMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        with override_settings(STATIC_ROOT=self.root):
+            response = self.async_call(middleware, RequestFactory().get('/static/app.0123456789ab.css'))
+            self.assertEqual(b''.join(response.streaming_content), b'body {}')
+            self.assertIn('immutable', response['Cache-Control'])
+            response = self.async_call(middleware, RequestFactory().get('/static/missing.css'))
+            self.assertEqual(response.content, b'from the view')
+
+    def test_prerendered_pages(self):
+        with open(os.path.join(self.root, 'about.0123456789ab.html'), 'w') as f:
+            f.write('<h1>About</h1>')
+        with open(os.path.join(self.root, 'manifest.json'), 'w') as f:
+            f.write('{"/about/": "about.0123456789ab.html"}')
+
+        async def view(request):
+            return HttpResponse('from the view')
+
+        with override_settings(PRERENDER_ROOT=self.root):
+            middleware = PrerenderedPageMiddleware(view)
+            self.assertTrue(iscoroutinefunction(middleware))
+            response = self.async_call(middleware, RequestFactory().get('/about/'))
+            self.assertEqual(b''.join(response.streaming_content), b'<h1>About</h1>')
+            response = self.async_call(middleware, RequestFactory().get('/about/', {'q': 1}))
+            self.assertEqual(response.content, b'from the view')
+
+    @override_settings(DATABASE_REPLICAS=['replica1'], REPLICA_PIN_SECONDS=5)
+    def test_replica_pinning(self):
+        seen = []
+
+        async def view(request):
+            seen.append(is_pinned())
+            return HttpResponse()
+
+        middleware = ReplicaPinningMiddleware(view)
+        self.assertTrue(iscoroutinefunction(middleware))
+        self.async_call(middleware, RequestFactory().get('/api/shop/products/'))
+        response = self.async_call(middleware, RequestFactory().post('/api/shop/products/'))
+        self.assertEqual(seen, [False, True])
+        self.assertIn('pin_primary', response.cookies)
+        self.assertFalse(is_pinned())
+
+    def test_sync_stacks_stay_sync(self):
+        middleware = ReplicaPinningMiddleware(lambda request: HttpResponse())
+        self.assertFalse(iscoroutinefunction(middleware))
+        self.assertEqual(middleware(RequestFactory().get('/')).status_code, 200)
+
+    def async_call(self, middleware, request):
+        return async_to_sync(middleware)(request)
+
+
+class PrerenderTests(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.enterContext(mock.patch('fameuxarte.prerender.logger'))  # Pages without a template are reported
+
+    def test_build_and_serve(self):
+        manifest, skipped = build(root=self.root)
+        self.assertEqual(set(manifest) | set(skipped), {'/about/', '/contact/'})
+        self.assertIn('/about/', manifest)
+        with override_settings(PRERENDER_ROOT=self.root):
+            response = self.client.get('/about/')
+            self.assertEqual(response['Cache-Control'], 'public, max-age=300')
+            self.assertNotIn('Cache-Control', self.client.get('/home/'))  # Banners change on a schedule
+
+    def test_unchanged_pages_keep_their_file(self):
+        first, _ = build(root=self.root)
+        second, _ = build(root=self.root, prune=True)
+        self.assertEqual(first, second)
+        self.assertEqual(sorted(os.listdir(self.root)), sorted(list(first.values()) + ['manifest.json']))
+
+
+class FastJSONTests(SimpleTestCase):
+    data = {
+        'name': 'Café \u2028 line', 'price': Decimal('12.50'), 'when': datetime(2026, 1, 2, 3, 4, 5, 600, tzinfo=timezone.utc),
+        'tags': ['a', 1, 2.5, None, True], 1: 'non-string key',
+    }
+
+    def test_renderer_matches_drf(self):
+        self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+        big = {'n': 2 ** 70}  # Wider than orjson's integers: DRF's encoder takes over
+        self.assertEqual(FastJSONRenderer().render(big), JSONRenderer().render(big))
+
+    def test_ndjson_renderer(self):
+        self.assertEqual(NDJSONRenderer().render([{'a': 1}, {'a': 2}]), b'{"a":1}\n{"a":2}\n')
+
+    def test_parser_matches_drf(self):
+        body = b'{"a": [1, 2.5, "\xc3\xa9", {"b": null}]}'
+        self.assertEqual(FastJSONParser().parse(BytesIO(body)), JSONParser().parse(BytesIO(body)))
+        for body in [b'{"a": NaN}', b'{"a":']:  # Rejected with DRF's own messages
+            with self.assertRaises(ParseError) as fast:
+                FastJSONParser().parse(BytesIO(body))
+            with self.assertRaises(ParseError) as drf:
+                JSONParser().parse(BytesIO(body))
+            self.assertEqual(str(fast.exception), str(drf.exception))
+
+
+def access_token(user_id):
+    token = AccessToken()
+    token['user_id'] = user_id
+    return token
+
+
+@override_settings(DATABASE_REPLICAS=['replica1'], REPLICA_PIN_SECONDS=5)
+class ReplicaRoutingTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        token = access_token(7)
+        self.user = TokenUser(token)
+        self.token = str(token)
+
+    def reads_from(self, request):
+        seen = []
+
+        def view(request):
+            seen.append(ReplicaRouter().db_for_read(User if request.path.startswith('/account') else Category))
+            request.user = self.user if request.method == 'POST' else None  # What DRF's authentication leaves behind
+            return HttpResponse()
+
+        response = ReplicaPinningMiddleware(view)(request)
+        return seen[0], response
+
+    def test_reads_go_to_replicas_for_replicated_apps_only(self):
+        self.assertEqual(self.reads_from(RequestFactory().get('/api/shop/products/'))[0], 'replica1')
+        self.assertIsNone(self.reads_from(RequestFactory().get('/account/'))[0])
+
+    def test_cookie_pins_the_browser_after_a_write(self):
+        _, response = self.reads_from(RequestFactory().post('/api/blog/comments/'))
+        request = RequestFactory().get('/api/shop/products/')
+        request.COOKIES['pin_primary'] = response.cookies['pin_primary'].value
+        self.assertIsNone(self.reads_from(request)[0])
+
+    def test_jwt_clients_are_pinned_after_a_write(self):
+        auth = {'HTTP_AUTHORIZATION': f'Bearer {self.token}'}
+        self.assertEqual(self.reads_from(RequestFactory().get('/api/shop/products/', **auth))[0], 'replica1')
+        self.assertIsNone(self.reads_from(RequestFactory().post('/api/blog/comments/', **auth))[0])
+        self.assertIsNone(self.reads_from(RequestFactory().get('/api/shop/products/', **auth))[0])  # No cookie needed
+        auth = {'HTTP_AUTHORIZATION': f'Bearer {access_token(8)}'}  # Another user
+        self.assertEqual(self.reads_from(RequestFactory().get('/api/shop/products/', **auth))[0], 'replica1')
+        auth = {'HTTP_AUTHORIZATION': 'Bearer not-a-token'}
+        self.assertEqual(self.reads_from(RequestFactory().get('/api/shop/products/', **auth))[0], 'replica1')
+
+
+class BenchmarkSuiteTests(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+
+    def seed(self, seed, run=datetime(2026, 1, 1, tzinfo=timezone.utc)):
+        with mock.patch('fameuxarte.management.commands.seed_catalog.timezone.now', return_value=run):
+            call_command('seed_catalog', scale=0.002, seed=seed, stdout=StringIO())
+
+    def test_seed_catalog_is_reproducible(self):
+        self.seed(7)
+        self.assertEqual(Product.objects.count(), 20)
+        self.assertEqual(Review.objects.count(), 30)
+        self.assertFalse(OrderItem.objects.exclude(price=F('product__price')).exists())  # Price snapshots filled in
+        first = list(Product.objects.order_by('pk').values_list('name', 'price', 'stock'))
+        self.seed(7, run=datetime(2026, 1, 2, tzinfo=timezone.utc))  # Another run: new slugs, same data
+        self.assertEqual(list(Product.objects.order_by('pk').values_list('name', 'price', 'stock')[20:]), first)
+
+    def test_run_and_compare_against_a_baseline(self):
+        self.seed(1)
+        output = os.path.join(self.root, 'results.json')
+        out = StringIO()
+        call_command('run_benchmarks', 'product-list', 'product-detail', iterations=3, output=output, stdout=out)
+        with open(output, encoding='utf-8') as f:
+            results = json.load(f)
+        self.assertEqual(set(results['endpoints']), {'product-list', 'product-detail'})
+        detail = results['endpoints']['product-detail']
+        self.assertEqual((detail['status'], detail['iterations']), (200, 3))
+        self.assertLessEqual(detail['p50_ms'], detail['p99_ms'])
+        self.assertGreater(detail['queries'], 0)
+
+        call_command('run_benchmarks', 'product-detail', iterations=3, baseline=output, threshold=10000, stdout=out)
+        for metric in ('p50_ms', 'p95_ms', 'p99_ms'):
+            results['endpoints']['product-detail'][metric] = 0.0001
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(results, f)
+        with self.assertRaisesMessage(CommandError, 'Regression'):
+            call_command('run_benchmarks', 'product-detail', iterations=3, baseline=output, stdout=out)
+        with self.assertRaisesMessage(CommandError, 'Unknown endpoint'):
+            call_command('run_benchmarks', 'nope', stdout=out)
+
+    def test_error_responses_are_not_results(self):
+        output = os.path.join(self.root, 'results.json')
+        with mock.patch.dict(ENDPOINTS, {'missing': '/api/shop/products/0/'}):
+            with self.assertRaisesMessage(CommandError, '/api/shop/products/0/ answered 404'):
+                call_command('run_benchmarks', 'missing', iterations=1, output=output, stdout=StringIO())
+        self.assertFalse(os.path.exists(output))
+
+    def test_bench_host(self):
+        for allowed, debug, host in [
+            (['.example.com', 'www.example.com'], False, 'example.com'),
+            (['*'], False, 'testserver'),
+            ([], True, 'localhost'),
+        ]:
+            with self.subTest(allowed=allowed), override_settings(ALLOWED_HOSTS=allowed, DEBUG=debug):
+                self.assertEqual(bench_host(), host)
+
+    def test_compare(self):
+        baseline = {'endpoints': {'a': {'p50_ms': 10, 'queries': 4, 'peak_kb': 100}, 'gone': {'p50_ms': 1}}}
+        current = {'endpoints': {'a': {'p50_ms': 10.5, 'queries': 4, 'peak_kb': 300}, 'new': {'p50_ms': 1}}}
+        rows, regressed = compare(current, baseline, threshold=10)
+        self.assertFalse(regressed)  # Memory is reported, not gated
+        self.assertEqual([row[:2] for row in rows], [('a', 'p50_ms'), ('a', 'queries'), ('a', 'peak_kb')])
+        current['endpoints']['a']['queries'] = 5
+        self.assertTrue(compare(current, baseline, threshold=10)[1])
+        self.assertEqual(percentile([1, 2, 3, 4], 50), 2)
+        self.assertIsNone(percentile([], 99))
+
+
+class StaticAssetTests(SimpleTestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+
+    def write(self, name, content=b'body { color: teal }'):
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(content)
+        return path
+
+    def get(self, path, **headers):
+        return serve_file(RequestFactory().get('/static/' + path, **headers), self.root, path)
+
+    def test_accept_encoding(self):
+        def parse(header):
+            return accepted_encodings(RequestFactory().get('/', HTTP_ACCEPT_ENCODING=header))
+        self.assertEqual(parse('gzip, deflate, br'), {'gzip', 'deflate', 'br'})
+        self.assertEqual(parse('br;q=0, gzip;q=0.5'), {'gzip'})
+        self.assertEqual(parse('identity, *'), {'identity', '*', 'br', 'gzip'})
+        self.assertEqual(parse('br;q=x'), set())
+
+    def test_precompressed_variants(self):
+        self.write('app.0123456789ab.css')
+        self.write('app.0123456789ab.css.gz', b'gz')
+        self.write('app.0123456789ab.css.br', b'br')
+        response = self.get('app.0123456789ab.css', HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual((response['Content-Encoding'], b''.join(response.streaming_content)), ('br', b'br'))
+        self.assertEqual(response['Content-Type'], 'text/css')
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(response['Cache-Control'], 'public, max-age=31536000, immutable')
+        response = self.get('app.0123456789ab.css', HTTP_ACCEPT_ENCODING='gzip, br;q=0')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        response = self.get('app.0123456789ab.css')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(b''.join(response.streaming_content), b'body { color: teal }')
+
+    def test_unhashed_files_revalidate(self):
+        self.write('robots.txt')
+        self.write('_next/static/chunks/main.js')
+        response = self.get('robots.txt')
+        self.assertEqual(response['Cache-Control'], 'public, max-age=60')
+        self.assertEqual(self.get('robots.txt', HTTP_IF_MODIFIED_SINCE=response['Last-Modified']).status_code, 304)
+        self.assertIn('immutable', self.get('_next/static/chunks/main.js')['Cache-Control'])
+        self.assertIsNone(self.get('missing.css'))
+        self.assertIsNone(self.get('../etc/passwd'))
+
+    def test_compress_file(self):
+        self.assertEqual(compress_file(self.write('tiny.css')), [])  # Under MIN_COMPRESS_SIZE
+        path = self.write('big.css', b'body { color: teal }\n' * 100)
+        self.assertEqual(compress_file(path), [path + '.gz'] + ([path + '.br'] if brotli else []))
+        with open(path + '.gz', 'rb') as f:
+            self.assertEqual(gzip.decompress(f.read()), b'body { color: teal }\n' * 100)
+        noise = self.write('noise.css', os.urandom(1024))
+        self.assertEqual(compress_file(noise), [])  # Bigger once compressed
+
+    def test_collectstatic(self):
+        source = os.path.join(self.root, 'src')
+        os.makedirs(source)
+        with open(os.path.join(source, 'site.css'), 'w') as f:
+            f.write('body { color: teal }\n' * 100)
+        output = os.path.join(self.root, 'out')
+        with override_settings(
+            STATICFILES_DIRS=[source], STATIC_ROOT=output,
+            STATICFILES_FINDERS=['django.contrib.staticfiles.finders.FileSystemFinder'],
+        ):
+            call_command('collectstatic', interactive=False, verbosity=0)
+        hashed = [name for name in os.listdir(output) if HASHED_NAME_RE.search(name) and name.endswith('.css')]
+        self.assertEqual(len(hashed), 1)
+        self.assertTrue(os.path.isfile(os.path.join(output, hashed[0] + '.gz')))
+        self.assertFalse(os.path.exists(os.path.join(output, 'site.css.gz')))  # Only hashed names
+
+
+class BrokerTests(SimpleTestCase):
+    async def test_fan_out_by_key(self):
+        broker = Broker(LocalBackend)
+        watcher = broker.subscribe('products', keys=[1, 2])
+        other = broker.subscribe('products', keys=[3])
+        everything = broker.subscribe('products')
+        broker.publish('products', {'key': 2, 'stock': 0})
+        broker.publish('elsewhere', {'key': 2})
+        self.assertEqual(await watcher.get(timeout=1), {'key': 2, 'stock': 0})
+        self.assertEqual(await everything.get(timeout=1), {'key': 2, 'stock': 0})
+        self.assertIsNone(await other.get(timeout=0.01))
+        self.assertIsNone(await watcher.get(timeout=0.01))
+
+        watcher.close()
+        other.close()
+        self.assertEqual(broker.channels['products']['keys'], {})
+
+    async def test_slow_subscribers_are_dropped(self):
+        broker = Broker(LocalBackend)
+        slow = broker.subscribe('products', max_pending=2)
+        for key in range(3):
+            broker.publish('products', {'key': key})
+        await asyncio.sleep(0)  # Let the queued deliveries run
+        self.assertTrue(slow.closed)
+        self.assertEqual(broker.channels['products']['all'], set())
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    def setUp(self):
+        for slug in ['oil', 'ink', 'chalk']:
+            Category.objects.create(name=slug.title(), slug=slug)
+
+    def paginator(self, queryset, estimate_above):
+        paginator = EstimatedCountPaginator(queryset, 10)
+        paginator.estimate_above = estimate_above
+        return paginator
+
+    def test_small_or_filtered_lists_are_counted(self):
+        self.assertEqual(self.paginator(Category.objects.all(), 100_000).count, 3)
+        self.assertEqual(self.paginator(Category.objects.filter(slug='oil'), -2).count, 1)
+
+    @skipUnless(connection.vendor == 'postgresql', "Needs Postgres")
+    def test_big_unfiltered_lists_are_estimated(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE shop_category')
+        with self.assertNumQueries(1):  # reltuples only, no COUNT(*)
+            self.assertEqual(self.paginator(Category.objects.all(), 1).count, 3)
@@ -14,13 +14,25 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
-from django.urls import path, include
+from django.http import Http404
+from django.urls import path, include, re_path
 from django.shortcuts import redirect
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+
+from fameuxarte.static import serve_file
 
 def redirect_to_home(request):
     return redirect('/home/')
 
+def serve_media(request, path):
+    # Content-addressed uploads (cas/...) never change, so they get immutable cache headers
+    response = serve_file(request, settings.MEDIA_ROOT, path)
+    if response is None:
+        raise Http404(path)
+    return response
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("about/", include("about.urls")),
@@ -35,6 +47,19 @@ urlpatterns = [
     path("api/blog/", include("blog.urls")),  # 🔥 This will handle api/posts/
     path("api/gallery/", include("gallery.urls")),
     path("api/shop/", include("shop.urls")),
+    path("api/contact/", include("contact.api_urls")),
+    path("api/home/", include("home.api_urls")),
+    path("api/imagery/", include("imagery.urls")),
+    path("api/recommendations/", include("recommendations.urls")),
+    path("api/uploads/", include("uploads.urls")),
+    path("api/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
+    path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+
+    # Uploaded media
+    re_path(r"^%s(?P<path>.*)$" % settings.MEDIA_URL.lstrip("/"), serve_media, name="media"),
+
+    # Pre-generated sitemap files
+    path("", include("sitemap.urls")),
     
 
     # Redirect root URL to home
@@ -7,6 +7,7 @@ class GalleryImage(models.Model):
     image = models.ImageField(upload_to='gallery/')
     description = models.TextField(blank=True, null=True)
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.title
\ No newline at end of file
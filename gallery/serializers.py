@@ -1,7 +1,9 @@
 from rest_framework import serializers
+from fameuxarte.sparse import SparseFieldsMixin
+from uploads.serializers import ChunkedUploadFieldMixin
 from .models import GalleryImage
 
-class GalleryImageSerializer(serializers.ModelSerializer):
+class GalleryImageSerializer(SparseFieldsMixin, ChunkedUploadFieldMixin, serializers.ModelSerializer):  # image or upload=<chunked upload id>
     class Meta:
         model = GalleryImage
         fields = '__all__'
\ No newline at end of file
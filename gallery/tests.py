@@ -1,3 +1,38 @@
-from django.test import TestCase
+import json
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from .models import GalleryImage
+from .views import GalleryImageListCreateView
 
 # Create your tests here.
+
+
+@override_settings(MEDIA_ROOT='/tmp')
+class NDJSONStreamTests(TestCase):
+    def setUp(self):
+        for title in ['First', 'Second', 'Third']:
+            GalleryImage.objects.bulk_create([GalleryImage(title=title, image='gallery/x.png')])  # No upload needed
+
+    def test_rows_stream_with_sparse_fields(self):
+        response = self.client.get('/api/gallery/gallery/', {'format': 'ndjson', 'fields': 'id,title'})
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertFalse(response.is_async)  # WSGI: a plain generator
+        lines = b''.join(response.streaming_content).splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(set(json.loads(lines[0])), {'id', 'title'})
+
+    def test_same_rows_as_the_json_list(self):
+        streamed = self.client.get('/api/gallery/gallery/', {'format': 'ndjson'})
+        rows = [json.loads(line) for line in b''.join(streamed.streaming_content).splitlines()]
+        self.assertEqual(rows, self.client.get('/api/gallery/gallery/').json())
+
+    async def test_asgi_gets_an_async_stream(self):
+        with mock.patch.object(GalleryImageListCreateView, 'stream_batch_size', 2):
+            response = await self.async_client.get('/api/gallery/gallery/', {'format': 'ndjson'})
+            self.assertTrue(response.is_async)  # Sent as produced instead of buffered by the ASGI handler
+            chunks = [chunk async for chunk in response.streaming_content]
+        self.assertEqual(len(chunks), 2)  # Two rows, then one
+        lines = b''.join(chunks).splitlines()
+        self.assertEqual([json.loads(line)['title'] for line in lines], ['First', 'Second', 'Third'])
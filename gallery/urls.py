@@ -1,7 +1,10 @@
 from django.urls import path
 from .views import GalleryImageListCreateView, GalleryImageRetrieveUpdateDestroyView
+from .views import gallery_list_async, gallery_detail_async
 
 urlpatterns = [
     path('gallery/', GalleryImageListCreateView.as_view(), name='gallery-list-create'),
     path('gallery/<int:pk>/', GalleryImageRetrieveUpdateDestroyView.as_view(), name='gallery-detail'),
+    path('async/gallery/', gallery_list_async, name='gallery-list-async'),
+    path('async/gallery/<int:pk>/', gallery_detail_async, name='gallery-detail-async'),
 ]
@@ -1,13 +1,28 @@
+from django.views.decorators.http import require_safe
 from rest_framework import generics
+from fameuxarte.async_api import detail_response, list_response
+from fameuxarte.sparse import SparseFieldsViewMixin
+from fameuxarte.streaming import NDJSONStreamingMixin
+from imagery.views import SimilarImagesMixin
 from .models import GalleryImage
 from .serializers import GalleryImageSerializer
 
 # List & Create Gallery Images
-class GalleryImageListCreateView(generics.ListCreateAPIView):
+class GalleryImageListCreateView(SparseFieldsViewMixin, NDJSONStreamingMixin, generics.ListCreateAPIView):  # ?format=ndjson streams rows
     queryset = GalleryImage.objects.all()
     serializer_class = GalleryImageSerializer
 
 # Retrieve, Update & Delete a Single Gallery Image
-class GalleryImageRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+class GalleryImageRetrieveUpdateDestroyView(SparseFieldsViewMixin, SimilarImagesMixin, generics.RetrieveUpdateDestroyAPIView):  # ?similar=6 adds look-alikes
     queryset = GalleryImage.objects.all()
+    similar_kind = 'gallery'
     serializer_class = GalleryImageSerializer
+
+# Async read-only API (for ASGI workers)
+@require_safe
+async def gallery_list_async(request):
+    return await list_response(request, GalleryImage.objects.all(), GalleryImageSerializer)
+
+@require_safe
+async def gallery_detail_async(request, pk):
+    return await detail_response(request, GalleryImage.objects.all(), GalleryImageSerializer, pk=pk)
@@ -1,3 +1,10 @@
 from django.contrib import admin
+from .models import Banner
 
 # Register your models here.
+
+@admin.register(Banner)
+class BannerAdmin(admin.ModelAdmin):
+    list_display = ('title', 'is_active', 'start_date', 'end_date')
+    list_filter = ('is_active',)
+    search_fields = ('title',)
@@ -0,0 +1,82 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from about.models import About
+from about.serializers import AboutSerializer
+from artists.models import Artist
+from artists.serializers import ArtistSerializer
+from blog.models import Post
+from fameuxarte.renderers import dumps
+from gallery.models import GalleryImage
+from gallery.serializers import GalleryImageSerializer
+from shop.models import Product
+from shop.serializers import ProductSerializer
+from .banners import active_banners_until
+from .serializers import BannerSerializer, HomePostSerializer
+
+VERSION_KEY = 'home:api:version'
+
+
+def build(request):
+    """
+    Everything the landing page shows, in a fixed number of queries
+    (one per section, plus one for post tags; banners usually come from cache).
+    Returns (data, valid_until) where valid_until is the next banner change.
+    """
+    limits = settings.HOME_API_LIMITS
+    context = {'request': request}
+    banners, valid_until = active_banners_until()
+    products = Product.objects.filter(available=True).select_related('category')
+    featured_artists = list(Artist.objects.filter(featured=True).order_by('name')[:limits['artists']])
+    if not featured_artists:  # Nothing picked yet: show the newest
+        featured_artists = list(Artist.objects.order_by('-pk')[:limits['artists']])
+    about = About.objects.first()
+    data = {
+        'banners': BannerSerializer(banners, many=True, context=context).data,
+        'featured_products': ProductSerializer(
+            products.filter(featured=True).order_by('-updated_at')[:limits['featured_products']], many=True, context=context,
+        ).data,
+        'new_products': ProductSerializer(
+            products.order_by('-created_at')[:limits['new_products']], many=True, context=context,
+        ).data,
+        'latest_posts': HomePostSerializer(
+            Post.objects.select_related('author').prefetch_related('tags').order_by('-published_at')[:limits['posts']],
+            many=True, context=context,
+        ).data,
+        'featured_artists': ArtistSerializer(featured_artists, many=True, context=context).data,
+        'recent_gallery': GalleryImageSerializer(
+            GalleryImage.objects.order_by('-uploaded_at')[:limits['gallery']], many=True, context=context,
+        ).data,
+        'about': AboutSerializer(about).data if about else None,
+    }
+    return data, valid_until
+
+
+def home_payload(request):
+    """
+    The rendered JSON, cached as one unit per host (image URLs are absolute).
+    Any change to a model it shows bumps the version (see home/signals.py),
+    and the entry never outlives the current banner set.
+    """
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        cache.add(VERSION_KEY, version, None)
+        version = cache.get(VERSION_KEY, version)
+    key = f'home:api:{version}:{request.scheme}://{request.get_host()}'
+    payload = cache.get(key)
+    if payload is None:
+        data, valid_until = build(request)
+        payload = dumps(data)
+        timeout = settings.HOME_API_CACHE_TIMEOUT
+        if valid_until is not None:
+            timeout = max(1, min(timeout, int((valid_until - timezone.now()).total_seconds())))
+        cache.set(key, payload, timeout)
+    return payload
+
+
+def invalidate():
+    cache.set(VERSION_KEY, time.time_ns(), None)
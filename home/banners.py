@@ -0,0 +1,60 @@
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import Banner
+
+CACHE_KEY = 'home:active-banners'
+
+
+def start_of(day):
+    return timezone.make_aware(datetime.combine(day, time.min)) if settings.USE_TZ else datetime.combine(day, time.min)
+
+
+def resolve(today):
+    """
+    (banners shown on ``today``, first later day on which that set changes).
+    A banner shows from start_date through end_date inclusive; a missing date
+    leaves that side open. One query covers both answers.
+    """
+    candidates = Banner.objects.filter(is_active=True).filter(Q(end_date__isnull=True) | Q(end_date__gte=today))
+    active, boundaries = [], []
+    # Open-started banners first on every database (NULLs sort last by default on PostgreSQL)
+    for banner in candidates.order_by(F('start_date').asc(nulls_first=True), 'pk'):
+        if banner.start_date is not None and banner.start_date > today:
+            boundaries.append(banner.start_date)  # Starts later
+            continue
+        active.append(banner)
+        if banner.end_date is not None:
+            boundaries.append(banner.end_date + timedelta(days=1))  # Gone the day after end_date
+    return active, min(boundaries, default=None)
+
+
+def active_banners():
+    """
+    Banners to show right now. The set is computed once and cached until the
+    next start/end boundary (or until a banner is edited), so steady-state
+    home page hits cost no query.
+    """
+    return active_banners_until()[0]
+
+
+def active_banners_until():
+    """(active banners, when that set changes next or None)."""
+    now = timezone.now()
+    entry = cache.get(CACHE_KEY)
+    if entry is not None and (entry['valid_until'] is None or now < entry['valid_until']):
+        return entry['banners'], entry['valid_until']
+
+    banners, next_change = resolve(timezone.localdate(now))
+    valid_until = start_of(next_change) if next_change is not None else None
+    timeout = None if valid_until is None else max(1, int((valid_until - now).total_seconds()) + 1)
+    cache.set(CACHE_KEY, {'banners': banners, 'valid_until': valid_until}, timeout)
+    return banners, valid_until
+
+
+def invalidate():
+    cache.delete(CACHE_KEY)
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.15 on 2026-10-19 18:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='banner',
+            index=models.Index(fields=['is_active', 'start_date', 'end_date'], name='home_banner_schedule'),
+        ),
+    ]
@@ -13,6 +13,11 @@ class Banner(models.Model):
     start_date = models.DateField(blank=True, null=True, help_text="Date when the banner starts showing") # Optional start date
     end_date = models.DateField(blank=True, null=True, help_text="Date when the banner stops showing") # Optional end date
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['is_active', 'start_date', 'end_date'], name='home_banner_schedule'), # home/banners.py
+        ]
+
     def __str__(self):
         return self.title
     
@@ -0,0 +1,18 @@
+from rest_framework import serializers
+from blog.models import Post
+from blog.serializers import AuthorSerializer, TagSerializer
+from .models import Banner
+
+class BannerSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Banner
+        fields = '__all__'
+
+# Post card for the home page: no body or comments
+class HomePostSerializer(serializers.ModelSerializer):
+    author = AuthorSerializer(read_only=True)
+    tags = TagSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Post
+        fields = ['id', 'title', 'slug', 'author', 'image', 'tags', 'published_at']
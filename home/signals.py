@@ -0,0 +1,31 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from about.models import About
+from artists.models import Artist
+from blog.models import Post, Tag
+from gallery.models import GalleryImage
+from shop.models import Category, Product
+from . import api, banners
+from .models import Banner
+
+
+# Edits take effect right away instead of at the next schedule boundary
+@receiver(post_save, sender=Banner)
+@receiver(post_delete, sender=Banner)
+def banner_changed(sender, **kwargs):
+    banners.invalidate()
+
+
+# Anything shown by /api/home/ invalidates the cached payload
+HOME_MODELS = (Banner, Product, Category, Post, Tag, Artist, GalleryImage, About)
+
+
+def home_content_changed(sender, **kwargs):
+    api.invalidate()
+
+
+for model in HOME_MODELS:
+    post_save.connect(home_content_changed, sender=model, dispatch_uid=f'home-api-{model._meta.label_lower}')
+    post_delete.connect(home_content_changed, sender=model, dispatch_uid=f'home-api-delete-{model._meta.label_lower}')
+m2m_changed.connect(home_content_changed, sender=Post.tags.through, dispatch_uid='home-api-post-tags')
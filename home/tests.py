@@ -1,3 +1,128 @@
-from django.test import TestCase
+from datetime import date, datetime, timedelta, timezone
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from about.models import About
+from artists.models import Artist
+from blog.models import Post, Tag
+from shop.models import Category, Product
+from .api import VERSION_KEY
+from .banners import active_banners, active_banners_until, resolve
+from .models import Banner
 
 # Create your tests here.
+
+TODAY = date(2026, 3, 10)
+
+
+def at(day, hour=12):
+    return mock.patch('home.banners.timezone.now', return_value=datetime(day.year, day.month, day.day, hour, tzinfo=timezone.utc))
+
+
+class BannerScheduleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def banner(self, title, start=None, end=None, **kwargs):
+        return Banner.objects.create(title=title, image=f'banners/{title}.jpg', start_date=start, end_date=end, **kwargs)
+
+    def test_resolve(self):
+        always = self.banner('always')
+        ending = self.banner('ending', start=TODAY - timedelta(days=3), end=TODAY)
+        self.banner('ended', end=TODAY - timedelta(days=1))
+        self.banner('upcoming', start=TODAY + timedelta(days=5))
+        self.banner('hidden', is_active=False)
+        with self.assertNumQueries(1):
+            banners, next_change = resolve(TODAY)
+        self.assertEqual(banners, [always, ending])
+        self.assertEqual(next_change, TODAY + timedelta(days=1))  # The day after end_date
+        self.assertEqual(resolve(TODAY + timedelta(days=1))[1], TODAY + timedelta(days=5))
+        self.assertEqual(resolve(TODAY + timedelta(days=5))[1], None)
+
+    def test_cached_until_the_next_boundary(self):
+        self.banner('always')
+        self.banner('upcoming', start=TODAY + timedelta(days=2))
+        with at(TODAY):
+            banners, valid_until = active_banners_until()
+            self.assertEqual(valid_until, datetime(2026, 3, 12, tzinfo=timezone.utc))
+            with self.assertNumQueries(0):
+                self.assertEqual([banner.title for banner in active_banners()], ['always'])
+        with at(TODAY + timedelta(days=2), hour=0), self.assertNumQueries(1):
+            self.assertEqual([banner.title for banner in active_banners()], ['always', 'upcoming'])
+
+    def test_edits_take_effect_at_once(self):
+        banner = self.banner('always')
+        with at(TODAY):
+            self.assertEqual(active_banners(), [banner])
+            banner.is_active = False
+            banner.save()
+            self.assertEqual(active_banners(), [])
+            self.banner('new')
+            self.assertEqual([banner.title for banner in active_banners()], ['new'])
+
+    def test_home_page(self):
+        self.banner('spring', alt_text='Spring sale')
+        self.assertContains(self.client.get('/home/'), 'alt="Spring sale"')
+
+
+class HomeApiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        category = Category.objects.create(name='Oil', slug='oil')
+        author = User.objects.create_user('writer')
+        self.featured = Product.objects.create(name='Dawn', slug='dawn', price='10.00', category=category, featured=True)
+        Product.objects.create(name='Noon', slug='noon', price='10.00', category=category)
+        Product.objects.create(name='Gone', slug='gone', price='10.00', category=category, available=False)
+        post = Post.objects.create(title='Studio notes', slug='studio-notes', author=author, content='Long body')
+        post.tags.add(Tag.objects.create(name='studio', slug='studio'))
+        Artist.objects.create(name='Older', bio='-', image='artists/a.jpg')
+        Artist.objects.create(name='Newer', bio='-', image='artists/b.jpg')
+        About.objects.create(name='Fameuxarte', role='Gallery', bio='-', image='about/a.jpg')
+        Banner.objects.create(title='spring', image='banners/spring.jpg')
+        cache.clear()
+
+    def get(self, host='testserver'):
+        response = self.client.get('/api/home/', HTTP_HOST=host)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        return response.json()
+
+    def test_sections(self):
+        with self.assertNumQueries(9):
+            data = self.get()
+        self.assertEqual([banner['title'] for banner in data['banners']], ['spring'])
+        self.assertEqual([product['slug'] for product in data['featured_products']], ['dawn'])
+        self.assertEqual([product['slug'] for product in data['new_products']], ['noon', 'dawn'])
+        self.assertEqual(data['latest_posts'][0]['tags'][0]['slug'], 'studio')
+        self.assertNotIn('content', data['latest_posts'][0])
+        self.assertEqual([artist['name'] for artist in data['featured_artists']], ['Newer', 'Older'])  # None featured
+        self.assertEqual(data['about']['name'], 'Fameuxarte')
+        self.assertEqual(self.client.post('/api/home/').status_code, 405)
+
+    @override_settings(ALLOWED_HOSTS=['testserver', 'example.com'])
+    def test_cached_per_host_until_content_changes(self):
+        local = self.get()
+        self.assertTrue(local['banners'][0]['image'].startswith('http://testserver/'))
+        with self.assertNumQueries(0):
+            self.get()
+        with self.assertNumQueries(8):  # A separate entry (image URLs are absolute); banners stay cached
+            other = self.get('example.com')
+        self.assertTrue(other['banners'][0]['image'].startswith('http://example.com/'))
+        with self.assertNumQueries(0):
+            self.get('example.com')
+        version = cache.get(VERSION_KEY)
+        keys = [f'home:api:{version}:http://{host}' for host in ['testserver', 'example.com']]
+        self.assertEqual(len(cache.get_many(keys)), 2)
+
+        self.featured.name = 'Daybreak'
+        self.featured.save()
+        self.assertNotEqual(cache.get(VERSION_KEY), version)
+        for host in ['testserver', 'example.com']:
+            with self.assertNumQueries(8):  # Both hosts rebuild
+                self.assertEqual(self.get(host)['featured_products'][0]['name'], 'Daybreak')
+        older = Artist.objects.get(name='Older')
+        older.featured = True
+        older.save()
+        self.assertEqual([artist['name'] for artist in self.get()['featured_artists']], ['Older'])
@@ -1,6 +1,16 @@
+from django.http import HttpResponse
 from django.shortcuts import render
+from django.views.decorators.http import require_safe
+from .api import home_payload
+from .banners import active_banners
 
 # Create your views here.
 
 def home(request):
-    return render(request, 'home/home.html')
+    return render(request, 'home/home.html', {'banners': active_banners()})
+
+
+# Landing page data in one request (see home/api.py)
+@require_safe
+def home_api(request):
+    return HttpResponse(home_payload(request), content_type='application/json')
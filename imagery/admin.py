@@ -0,0 +1,14 @@
+from django.contrib import admin
+from .models import ImageFeatures
+
+@admin.register(ImageFeatures)
+class ImageFeaturesAdmin(admin.ModelAdmin):
+    list_display = ('kind', 'object_id', 'image', 'duplicate_count', 'updated_at')
+    list_filter = ('kind',)
+    search_fields = ('image',)
+    exclude = ('histogram', 'vector')
+    readonly_fields = ('kind', 'object_id', 'image', 'palette', 'phash', 'duplicates', 'updated_at')
+
+    @admin.display(description="Near-duplicates")
+    def duplicate_count(self, obj):
+        return len(obj.duplicates)
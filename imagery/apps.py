@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class ImageryConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'imagery'
+
+    def ready(self):
+        from . import signals  # noqa: F401
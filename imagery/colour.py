@@ -0,0 +1,71 @@
+from PIL import Image
+
+try:
+    import numpy as np
+except ImportError:  # Optional: colour indexing and search need `pip install numpy`
+    np = None
+
+LEVELS = 4  # per channel, so 4 * 4 * 4 = 64 histogram bins
+SAMPLE_SIZE = 64  # images are shrunk to fit 64x64 pixels before counting
+PALETTE_SIZE = 5
+SHIFT = 8 - (LEVELS - 1).bit_length()  # 256 / 4 levels -> drop the low 6 bits
+
+
+def open_sample(path):
+    """The image at ``path`` as RGB, decoded at a reduced scale where the format allows it (JPEG)."""
+    with Image.open(path) as image:
+        image.draft('RGB', (SAMPLE_SIZE * 2, SAMPLE_SIZE * 2))
+        image = image.convert('RGB')
+    image.thumbnail((SAMPLE_SIZE * 4, SAMPLE_SIZE * 4))  # Plenty for every feature, cheap to resample further
+    return image
+
+
+def sample_pixels(image):
+    """Pixels of a copy shrunk to fit SAMPLE_SIZE, as an (n, 3) uint8 array."""
+    image = image.copy()
+    image.thumbnail((SAMPLE_SIZE, SAMPLE_SIZE))
+    return np.asarray(image, dtype=np.uint8).reshape(-1, 3)
+
+
+def bin_indexes(pixels):
+    levels = (pixels >> SHIFT).astype(np.intp)
+    return (levels[:, 0] * LEVELS + levels[:, 1]) * LEVELS + levels[:, 2]
+
+
+def histogram(pixels):
+    counts = np.bincount(bin_indexes(pixels), minlength=LEVELS ** 3).astype(np.float32)
+    return counts / max(counts.sum(), 1)
+
+
+def palette(pixels, size=PALETTE_SIZE):
+    """The most common colour bins, each as the mean colour of its pixels, with their share."""
+    indexes = bin_indexes(pixels)
+    counts = np.bincount(indexes, minlength=LEVELS ** 3)
+    sums = np.stack([np.bincount(indexes, weights=pixels[:, c], minlength=LEVELS ** 3) for c in range(3)], axis=1)
+    top = [b for b in np.argsort(counts)[::-1][:size] if counts[b]]
+    return [
+        {'color': '#%02x%02x%02x' % tuple(int(round(v)) for v in sums[b] / counts[b]), 'weight': round(float(counts[b] / len(pixels)), 4)}
+        for b in top
+    ]
+
+
+def parse_colour(value):
+    value = value.strip().lstrip('#')
+    if len(value) == 3:
+        value = ''.join(c * 2 for c in value)
+    if len(value) != 6:
+        raise ValueError(f"Not a hex colour: {value!r}")
+    return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def query_vector(colours, spread=48.0):
+    """
+    Histogram-shaped weights for the requested colours: each bin counts by
+    how close its centre is to the nearest requested colour, so a search for
+    orange still finds mostly-amber paintings.
+    """
+    steps = (np.arange(LEVELS) + 0.5) * (256 / LEVELS)
+    centres = np.stack(np.meshgrid(steps, steps, steps, indexing='ij'), axis=-1).reshape(-1, 3)
+    wanted = np.asarray(colours, dtype=np.float32)
+    distances = ((centres[:, None, :] - wanted[None, :, :]) ** 2).sum(axis=-1)
+    return np.exp(-distances / (2 * spread ** 2)).max(axis=1).astype(np.float32)
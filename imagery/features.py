@@ -0,0 +1,26 @@
+from PIL import Image
+
+from .colour import histogram, open_sample, palette, sample_pixels
+from .hashing import feature_vector, phash
+
+
+def extract(path):
+    """
+    Everything ImageFeatures stores for the image at ``path``, from a single
+    decode, or None if the file can't be read. Runs in backfill worker
+    processes, so it must not touch the database.
+    """
+    try:
+        image = open_sample(path)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+    pixels = sample_pixels(image)
+    if not len(pixels):
+        return None
+    colours = histogram(pixels)
+    return {
+        'histogram': colours.tobytes(),
+        'palette': palette(pixels),
+        'phash': phash(image),
+        'vector': feature_vector(image, colours).tobytes(),
+    }
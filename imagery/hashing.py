@@ -0,0 +1,55 @@
+from PIL import Image
+
+from .colour import np
+
+HASH_SIZE = 8  # 8x8 low frequencies -> 64-bit hash
+DCT_SIZE = 32
+NEAR_DUPLICATE_DISTANCE = 6  # differing bits out of 64
+
+
+def dct_matrix(n):
+    k = np.arange(n)
+    matrix = np.cos(np.pi * (2 * k[None, :] + 1) * k[:, None] / (2 * n)) * np.sqrt(2 / n)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+_DCT = None
+
+
+def phash(image):
+    """
+    64-bit perceptual hash (DCT of a 32x32 greyscale copy, low frequencies
+    compared with their median) as a signed integer, so it fits a BigIntegerField.
+    Recompressed, resized or lightly edited copies differ in only a few bits.
+    """
+    global _DCT
+    if _DCT is None:
+        _DCT = dct_matrix(DCT_SIZE)
+    grey = np.asarray(image.convert('L').resize((DCT_SIZE, DCT_SIZE), Image.Resampling.LANCZOS), dtype=np.float64)
+    low = (_DCT @ grey @ _DCT.T)[:HASH_SIZE, :HASH_SIZE].ravel()
+    bits = low > np.median(low[1:])  # The DC term would skew the median
+    return int(np.packbits(bits).view('>i8')[0])
+
+
+def feature_vector(image, histogram):
+    """
+    Unit-length 128-float vector: the layout of an 8x8 greyscale copy plus the
+    square-rooted colour histogram, equally weighted, so a dot product is a
+    cosine similarity.
+    """
+    layout = np.asarray(image.convert('L').resize((HASH_SIZE, HASH_SIZE), Image.Resampling.BOX), dtype=np.float32).ravel()
+    layout -= layout.mean()
+    if np.linalg.norm(layout):  # A flat image has no layout to compare
+        layout /= np.linalg.norm(layout)
+    colours = np.sqrt(histogram).astype(np.float32)  # Already unit length, the histogram sums to 1
+    vector = np.concatenate([layout, colours])
+    return vector / np.linalg.norm(vector)
+
+
+def hamming_distances(hashes, value):
+    """Bits that differ between each signed 64-bit hash in ``hashes`` and ``value``."""
+    diff = (hashes ^ np.int64(value)).view(np.uint64)
+    if hasattr(np, 'bitwise_count'):  # NumPy 2
+        return np.bitwise_count(diff)
+    return np.unpackbits(diff.view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1)
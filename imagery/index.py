@@ -0,0 +1,166 @@
+import threading
+import time
+from datetime import timedelta
+
+from django.core.cache import cache
+
+from .colour import np
+from .hashing import NEAR_DUPLICATE_DISTANCE, hamming_distances
+from .models import ImageFeatures
+
+# Each process keeps the stored features of every kind in NumPy arrays. Writes bump
+# VERSION_KEY and the next lookup in each process fetches just the rows changed since
+# its last load; deletes bump EPOCH_KEY, which forces a full reload.
+VERSION_KEY = 'imagery:features-version'
+EPOCH_KEY = 'imagery:features-epoch'
+CLOCK_MARGIN = timedelta(seconds=60)  # Re-read rows saved slightly before the last load, in case of late commits
+HISTOGRAM_SIZE = 64
+VECTOR_SIZE = 128
+
+_lock = threading.Lock()
+_loaded = {'version': None, 'epoch': None, 'since': None, 'kinds': {}}
+
+
+class KindIndex:
+    """Features of one kind: row i of every array belongs to ids[i]."""
+
+    def __init__(self):
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.histograms = np.zeros((0, HISTOGRAM_SIZE), dtype=np.float32)
+        self.vectors = np.zeros((0, VECTOR_SIZE), dtype=np.float32)
+        self.hashes = np.zeros(0, dtype=np.int64)
+        self.positions = {}
+
+    def update(self, rows):
+        """Replace or append ``[(object_id, histogram, vector, phash), ...]``."""
+        new = []
+        for object_id, histogram, vector, phash in rows:
+            histogram = np.frombuffer(bytes(histogram), dtype=np.float32)
+            vector = np.frombuffer(bytes(vector), dtype=np.float32) if vector else np.zeros(VECTOR_SIZE, np.float32)
+            phash = phash if phash is not None else 0  # 0: not hashed yet (or a flat image), never matched
+            position = self.positions.get(object_id)
+            if position is None:
+                new.append((object_id, histogram, vector, phash))
+            else:
+                self.histograms[position], self.vectors[position], self.hashes[position] = histogram, vector, phash
+        if new:
+            start = len(self.ids)
+            self.ids = np.concatenate([self.ids, np.array([row[0] for row in new], dtype=np.int64)])
+            self.histograms = np.vstack([self.histograms, np.stack([row[1] for row in new])])
+            self.vectors = np.vstack([self.vectors, np.stack([row[2] for row in new])])
+            self.hashes = np.concatenate([self.hashes, np.array([row[3] for row in new], dtype=np.int64)])
+            self.positions.update((row[0], start + i) for i, row in enumerate(new))
+
+
+def bump_version(deleted=False):
+    """Tell every process to refresh its index on the next lookup (fully after deletes)."""
+    cache.set(VERSION_KEY, time.time_ns(), None)
+    if deleted:
+        cache.set(EPOCH_KEY, time.time_ns(), None)
+
+
+def store(kind, results):
+    """
+    Upsert ``[(object_id, image name, features dict or None), ...]`` in one
+    statement, then record which already indexed images each one nearly duplicates.
+    """
+    rows = [
+        ImageFeatures(
+            kind=kind, object_id=object_id, image=image, histogram=features['histogram'], palette=features['palette'],
+            phash=features['phash'], vector=features['vector'], duplicates=[],
+        )
+        for object_id, image, features in results if features is not None
+    ]
+    if not rows:
+        return 0
+    ImageFeatures.objects.bulk_create(
+        rows, update_conflicts=True, unique_fields=['kind', 'object_id'],
+        update_fields=['image', 'histogram', 'palette', 'phash', 'vector', 'duplicates', 'updated_at'],
+    )
+    bump_version()
+    for row in rows:
+        duplicates = near_duplicates(row.phash, exclude=(kind, row.object_id))
+        if duplicates:
+            ImageFeatures.objects.filter(kind=kind, object_id=row.object_id).update(duplicates=duplicates)
+    return len(rows)
+
+
+def load():
+    """kind -> KindIndex, brought up to date with the database when something changed."""
+    keys = cache.get_many([VERSION_KEY, EPOCH_KEY])
+    version, epoch = keys.get(VERSION_KEY), keys.get(EPOCH_KEY)
+    if version is not None and _loaded['version'] == version and _loaded['epoch'] == epoch:
+        return _loaded['kinds']
+    with _lock:
+        keys = cache.get_many([VERSION_KEY, EPOCH_KEY])
+        version, epoch = keys.get(VERSION_KEY), keys.get(EPOCH_KEY)
+        if version is not None and _loaded['version'] == version and _loaded['epoch'] == epoch:
+            return _loaded['kinds']
+        if version is None:
+            bump_version()
+            version = cache.get(VERSION_KEY)
+        rows = ImageFeatures.objects.all()
+        if _loaded['epoch'] == epoch and _loaded['since'] is not None:
+            kinds = _loaded['kinds']
+            rows = rows.filter(updated_at__gte=_loaded['since'] - CLOCK_MARGIN)
+        else:
+            kinds = {}
+        since = None
+        for kind, object_id, histogram, vector, phash, updated_at in (
+            rows.order_by('updated_at')
+            .values_list('kind', 'object_id', 'histogram', 'vector', 'phash', 'updated_at')
+            .iterator(chunk_size=5000)
+        ):
+            kinds.setdefault(kind, KindIndex()).update([(object_id, histogram, vector, phash)])
+            since = updated_at
+        _loaded.update(kinds=kinds, version=version, epoch=epoch, since=since or _loaded['since'])
+    return _loaded['kinds']
+
+
+def top(scores, limit, exclude=None):
+    """Positions of the ``limit`` highest scores, best first (skipping position ``exclude``)."""
+    if exclude is not None:
+        scores = scores.copy()
+        scores[exclude] = -np.inf
+    limit = min(limit, len(scores) - (exclude is not None))
+    if limit <= 0:
+        return np.zeros(0, dtype=np.intp)
+    best = np.argpartition(-scores, limit - 1)[:limit]
+    return best[np.argsort(-scores[best])]
+
+
+def nearest(kind, vector, limit):
+    """(object ids, scores) of the images whose colour histogram scores highest against ``vector``."""
+    index = load().get(kind)
+    if index is None or not len(index.ids):
+        return [], []
+    scores = index.histograms @ vector
+    best = top(scores, limit)
+    return index.ids[best].tolist(), scores[best].tolist()
+
+
+def similar(kind, object_id, limit):
+    """(object ids, cosine similarities) of the images that look most like ``object_id``."""
+    index = load().get(kind)
+    position = index.positions.get(object_id) if index is not None else None
+    if position is None:
+        return [], []
+    scores = index.vectors @ index.vectors[position]
+    best = top(scores, limit, exclude=position)
+    return index.ids[best].tolist(), scores[best].tolist()
+
+
+def near_duplicates(phash, exclude=None, max_distance=NEAR_DUPLICATE_DISTANCE):
+    """``[{"kind", "id", "distance"}]`` of every indexed image whose hash is within ``max_distance`` bits."""
+    found = []
+    if not phash:
+        return found
+    for kind, index in load().items():
+        if not len(index.ids):
+            continue
+        distances = hamming_distances(index.hashes, phash)
+        for position in np.flatnonzero(distances <= max_distance):
+            object_id = int(index.ids[position])
+            if (kind, object_id) != exclude and index.hashes[position]:
+                found.append({'kind': kind, 'id': object_id, 'distance': int(distances[position])})
+    return sorted(found, key=lambda match: match['distance'])
@@ -0,0 +1,56 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from imagery.colour import np
+from imagery.features import extract
+from imagery.index import store
+from imagery.models import ImageFeatures
+from imagery.sources import SOURCES, source_model
+
+
+class Command(BaseCommand):
+    help = "Compute colour histograms, palettes, perceptual hashes and similarity vectors for every image that has none or stale ones."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--kind', choices=sorted(SOURCES), action='append', help="Default: all kinds.")
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--force', action='store_true', help="Recompute images that are already indexed.")
+
+    def handle(self, *args, **options):
+        if np is None:
+            raise CommandError("Image indexing needs NumPy (`pip install numpy`).")
+        kinds = options['kind'] or sorted(SOURCES)
+        pending = {kind: self.pending(kind, options['force']) for kind in kinds}
+        connections.close_all()  # Worker processes never touch the database
+
+        with ProcessPoolExecutor(max_workers=options['workers']) as pool:
+            for kind, items in pending.items():
+                stored = failed = 0
+                for start in range(0, len(items), options['batch_size']):
+                    batch = items[start:start + options['batch_size']]
+                    paths = [path for _, _, path in batch]
+                    features = list(pool.map(extract, paths, chunksize=max(1, len(paths) // (options['workers'] * 4))))
+                    written = store(kind, [(pk, name, result) for (pk, name, _), result in zip(batch, features)])
+                    stored += written
+                    failed += len(batch) - written
+                    self.stdout.write(f"{kind}: {start + len(batch)}/{len(items)}")
+                self.stdout.write(self.style.SUCCESS(f"{kind}: indexed {stored} image(s), {failed} unreadable."))
+
+    def pending(self, kind, force):
+        model = source_model(kind)
+        field = SOURCES[kind][1]
+        done = {} if force else dict(
+            ImageFeatures.objects.filter(kind=kind, phash__isnull=False)  # Rows from before hashing are stale
+            .values_list('object_id', 'image').iterator(chunk_size=5000)
+        )
+        storage = model._meta.get_field(field).storage
+        items = []
+        rows = model.objects.exclude(**{field: ''}).exclude(**{f'{field}__isnull': True}).values_list('pk', field)
+        for pk, name in rows.iterator(chunk_size=5000):
+            if done.get(pk) != name:
+                items.append((pk, name, storage.path(name)))
+        return items
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.15 on 2026-10-19 19:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageFeatures',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('image', models.CharField(max_length=255)),
+                ('histogram', models.BinaryField()),
+                ('palette', models.JSONField(default=list)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Image features',
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='imagery_features_unique_object')],
+            },
+        ),
+    ]
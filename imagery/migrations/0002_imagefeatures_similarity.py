@@ -0,0 +1,28 @@
+# Generated by Django 5.1.15 on 2026-10-19 19:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('imagery', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='imagefeatures',
+            name='duplicates',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='imagefeatures',
+            name='phash',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='imagefeatures',
+            name='vector',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import models
+
+# Create your models here.
+
+class ImageFeatures(models.Model):
+    """Precomputed features of one indexed image (see imagery/sources.py for the kinds)."""
+    kind = models.CharField(max_length=20) # "gallery" or "product"
+    object_id = models.PositiveBigIntegerField()
+    image = models.CharField(max_length=255) # Image name the features were computed from; stale once it changes
+    histogram = models.BinaryField() # 64 float32 bins (RGB, 4 levels per channel) that sum to 1
+    palette = models.JSONField(default=list) # Dominant colours: [{"color": "#aabbcc", "weight": 0.31}, ...]
+    phash = models.BigIntegerField(blank=True, null=True) # 64-bit perceptual hash (imagery/hashing.py)
+    vector = models.BinaryField(blank=True, null=True) # 128 float32, unit length, for "similar artworks"
+    duplicates = models.JSONField(default=list, blank=True) # Near-identical images found at ingest: [{"kind", "id", "distance"}]
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "Image features"
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='imagery_features_unique_object'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id}"
@@ -0,0 +1,27 @@
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+from .index import bump_version
+from .models import ImageFeatures
+from .sources import SOURCES, kind_of
+from .tasks import index_image
+
+
+# New or replaced images are indexed by the job worker, not in the request
+def queue_indexing(sender, instance, **kwargs):
+    kind, field = kind_of(sender)
+    file = getattr(instance, field)
+    if file and not ImageFeatures.objects.filter(kind=kind, object_id=instance.pk, image=file.name, phash__isnull=False).exists():
+        index_image.enqueue(args=[kind, instance.pk], unique_key=f'imagery-{kind}-{instance.pk}')
+
+
+def drop_features(sender, instance, **kwargs):
+    kind, _ = kind_of(sender)
+    if ImageFeatures.objects.filter(kind=kind, object_id=instance.pk).delete()[0]:
+        bump_version(deleted=True)
+
+
+for kind, (label, _, _) in SOURCES.items():
+    model = apps.get_model(label)
+    post_save.connect(queue_indexing, sender=model, dispatch_uid=f'imagery-save-{kind}')
+    post_delete.connect(drop_features, sender=model, dispatch_uid=f'imagery-delete-{kind}')
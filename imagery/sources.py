@@ -0,0 +1,23 @@
+from django.apps import apps
+from django.utils.module_loading import import_string
+
+# Images that get indexed: kind -> (model, image field, serializer for search results)
+SOURCES = {
+    'gallery': ('gallery.GalleryImage', 'image', 'gallery.serializers.GalleryImageSerializer'),
+    'product': ('shop.Product', 'image', 'shop.serializers.ProductSerializer'),
+}
+
+
+def source_model(kind):
+    return apps.get_model(SOURCES[kind][0])
+
+
+def source_serializer(kind):
+    return import_string(SOURCES[kind][2])
+
+
+def kind_of(model):
+    for kind, (label, field, _) in SOURCES.items():
+        if model._meta.label == label:
+            return kind, field
+    return None, None
@@ -0,0 +1,17 @@
+from jobs.registry import task
+from .colour import np
+from .features import extract
+from .index import store
+from .sources import SOURCES, source_model
+
+
+@task(priority=-5)
+def index_image(kind, object_id):
+    """Compute and store the features of one image (queued when an image is uploaded or replaced)."""
+    if np is None:
+        return
+    obj = source_model(kind).objects.filter(pk=object_id).first()
+    file = getattr(obj, SOURCES[kind][1], None) if obj is not None else None
+    if not file:
+        return
+    store(kind, [(object_id, file.name, extract(file.path))])
@@ -0,0 +1,97 @@
+import shutil
+import tempfile
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from PIL import Image, ImageDraw
+
+from gallery.models import GalleryImage
+from jobs.models import Job
+from shop.models import Category
+from .index import bump_version, similar
+from .models import ImageFeatures
+from .tasks import index_image
+
+
+def painting(colour, stripes=4, shift=0):
+    """A striped image: same colour and stripes look alike, ``shift`` nudges it a few pixels."""
+    image = Image.new('RGB', (96, 96), 'white')
+    draw = ImageDraw.Draw(image)
+    width = 96 // (stripes * 2)
+    for x in range(shift, 96, width * 2):
+        draw.rectangle([x, 0, x + width - 1, 95], fill=colour)
+    buffer = BytesIO()
+    image.save(buffer, 'PNG')
+    return ContentFile(buffer.getvalue(), name='painting.png')
+
+
+class ImageryTestCase(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        settings = override_settings(MEDIA_ROOT=self.media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        bump_version(deleted=True)  # Rows of earlier tests were rolled back: reload from scratch
+
+    def indexed(self, title, image):
+        obj = GalleryImage.objects.create(title=title, image=image)
+        index_image('gallery', obj.pk)
+        return obj
+
+
+class IndexingSignalTests(ImageryTestCase):
+    def test_saving_a_source_queues_one_job(self):
+        obj = GalleryImage.objects.create(title='Red', image=painting('red'))
+        obj.save()
+        self.assertEqual(Job.objects.filter(unique_key=f'imagery-gallery-{obj.pk}').count(), 1)
+
+    def test_other_models_queue_nothing(self):
+        Category.objects.create(name='Oil', slug='oil')
+        self.assertFalse(Job.objects.exists())
+
+    def test_deleting_a_source_drops_its_features(self):
+        obj = self.indexed('Red', painting('red'))
+        self.assertTrue(ImageFeatures.objects.filter(kind='gallery', object_id=obj.pk).exists())
+        obj.delete()
+        self.assertFalse(ImageFeatures.objects.exists())
+
+
+class ColourSearchTests(ImageryTestCase):
+    def test_closest_colour_first(self):
+        red = self.indexed('Red', painting('#c0392b'))
+        blue = self.indexed('Blue', painting('#2c3e50'))
+        response = self.client.get('/api/imagery/colour-search/', {'colour': 'c0392b', 'kind': 'gallery'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['gallery']['id'] for item in response.json()], [red.pk, blue.pk])
+        self.assertTrue(response.json()[0]['palette'])
+
+    def test_bad_requests(self):
+        self.assertEqual(self.client.get('/api/imagery/colour-search/').status_code, 400)
+        self.assertEqual(self.client.get('/api/imagery/colour-search/', {'colour': 'zz'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/imagery/colour-search/', {'colour': 'fff', 'kind': 'x'}).status_code, 400)
+
+
+class SimilarImagesTests(ImageryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.original = self.indexed('Original', painting('red'))
+        self.copy = self.indexed('Copy', painting('red'))
+        self.other = self.indexed('Other', painting('navy', stripes=1, shift=30))
+
+    def test_most_similar_first(self):
+        ids, scores = similar('gallery', self.original.pk, 5)
+        self.assertEqual(ids, [self.copy.pk, self.other.pk])
+        self.assertGreater(scores[0], scores[1])
+
+    def test_detail_view_adds_similar(self):
+        response = self.client.get(f'/api/gallery/gallery/{self.original.pk}/', {'similar': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['gallery']['id'] for item in response.json()['similar']], [self.copy.pk])
+
+    def test_near_duplicates_are_recorded(self):
+        features = ImageFeatures.objects.get(kind='gallery', object_id=self.copy.pk)
+        self.assertEqual([match['id'] for match in features.duplicates], [self.original.pk])
+        other = ImageFeatures.objects.get(kind='gallery', object_id=self.other.pk)
+        self.assertEqual(other.duplicates, [])
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import colour_search
+
+urlpatterns = [
+    path('colour-search/', colour_search, name='colour-search'),
+]
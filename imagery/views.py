@@ -0,0 +1,71 @@
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from .colour import np, parse_colour, query_vector
+from .index import nearest, similar
+from .models import ImageFeatures
+from .sources import SOURCES, source_model, source_serializer
+
+MAX_RESULTS = 100
+
+# Search by colour: /api/imagery/colour-search/?colour=c0392b[,f1c40f]&kind=gallery&limit=24
+# Scores come from the precomputed histograms held in memory, no image is opened per request.
+@api_view(['GET'])
+def colour_search(request):
+    if np is None:
+        return Response({'detail': "Colour search is not available."}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+    kind = request.query_params.get('kind', 'gallery')
+    if kind not in SOURCES:
+        return Response({'detail': f"kind must be one of {', '.join(sorted(SOURCES))}."}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        colours = [parse_colour(value) for value in request.query_params.get('colour', '').split(',') if value.strip()]
+        limit = min(int(request.query_params.get('limit', 24)), MAX_RESULTS)
+    except ValueError as e:
+        return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    if not colours or limit < 1:
+        return Response({'detail': "Pass one or more hex colours, e.g. ?colour=c0392b."}, status=status.HTTP_400_BAD_REQUEST)
+
+    ids, scores = nearest(kind, query_vector(colours), limit)
+    objects = source_model(kind).objects.in_bulk(ids)
+    palettes = dict(ImageFeatures.objects.filter(kind=kind, object_id__in=ids).values_list('object_id', 'palette'))
+    serializer = source_serializer(kind)
+    results = [
+        {
+            'score': round(score, 4),
+            'palette': palettes.get(pk, []),
+            kind: serializer(objects[pk], context={'request': request}).data,
+        }
+        for pk, score in zip(ids, scores) if pk in objects
+    ]
+    return Response(results)
+
+
+class SimilarImagesMixin:
+    """
+    For detail views of an indexed model: ?similar=K adds the K most similar
+    images to the response as ``similar: [{"score": ..., <kind>: {...}}, ...]``,
+    rendered with the view's own serializer (so ?fields= applies to them too).
+    """
+
+    similar_kind = None
+
+    def get_object(self):
+        self.object = super().get_object()  # Kept for the lookup below, whatever the URL addressed it by
+        return self.object
+
+    def retrieve(self, request, *args, **kwargs):
+        response = super().retrieve(request, *args, **kwargs)
+        if 'similar' not in request.query_params or np is None:
+            return response
+        try:
+            limit = min(int(request.query_params['similar'] or 6), MAX_RESULTS)
+        except ValueError:
+            return Response({'detail': "similar must be a number."}, status=status.HTTP_400_BAD_REQUEST)
+        ids, scores = similar(self.similar_kind, self.object.pk, limit)
+        objects = self.get_queryset().in_bulk(ids)
+        found = [(objects[pk], score) for pk, score in zip(ids, scores) if pk in objects]
+        data = self.get_serializer([obj for obj, _ in found], many=True).data
+        response.data['similar'] = [
+            {'score': round(score, 4), self.similar_kind: item} for (_, score), item in zip(found, data)
+        ]
+        return response
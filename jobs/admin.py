@@ -0,0 +1,64 @@
+from django.contrib import admin, messages
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+from fameuxarte.admin_tools import EstimatedCountPaginator
+from .models import Job
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('name', 'status', 'priority', 'run_at', 'attempts', 'max_attempts', 'created_at', 'finished_at')
+    list_filter = ('status', 'name')
+    search_fields = ('name', 'unique_key')
+    readonly_fields = ('locked_by', 'locked_at', 'created_at', 'finished_at', 'last_error')
+    actions = ['retry_now', 'cancel']
+    paginator = EstimatedCountPaginator  # Finished jobs pile up until prune_jobs runs
+    show_full_result_count = False
+
+    def changelist_view(self, request, extra_context=None):
+        # Queue depth at a glance
+        depth = Job.objects.aggregate(
+            due=Count('pk', filter=Q(status=Job.QUEUED, run_at__lte=timezone.now())),
+            scheduled=Count('pk', filter=Q(status=Job.QUEUED, run_at__gt=timezone.now())),
+            running=Count('pk', filter=Q(status=Job.RUNNING)),
+            failed=Count('pk', filter=Q(status=Job.FAILED)),
+        )
+        title = "Jobs ({due} due, {scheduled} scheduled, {running} running, {failed} failed)".format(**depth)
+        extra_context = {**(extra_context or {}), 'title': title}
+        return super().changelist_view(request, extra_context)
+
+    @admin.action(description="Retry selected jobs now")
+    def retry_now(self, request, queryset):
+        # A finished job can't go back in the queue while another job holds its unique_key
+        candidates = queryset.exclude(status=Job.RUNNING)
+        keyed = candidates.exclude(status=Job.QUEUED).filter(unique_key__isnull=False)
+        taken = set(
+            Job.objects.filter(status__in=[Job.QUEUED, Job.RUNNING], unique_key__in=keyed.values('unique_key'))
+            .values_list('unique_key', flat=True)
+        )
+        retry, skipped = [], 0
+        for pk, key in keyed.order_by('-created_at').values_list('pk', 'unique_key'):
+            if key in taken:
+                skipped += 1
+            else:
+                taken.add(key)  # The newest selected job of each key is retried
+                retry.append(pk)
+        try:
+            with transaction.atomic():
+                updated = candidates.filter(Q(unique_key__isnull=True) | Q(status=Job.QUEUED) | Q(pk__in=retry)).update(
+                    status=Job.QUEUED, run_at=timezone.now(), attempts=0, finished_at=None,
+                )
+        except IntegrityError:  # A job with one of the keys was queued meanwhile
+            self.message_user(request, "A job with the same unique key was just queued; try again.", messages.WARNING)
+            return
+        message = f"{updated} job(s) queued."
+        if skipped:
+            message += f" {skipped} skipped: a job with the same unique key is already queued or running."
+        self.message_user(request, message)
+
+    @admin.action(description="Cancel selected queued jobs")
+    def cancel(self, request, queryset):
+        updated = queryset.filter(status=Job.QUEUED).update(
+            status=Job.FAILED, last_error='Cancelled', finished_at=timezone.now(),
+        )
+        self.message_user(request, f"{updated} job(s) cancelled.")
@@ -0,0 +1,20 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from jobs.models import Job
+
+
+class Command(BaseCommand):
+    help = "Delete finished jobs older than --days (failed ones only with --failed)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=7)
+        parser.add_argument('--failed', action='store_true', help="Also delete failed jobs.")
+
+    def handle(self, *args, **options):
+        statuses = [Job.DONE, Job.FAILED] if options['failed'] else [Job.DONE]
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        deleted, _ = Job.objects.filter(status__in=statuses, finished_at__lt=cutoff).delete()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} job(s)."))
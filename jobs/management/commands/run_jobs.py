@@ -0,0 +1,46 @@
+import os
+import signal
+import socket
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from jobs.worker import requeue_stale, work
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs with a pool of worker threads until stopped (Ctrl+C / SIGTERM)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=settings.JOBS_WORKERS)
+        parser.add_argument('--poll-interval', type=float, default=1.0, help="Seconds to sleep when the queue is empty.")
+        parser.add_argument('--once', action='store_true', help="Exit once no due jobs are left.")
+
+    def handle(self, *args, **options):
+        stop = threading.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: stop.set())  # Finish the current jobs, then exit
+
+        prefix = f'{socket.gethostname()}:{os.getpid()}'
+        threads = [
+            threading.Thread(
+                target=work, args=(f'{prefix}:{n}', stop, options['poll_interval'], options['once']),
+                name=f'job-worker-{n}', daemon=True,
+            )
+            for n in range(options['workers'])
+        ]
+        requeue_stale()
+        for thread in threads:
+            thread.start()
+        self.stdout.write(f"Running jobs with {len(threads)} worker(s)")
+
+        last_check = time.monotonic()
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=1)
+            if time.monotonic() - last_check > settings.JOBS_TIMEOUT / 2:
+                requeue_stale()
+                last_check = time.monotonic()
+        self.stdout.write("Workers stopped")
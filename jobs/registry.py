@@ -0,0 +1,63 @@
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+_tasks = {}
+
+
+class Task:
+    """A function that can run in the background: ``func.delay(...)`` queues it for ``run_jobs``."""
+
+    def __init__(self, func, name, priority=0, max_attempts=5):
+        self.func = func
+        self.name = name
+        self.priority = priority
+        self.max_attempts = max_attempts
+
+    def __call__(self, *args, **kwargs):
+        return self.func(*args, **kwargs)
+
+    def delay(self, *args, **kwargs):
+        return self.enqueue(args=args, kwargs=kwargs)
+
+    def enqueue(self, args=(), kwargs=None, priority=None, run_at=None, delay=None, unique_key=None):
+        """
+        Queue one run. Arguments must be JSON serializable (pass ids, not
+        model instances). ``run_at``/``delay`` schedule it for later. With
+        ``unique_key``, an identical job that is still queued or running is
+        returned instead of adding another one.
+        """
+        from .models import Job
+
+        if delay is not None:
+            run_at = timezone.now() + (delay if isinstance(delay, timedelta) else timedelta(seconds=delay))
+        job = Job(
+            name=self.name, args=list(args), kwargs=kwargs or {},
+            priority=self.priority if priority is None else priority,
+            max_attempts=self.max_attempts, run_at=run_at or timezone.now(), unique_key=unique_key,
+        )
+        if unique_key is None:
+            job.save()
+            return job
+        try:
+            with transaction.atomic():
+                job.save()
+        except IntegrityError:
+            return Job.objects.filter(unique_key=unique_key, status__in=[Job.QUEUED, Job.RUNNING]).first()
+        return job
+
+
+def task(func=None, *, name=None, priority=0, max_attempts=5):
+    """Register a background task; the name defaults to "<app>.<function>"."""
+
+    def register(func):
+        task_name = name or f"{func.__module__.split('.')[0]}.{func.__name__}"
+        _tasks[task_name] = Task(func, task_name, priority, max_attempts)
+        return _tasks[task_name]
+
+    return register(func) if func is not None else register
+
+
+def get_task(name):
+    return _tasks[name]
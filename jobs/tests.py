@@ -0,0 +1,102 @@
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from .models import Job
+from .registry import task
+from .worker import claim, requeue_stale, run, work
+
+# Create your tests here.
+
+calls = []
+
+
+@task(name='jobs.tests.record', max_attempts=2)
+def record(value):
+    calls.append(value)
+
+
+@task(name='jobs.tests.explode', max_attempts=2)
+def explode():
+    raise RuntimeError('boom')
+
+
+class WorkLoopTests(TransactionTestCase):  # work() closes connections that are inside a transaction
+    def setUp(self):
+        calls.clear()
+
+    def test_jobs_run_by_priority(self):
+        record.enqueue(args=['low'])
+        record.enqueue(args=['high'], priority=10)
+        record.enqueue(args=['later'], delay=60)
+        work('test', threading.Event(), poll_interval=0, once=True)
+        self.assertEqual(calls, ['high', 'low'])
+        self.assertEqual(Job.objects.filter(status=Job.DONE).count(), 2)
+        self.assertEqual(Job.objects.get(status=Job.QUEUED).args, ['later'])
+
+
+class WorkerTests(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_unique_key_while_pending(self):
+        first = record.enqueue(args=[1], unique_key='only-one')
+        self.assertEqual(record.enqueue(args=[2], unique_key='only-one'), first)
+        run(claim('test'))
+        self.assertNotEqual(record.enqueue(args=[3], unique_key='only-one'), first)  # Done jobs free the key
+
+    def test_failures_back_off_then_fail(self):
+        job = explode.delay()
+        with self.assertLogs('jobs.worker', 'WARNING'):
+            self.assertFalse(run(claim('test')))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.QUEUED, 1))
+        self.assertGreater(job.run_at, timezone.now())
+        self.assertIn('boom', job.last_error)
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        with self.assertLogs('jobs.worker', 'WARNING'):
+            run(claim('test'))
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+
+    def test_stale_jobs_are_requeued(self):
+        job = record.delay('x')
+        claim('test')
+        Job.objects.filter(pk=job.pk).update(locked_at=timezone.now() - timedelta(days=1))
+        self.assertEqual(requeue_stale(), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.QUEUED)
+
+
+@override_settings(STORAGES={
+    **settings.STORAGES, 'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+})  # No collectstatic manifest in tests
+class JobAdminTests(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'pw'))
+
+    def failed(self, key):
+        return Job.objects.create(name='jobs.tests.record', status=Job.FAILED, unique_key=key, finished_at=timezone.now())
+
+    def test_changelist(self):
+        self.failed(None)
+        response = self.client.get('/admin/jobs/job/')
+        self.assertContains(response, '0 due, 0 scheduled, 0 running, 1 failed')
+
+    def test_retry_skips_keys_already_queued(self):
+        plain = self.failed(None)
+        blocked = self.failed('report')
+        Job.objects.create(name='jobs.tests.record', unique_key='report')  # Queued
+        older, newer = self.failed('digest'), self.failed('digest')
+        response = self.client.post('/admin/jobs/job/', {
+            'action': 'retry_now', '_selected_action': [plain.pk, blocked.pk, older.pk, newer.pk],
+        }, follow=True)
+        self.assertContains(response, '2 job(s) queued. 2 skipped')
+        statuses = dict(Job.objects.values_list('pk', 'status'))
+        self.assertEqual(statuses[plain.pk], Job.QUEUED)
+        self.assertEqual(statuses[blocked.pk], Job.FAILED)
+        self.assertEqual((statuses[older.pk], statuses[newer.pk]), (Job.FAILED, Job.QUEUED))
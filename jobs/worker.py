@@ -0,0 +1,87 @@
+import logging
+import random
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+from .registry import get_task
+
+logger = logging.getLogger(__name__)
+
+
+def claim(worker_id):
+    """Lock the most urgent due job for this worker, or return None."""
+    now = timezone.now()
+    due = Job.objects.filter(status=Job.QUEUED, run_at__lte=now).order_by('-priority', 'run_at')
+    with transaction.atomic():
+        if connection.features.has_select_for_update_skip_locked:
+            due = due.select_for_update(skip_locked=True)  # Other workers skip rows this one holds
+        job = due.first()
+        if job is None:
+            return None
+        # The status condition keeps two workers from claiming the same job where SKIP LOCKED is not available
+        claimed = Job.objects.filter(pk=job.pk, status=Job.QUEUED).update(
+            status=Job.RUNNING, locked_by=worker_id, locked_at=now, attempts=F('attempts') + 1,
+        )
+    if not claimed:
+        return None
+    job.refresh_from_db()
+    return job
+
+
+def backoff(attempts):
+    """Seconds to wait before the next attempt: exponential, capped, with some jitter."""
+    delay = min(settings.JOBS_RETRY_MAX_DELAY, settings.JOBS_RETRY_BASE_DELAY * 2 ** (attempts - 1))
+    return delay * random.uniform(0.8, 1.2)
+
+
+def run(job):
+    try:
+        get_task(job.name)(*job.args, **job.kwargs)
+    except Exception:
+        error = traceback.format_exc()
+        logger.warning("Job %s failed (attempt %s of %s)", job, job.attempts, job.max_attempts)
+        if job.attempts < job.max_attempts:
+            Job.objects.filter(pk=job.pk).update(
+                status=Job.QUEUED, last_error=error, locked_by='', locked_at=None,
+                run_at=timezone.now() + timedelta(seconds=backoff(job.attempts)),
+            )
+        else:
+            Job.objects.filter(pk=job.pk).update(status=Job.FAILED, last_error=error, finished_at=timezone.now())
+        return False
+    Job.objects.filter(pk=job.pk).update(status=Job.DONE, finished_at=timezone.now())
+    return True
+
+
+def requeue_stale():
+    """Put back jobs whose worker died mid-run (running for longer than JOBS_TIMEOUT)."""
+    cutoff = timezone.now() - timedelta(seconds=settings.JOBS_TIMEOUT)
+    stale = Job.objects.filter(status=Job.RUNNING, locked_at__lt=cutoff)
+    failed = stale.filter(attempts__gte=F('max_attempts')).update(
+        status=Job.FAILED, last_error='Timed out', finished_at=timezone.now(),
+    )
+    return failed + stale.update(status=Job.QUEUED, locked_by='', locked_at=None, last_error='Timed out')
+
+
+def work(worker_id, stop, poll_interval, once=False):
+    """Run jobs until ``stop`` (a threading.Event) is set, or the queue is empty with ``once``."""
+    while not stop.is_set():
+        close_old_connections()
+        try:
+            job = claim(worker_id)
+        except Exception:  # e.g. the database went away; keep the worker alive and try again
+            logger.exception("Could not claim a job")
+            stop.wait(poll_interval)
+            continue
+        if job is None:
+            if once:
+                break
+            stop.wait(poll_interval)
+            continue
+        run(job)
+    close_old_connections()
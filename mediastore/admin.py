@@ -0,0 +1,19 @@
+from django.contrib import admin
+from django.db.models import F, Sum
+from .models import StoredFile
+
+@admin.register(StoredFile)
+class StoredFileAdmin(admin.ModelAdmin):
+    list_display = ('name', 'size', 'refcount', 'created_at')
+    list_filter = ('created_at',)
+    search_fields = ('hash', 'name')
+    readonly_fields = ('hash', 'name', 'size', 'refcount', 'created_at')
+
+    def changelist_view(self, request, extra_context=None):
+        # Bytes that would have been stored again without deduplication
+        totals = StoredFile.objects.filter(refcount__gt=0).aggregate(
+            stored=Sum('size'), saved=Sum(F('size') * (F('refcount') - 1)),
+        )
+        title = f"Stored files ({totals['stored'] or 0} bytes stored, {totals['saved'] or 0} bytes deduplicated)"
+        extra_context = {**(extra_context or {}), 'title': title}
+        return super().changelist_view(request, extra_context)
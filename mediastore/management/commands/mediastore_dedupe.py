@@ -0,0 +1,48 @@
+from django.core.files.storage import FileSystemStorage
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+
+from mediastore.models import StoredFile
+from mediastore.storage import CAS_PREFIX, content_addressed_fields
+
+
+class Command(BaseCommand):
+    help = (
+        "Move media uploaded before content-addressed storage into the store, pointing rows "
+        "at the shared blob and deleting the old per-name copies."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        moved = missing = 0
+        for model, field in content_addressed_fields():
+            storage = field.storage
+            legacy = (model._base_manager.exclude(**{f'{field.attname}__startswith': CAS_PREFIX})
+                      .exclude(**{field.attname: ''}).exclude(**{f'{field.attname}__isnull': True}))
+            names = set(legacy.values_list(field.attname, flat=True).distinct())
+            for old_name in sorted(names):
+                if not storage.exists(old_name):
+                    missing += 1
+                    continue
+                rows = legacy.filter(**{field.attname: old_name})
+                if options['dry_run']:
+                    moved += rows.count()
+                    continue
+                with transaction.atomic():
+                    count = rows.count()
+                    with storage.open(old_name) as content:
+                        new_name = storage.save(old_name, content)  # Adds one reference
+                    if count > 1:  # Other rows sharing the same legacy file
+                        StoredFile.objects.filter(name=new_name).update(refcount=F('refcount') + count - 1)
+                    rows.update(**{field.attname: new_name})
+                FileSystemStorage.delete(storage, old_name)
+                moved += count
+            self.stdout.write(f"{model._meta.label}.{field.name}: {len(names)} legacy file(s)")
+
+        prefix = "Would have moved" if options['dry_run'] else "Moved"
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix} {moved} row(s) into content-addressed storage; {missing} file(s) missing on disk were left alone."
+        ))
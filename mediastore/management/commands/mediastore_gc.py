@@ -0,0 +1,54 @@
+from collections import Counter
+from datetime import timedelta
+
+from django.core.files.storage import FileSystemStorage
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from mediastore.models import StoredFile
+from mediastore.storage import CAS_PREFIX, content_addressed_fields
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount references to content-addressed media from every file field and delete blobs "
+        "nothing points at any more (e.g. after an image was replaced). Blobs younger than "
+        "--grace-minutes are left alone: their row may still be on its way to the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true')
+        parser.add_argument('--grace-minutes', type=int, default=60)
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(minutes=options['grace_minutes'])
+        references = Counter()
+        storage = None
+        for model, field in content_addressed_fields():
+            storage = field.storage
+            names = model._base_manager.filter(**{f'{field.attname}__startswith': CAS_PREFIX}).values_list(field.attname, flat=True)
+            with transaction.atomic():
+                references.update(names.iterator(chunk_size=5000))
+
+        fixed = removed = freed = 0
+        for stored in StoredFile.objects.filter(created_at__lt=cutoff).iterator(chunk_size=5000):
+            count = references.get(stored.name, 0)
+            if count == stored.refcount and count:
+                continue
+            if count == 0:
+                removed += 1
+                freed += stored.size
+                if not options['dry_run']:
+                    stored.delete()
+                    if storage is not None:  # Remove the blob itself, bypassing the refcounting delete()
+                        FileSystemStorage.delete(storage, stored.name)
+            else:
+                fixed += 1
+                if not options['dry_run']:
+                    StoredFile.objects.filter(pk=stored.pk).update(refcount=count)
+
+        prefix = "Would have " if options['dry_run'] else ""
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix}corrected {fixed} reference count(s) and removed {removed} unreferenced blob(s), {freed} bytes."
+        ))
@@ -0,0 +1,14 @@
+from django.db import models
+
+# Create your models here.
+
+class StoredFile(models.Model):
+    """One blob in the content-addressed media store, shared by every upload with the same bytes."""
+    hash = models.CharField(max_length=64, primary_key=True) # SHA-256 of the content
+    name = models.CharField(max_length=255, unique=True) # Storage path, cas/ab/cd/<hash>.<ext>
+    size = models.PositiveBigIntegerField()
+    refcount = models.PositiveIntegerField(default=0) # Number of file fields pointing at this blob
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,20 @@
+from django.db.models.signals import post_delete
+
+from .storage import CAS_PREFIX, content_addressed_fields
+
+fields_by_model = {}
+for model, field in content_addressed_fields():
+    fields_by_model.setdefault(model, []).append(field)
+
+
+# Deleting a row drops its references, so a blob disappears together with the last row using it.
+# Files stored under their original name before the store existed are left on disk, as before.
+def release_files(sender, instance, **kwargs):
+    for field in fields_by_model[sender]:
+        file = getattr(instance, field.attname)
+        if file and file.name.startswith(CAS_PREFIX):
+            file.storage.delete(file.name)
+
+
+for model in fields_by_model:
+    post_delete.connect(release_files, sender=model, dispatch_uid=f'mediastore-release-{model._meta.label}')
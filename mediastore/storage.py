@@ -0,0 +1,78 @@
+import hashlib
+import os
+
+from django.apps import apps
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from django.db.models import F, FileField
+from django.utils.deconstruct import deconstructible
+
+CAS_PREFIX = 'cas/'
+
+
+def content_hash(content):
+    """SHA-256 of a Django File, read in chunks and rewound afterwards."""
+    sha = hashlib.sha256()
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    for chunk in content.chunks():
+        sha.update(chunk)
+    content.seek(0)
+    return sha.hexdigest()
+
+
+def cas_name(digest, original_name):
+    ext = os.path.splitext(original_name)[1].lower()[:10]
+    return f'{CAS_PREFIX}{digest[:2]}/{digest[2:4]}/{digest}{ext}'
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Media storage that files uploads by their SHA-256 instead of their name.
+
+    Uploading bytes that are already stored (the same photo used for a product,
+    a gallery image and a banner) writes nothing and just bumps the blob's
+    reference count in mediastore.StoredFile; delete() drops a reference and
+    removes the blob with the last one. Names are immutable, so they are served
+    with far-future cache headers (see fameuxarte.static). Files stored under
+    their original name before this backend existed keep working as they are.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        return name  # The final name comes from the content hash in _save()
+
+    def _save(self, name, content):
+        StoredFile = apps.get_model('mediastore', 'StoredFile')
+        digest = content_hash(content)
+        name = cas_name(digest, name)
+        with transaction.atomic():
+            stored, created = StoredFile.objects.select_for_update().get_or_create(
+                hash=digest, defaults={'name': name, 'size': content.size},
+            )
+            if created or not super().exists(stored.name):
+                super()._save(stored.name, content)
+            StoredFile.objects.filter(pk=digest).update(refcount=F('refcount') + 1)
+        return stored.name
+
+    def delete(self, name):
+        if not name or not name.startswith(CAS_PREFIX):
+            return super().delete(name)
+        StoredFile = apps.get_model('mediastore', 'StoredFile')
+        with transaction.atomic():
+            stored = StoredFile.objects.select_for_update().filter(name=name).first()
+            if stored is None:
+                return super().delete(name)
+            if stored.refcount > 1:
+                StoredFile.objects.filter(pk=stored.pk).update(refcount=F('refcount') - 1)
+                return
+            stored.delete()
+            super().delete(name)
+
+
+def content_addressed_fields():
+    """(model, field) for every FileField in the project that uses ContentAddressedStorage."""
+    for model in apps.get_models():
+        for field in model._meta.get_fields():
+            if isinstance(field, FileField) and isinstance(field.storage, ContentAddressedStorage):
+                yield model, field
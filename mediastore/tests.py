@@ -0,0 +1,82 @@
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from io import BytesIO, StringIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from PIL import Image
+
+from gallery.models import GalleryImage
+from .models import StoredFile
+
+
+def png(colour='red'):
+    buffer = BytesIO()
+    Image.new('RGB', (8, 8), colour).save(buffer, 'PNG')
+    return ContentFile(buffer.getvalue(), name='photo.png')
+
+
+class MediaStoreTestCase(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        settings = override_settings(MEDIA_ROOT=self.media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+    def upload(self, colour='red'):
+        return GalleryImage.objects.create(title=colour, image=png(colour))
+
+
+class ContentAddressedStorageTests(MediaStoreTestCase):
+    def test_same_bytes_share_one_blob(self):
+        first, second = self.upload(), self.upload()
+        self.assertEqual(first.image.name, second.image.name)
+        self.assertTrue(first.image.name.startswith('cas/'))
+        self.assertEqual(StoredFile.objects.get().refcount, 2)
+
+    def test_deleting_rows_releases_references(self):
+        first, second = self.upload(), self.upload()
+        path = os.path.join(self.media_root, first.image.name)
+        first.delete()
+        self.assertEqual(StoredFile.objects.get().refcount, 1)
+        self.assertTrue(os.path.exists(path))
+        second.delete()
+        self.assertFalse(StoredFile.objects.exists())
+        self.assertFalse(os.path.exists(path))
+
+    def test_legacy_files_are_left_alone(self):
+        name = 'gallery/legacy.png'
+        os.makedirs(os.path.join(self.media_root, 'gallery'))
+        with open(os.path.join(self.media_root, name), 'wb') as legacy:
+            legacy.write(png().read())
+        image = GalleryImage.objects.create(title='legacy', image=name)
+        image.delete()
+        self.assertTrue(default_storage.exists(name))
+
+
+class MediastoreGcTests(MediaStoreTestCase):
+    def orphan(self):
+        return StoredFile.objects.create(hash='0' * 64, name='cas/00/00/orphan.png', size=3, refcount=1)
+
+    def test_recent_blobs_survive(self):
+        stored = self.orphan()
+        call_command('mediastore_gc', stdout=StringIO())
+        self.assertTrue(StoredFile.objects.filter(pk=stored.pk).exists())
+
+    def test_old_unreferenced_blobs_are_removed(self):
+        stored = self.orphan()
+        StoredFile.objects.filter(pk=stored.pk).update(created_at=timezone.now() - timedelta(hours=2))
+        call_command('mediastore_gc', stdout=StringIO())
+        self.assertFalse(StoredFile.objects.filter(pk=stored.pk).exists())
+
+    def test_refcounts_are_corrected(self):
+        image = self.upload()
+        StoredFile.objects.update(refcount=5, created_at=timezone.now() - timedelta(hours=2))
+        call_command('mediastore_gc', grace_minutes=0, stdout=StringIO())
+        self.assertEqual(StoredFile.objects.get(name=image.image.name).refcount, 1)
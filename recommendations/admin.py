@@ -0,0 +1,9 @@
+from django.contrib import admin
+from .models import Recommendation
+
+@admin.register(Recommendation)
+class RecommendationAdmin(admin.ModelAdmin):
+    list_display = ('product', 'rank', 'recommended', 'orders')
+    list_select_related = ('product', 'recommended')
+    raw_id_fields = ('product', 'recommended')
+    search_fields = ('product__name',)
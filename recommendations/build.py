@@ -0,0 +1,133 @@
+from collections import Counter
+from itertools import groupby, permutations
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from checkout.models import Order, OrderItem
+from .models import CoPurchase, Recommendation
+
+CHUNK_SIZE = 500  # products per query when updating counts and recommendations
+
+
+def chunked(values, size=CHUNK_SIZE):
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def count_pairs(order_ids, max_items):
+    """Counter of (product, other) -> orders among ``order_ids``; orders with more than ``max_items`` products are skipped."""
+    pairs = Counter()
+    lines = (
+        OrderItem.objects.filter(order_id__in=order_ids, product__isnull=False)
+        .order_by('order_id').values_list('order_id', 'product_id').distinct()
+    )
+    for _, rows in groupby(lines.iterator(chunk_size=5000), key=lambda row: row[0]):
+        products = sorted({product_id for _, product_id in rows})
+        if 1 < len(products) <= max_items:  # Wholesale-sized orders say little about taste
+            pairs.update(permutations(products, 2))
+    return pairs
+
+
+def add_counts(pairs):
+    """
+    Add ``pairs`` to the stored matrix; returns the products whose row changed.
+    Cells are read with FOR UPDATE, so builds running side by side add up
+    instead of overwriting each other.
+    """
+    by_product = {}
+    for (product_id, other_id), orders in pairs.items():
+        by_product.setdefault(product_id, {})[other_id] = orders
+    for products in chunked(by_product):
+        cells = {
+            (product_id, other_id): orders
+            for product_id in products for other_id, orders in by_product[product_id].items()
+        }
+        while cells:
+            existing = (
+                CoPurchase.objects.select_for_update()
+                .filter(product_id__in={key[0] for key in cells}, other_id__in={key[1] for key in cells})
+                .order_by('product_id', 'other_id')
+            )
+            changed = []
+            for cell in existing:
+                orders = cells.pop((cell.product_id, cell.other_id), None)
+                if orders is not None:
+                    cell.orders += orders
+                    changed.append(cell)
+            CoPurchase.objects.bulk_update(changed, ['orders'], batch_size=CHUNK_SIZE)
+            try:
+                with transaction.atomic():
+                    CoPurchase.objects.bulk_create(
+                        [
+                            CoPurchase(product_id=product_id, other_id=other_id, orders=orders)
+                            for (product_id, other_id), orders in cells.items()
+                        ],
+                        batch_size=CHUNK_SIZE,
+                    )
+            except IntegrityError:  # Another build created some of these cells meanwhile: add to them on the next pass
+                continue
+            cells = {}
+    return set(by_product)
+
+
+def refresh(product_ids, top_n):
+    """Rewrite the stored top ``top_n`` recommendations of ``product_ids``, one windowed query per chunk."""
+    for products in chunked(product_ids):
+        top = (
+            CoPurchase.objects.filter(product_id__in=products)
+            .annotate(position=Window(
+                RowNumber(), partition_by=F('product_id'), order_by=[F('orders').desc(), F('other_id').asc()],
+            ))
+            .filter(position__lte=top_n)
+            .values_list('product_id', 'other_id', 'orders', 'position')
+        )
+        rows = [
+            Recommendation(product_id=product_id, recommended_id=other_id, rank=position - 1, orders=orders)
+            for product_id, other_id, orders, position in top
+        ]
+        Recommendation.objects.filter(product_id__in=products).delete()
+        # A concurrent build may have just written the same ranks: the later one wins instead of failing
+        Recommendation.objects.bulk_create(
+            rows, batch_size=CHUNK_SIZE,
+            update_conflicts=True, unique_fields=['product', 'rank'], update_fields=['recommended', 'orders'],
+        )
+
+
+def build(batch_size=None, progress=None):
+    """
+    Count the paid orders that have not been counted yet into the co-purchase
+    matrix, ``batch_size`` orders per transaction, and refresh the
+    recommendations of every product they touched. Memory stays bounded by the
+    batch, however many orders are waiting. Each batch is claimed with
+    SKIP LOCKED, so concurrent builds never count an order twice. Returns the
+    number of orders counted.
+    """
+    batch_size = batch_size or settings.RECOMMENDATIONS_BATCH_ORDERS
+    counted = 0
+    while True:
+        with transaction.atomic():
+            order_ids = list(
+                Order.objects.select_for_update(skip_locked=True)
+                .filter(paid=True, co_purchases_counted=False)
+                .order_by('pk').values_list('pk', flat=True)[:batch_size]
+            )
+            if not order_ids:
+                return counted
+            changed = add_counts(count_pairs(order_ids, settings.RECOMMENDATIONS_MAX_ORDER_ITEMS))
+            Order.objects.filter(pk__in=order_ids).update(co_purchases_counted=True)
+            refresh(changed, settings.RECOMMENDATIONS_TOP_N)
+        counted += len(order_ids)
+        if progress:
+            progress(counted, len(changed))
+
+
+def reset():
+    """Forget every count so the next build starts over from all paid orders."""
+    with transaction.atomic():
+        Recommendation.objects.all().delete()
+        CoPurchase.objects.all().delete()
+        Order.objects.filter(co_purchases_counted=True).update(co_purchases_counted=False)
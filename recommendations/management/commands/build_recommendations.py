@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from recommendations.build import build, reset
+
+
+class Command(BaseCommand):
+    help = "Count paid orders that are new since the last run into the co-purchase matrix and refresh recommendations."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help="Orders per transaction (default: RECOMMENDATIONS_BATCH_ORDERS).")
+        parser.add_argument('--rebuild', action='store_true', help="Start over from every paid order.")
+
+    def handle(self, *args, **options):
+        if options['rebuild']:
+            reset()
+        counted = build(
+            options['batch_size'],
+            progress=lambda counted, changed: self.stdout.write(f"{counted} order(s), {changed} product(s) refreshed"),
+        )
+        self.stdout.write(self.style.SUCCESS(f"Counted {counted} new order(s)."))
@@ -0,0 +1,37 @@
+from django.db import models
+
+# Create your models here.
+
+class CoPurchase(models.Model):
+    """One cell of the item-to-item matrix: paid orders that contained both products (stored both ways round)."""
+    product = models.ForeignKey('shop.Product', on_delete=models.CASCADE, related_name='+')
+    other = models.ForeignKey('shop.Product', on_delete=models.CASCADE, related_name='+')
+    orders = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'other'], name='recommendations_copurchase_pair'),
+        ]
+        indexes = [
+            models.Index(fields=['product', '-orders'], name='recommendations_copurchase_top'), # Top-N per product
+        ]
+
+    def __str__(self):
+        return f"{self.product_id} + {self.other_id}: {self.orders}"
+
+
+class Recommendation(models.Model):
+    """A stored "collectors also bought" entry, rebuilt from CoPurchase by build_recommendations."""
+    product = models.ForeignKey('shop.Product', on_delete=models.CASCADE, related_name='recommendations')
+    recommended = models.ForeignKey('shop.Product', on_delete=models.CASCADE, related_name='recommended_for')
+    rank = models.PositiveSmallIntegerField() # 0 = bought together most often
+    orders = models.PositiveIntegerField()
+
+    class Meta:
+        ordering = ['product', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['product', 'rank'], name='recommendations_product_rank'), # The read path
+        ]
+
+    def __str__(self):
+        return f"{self.product_id} -> {self.recommended_id} (#{self.rank + 1})"
@@ -0,0 +1,13 @@
+from django.conf import settings
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from checkout.models import Order
+from .tasks import build_recommendations
+
+
+# Paid orders are counted in bulk a while later; one queued build covers all of them
+@receiver(post_save, sender=Order)
+def queue_build(sender, instance, **kwargs):
+    if instance.paid and not instance.co_purchases_counted:
+        build_recommendations.enqueue(delay=settings.RECOMMENDATIONS_BUILD_DELAY, unique_key='recommendations-build')
@@ -0,0 +1,8 @@
+from jobs.registry import task
+from .build import build
+
+
+@task(priority=-10)
+def build_recommendations():
+    """Count newly paid orders into the co-purchase matrix (queued after orders are paid, see signals.py)."""
+    build()
@@ -0,0 +1,83 @@
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from checkout.models import Order, OrderItem
+from jobs.models import Job
+from shop.models import Category, Product
+from .build import build, refresh, reset
+from .models import CoPurchase, Recommendation
+
+# Create your tests here.
+
+@override_settings(RECOMMENDATIONS_TOP_N=2, RECOMMENDATIONS_MAX_ORDER_ITEMS=3)
+class BuildTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user('collector')
+        category = Category.objects.create(name='Oil', slug='oil')
+        self.products = [
+            Product.objects.create(name=name, slug=name, price='10.00', category=category)
+            for name in ['a', 'b', 'c', 'd', 'e']
+        ]
+
+    def order(self, *indexes, paid=True):
+        order = Order.objects.create(
+            user=self.user, first_name='A', last_name='B', email='a@example.com',
+            address='1 Street', city='Paris', postal_code='75001', paid=paid,
+        )
+        for index in indexes:
+            OrderItem.objects.create(order=order, product=self.products[index])
+        return order
+
+    def recommended(self, index):
+        return [
+            self.products.index(product)
+            for product in Product.objects.filter(recommended_for__product=self.products[index]).order_by('recommended_for__rank')
+        ]
+
+    def test_counts_and_ranks(self):
+        self.order(0, 1)
+        self.order(0, 1, 2)
+        self.order(0, 2)
+        self.order(0, 3)
+        self.order(0, 1, 2, 3)  # More than RECOMMENDATIONS_MAX_ORDER_ITEMS products: left out
+        self.order(0, 4, paid=False)
+        self.assertEqual(build(), 5)
+        self.assertEqual(CoPurchase.objects.get(product=self.products[0], other=self.products[1]).orders, 2)
+        self.assertEqual(self.recommended(0), [1, 2])  # Capped at RECOMMENDATIONS_TOP_N
+        self.assertEqual(self.recommended(3), [0])
+        self.assertEqual(self.recommended(4), [])
+        self.assertEqual(build(), 0)  # Nothing left to count
+
+    def test_incremental_builds_match_a_full_rebuild(self):
+        self.order(0, 1)
+        self.order(1, 2)
+        build()
+        self.order(0, 2)
+        self.order(0, 1)
+        self.order(3, 2)
+        build(batch_size=1)
+        incremental = list(Recommendation.objects.values_list('product', 'recommended', 'rank', 'orders'))
+        reset()
+        build()
+        self.assertEqual(list(Recommendation.objects.values_list('product', 'recommended', 'rank', 'orders')), incremental)
+
+    def test_refresh_is_one_query_per_chunk(self):
+        self.order(0, 1, 2)
+        self.order(3, 4)
+        build()
+        with self.assertNumQueries(3):  # Window query, delete, insert
+            refresh([product.pk for product in self.products], top_n=2)
+        self.assertEqual(self.recommended(0), [1, 2])
+
+    def test_paid_orders_queue_one_build(self):
+        self.order(0, 1)
+        self.order(1, 2)
+        self.assertEqual(Job.objects.filter(name='recommendations.build_recommendations').count(), 1)
+
+    def test_also_bought_api(self):
+        self.order(0, 1)
+        self.order(0, 1)
+        self.order(0, 2)
+        build()
+        response = self.client.get(f'/api/recommendations/products/{self.products[0].pk}/also-bought/')
+        self.assertEqual([item['slug'] for item in response.json()], ['b', 'c'])
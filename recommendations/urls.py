@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import AlsoBoughtView
+
+urlpatterns = [
+    path('products/<int:pk>/also-bought/', AlsoBoughtView.as_view(), name='also-bought'),
+]
@@ -0,0 +1,14 @@
+from rest_framework import generics
+from fameuxarte.sparse import SparseFieldsViewMixin
+from shop.models import Product
+from shop.serializers import ProductSerializer
+
+# "Collectors also bought": /api/recommendations/products/<pk>/also-bought/
+# One query on the (product, rank) index, joined to the recommended products.
+class AlsoBoughtView(SparseFieldsViewMixin, generics.ListAPIView):
+    queryset = Product.objects.filter(available=True).select_related('category')
+    serializer_class = ProductSerializer
+    pagination_class = None  # Already capped at RECOMMENDATIONS_TOP_N
+
+    def filter_queryset(self, queryset):
+        return queryset.filter(recommended_for__product_id=self.kwargs['pk']).order_by('recommended_for__rank')
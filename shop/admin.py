@@ -1,4 +1,5 @@
 from django.contrib import admin
+from fameuxarte.admin_tools import EstimatedCountPaginator, LatestInline
 from .models import Category, Product, Review
 
 # Display category names in admin
@@ -6,19 +7,38 @@ class CategoryAdmin(admin.ModelAdmin):
     list_display = ('name', 'slug')
     search_fields = ('name',)
 
-# Inline review editing inside the Product page
-class ReviewInline(admin.TabularInline):  # or admin.StackedInline for a different layout
+# Latest reviews inside the Product page (read-only; all of them are under Reviews)
+class ReviewInline(LatestInline, admin.TabularInline):
     model = Review
-    extra = 1  # Number of empty forms to display
+    fields = ('author', 'rating', 'content', 'created_at')
+    readonly_fields = ('created_at',)
+    ordering = ('-created_at',)  # Served by the shop_review_product_recent index
+    select_related = ('author',)
 
 # Customizing Product Admin Panel
 class ProductAdmin(admin.ModelAdmin):
     list_display = ('name', 'price', 'stock', 'available', 'category')
-    list_filter = ('available', 'category')
+    list_select_related = ('category',)  # One joined query instead of one per row
+    list_filter = ('available', 'category')  # Both lead the shop_product_facets index
     search_fields = ('name', 'description')
-    inlines = [ReviewInline]  # This will allow adding/editing reviews directly inside products
+    autocomplete_fields = ('category',)
+    ordering = ('-id',)  # Newest first on the primary key, a stable order for pagination and autocomplete
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    inlines = [ReviewInline]
+
+# Reviews: product and author are joined, and picked by search instead of a <select> of every row
+class ReviewAdmin(admin.ModelAdmin):
+    list_display = ('product', 'author', 'rating', 'created_at')
+    list_select_related = ('product', 'author')
+    list_filter = ('rating',)
+    search_fields = ('product__name', 'author__username')
+    autocomplete_fields = ('product', 'author')
+    ordering = ('-created_at',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 # Register models with custom admin settings
 admin.site.register(Category, CategoryAdmin)
 admin.site.register(Product, ProductAdmin)
-admin.site.register(Review)
+admin.site.register(Review, ReviewAdmin)
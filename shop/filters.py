@@ -0,0 +1,116 @@
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db.models import BooleanField, Case, Count, IntegerField, Q, Value, When
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+# Product filters shared by the list and the facet sidebar:
+#
+#   ?category=3,7  ?min_price=50  ?max_price=250  ?available=true  ?in_stock=true
+#
+# Facet counts for a dimension ignore that dimension's own filter (picking one
+# category still shows how many products the other categories have), and all of
+# them come from one grouped query.
+
+BOOLEANS = {'true': True, '1': True, 'false': False, '0': False}
+
+
+def parse_filters(params):
+    """Product filters present in ``params``; raises ValidationError on bad values."""
+    filters = {}
+    try:
+        if params.get('category'):
+            filters['category'] = [int(value) for value in params['category'].split(',') if value.strip()]
+        for name in ('min_price', 'max_price'):
+            if params.get(name):
+                filters[name] = Decimal(params[name])
+    except (ValueError, InvalidOperation):
+        raise ValidationError({'detail': "category must be ids, min_price/max_price numbers."})
+    for name in ('available', 'in_stock'):
+        if params.get(name):
+            if params[name].lower() not in BOOLEANS:
+                raise ValidationError({name: "Use true or false."})
+            filters[name] = BOOLEANS[params[name].lower()]
+    return filters
+
+
+def base_q(filters):
+    return Q(available=filters['available']) if 'available' in filters else Q()
+
+
+def category_q(filters):
+    return Q(category_id__in=filters['category']) if 'category' in filters else Q()
+
+
+def price_q(filters):
+    q = Q()
+    if 'min_price' in filters:
+        q &= Q(price__gte=filters['min_price'])
+    if 'max_price' in filters:
+        q &= Q(price__lte=filters['max_price'])
+    return q
+
+
+def stock_q(filters):
+    if 'in_stock' not in filters:
+        return Q()
+    return Q(stock__gt=0) if filters['in_stock'] else Q(stock=0)
+
+
+class ProductFilterBackend(BaseFilterBackend):
+    def filter_queryset(self, request, queryset, view):
+        filters = parse_filters(request.query_params)
+        return queryset.filter(base_q(filters) & category_q(filters) & price_q(filters) & stock_q(filters))
+
+
+def price_bucket(edges):
+    """Index of the SHOP_PRICE_FACETS bucket a product's price falls in."""
+    return Case(
+        *[When(price__lt=edge, then=Value(number)) for number, edge in enumerate(edges[1:])],
+        default=Value(len(edges) - 1), output_field=IntegerField(),
+    )
+
+
+def flag(q):
+    return Case(When(q, then=Value(True)), default=Value(False), output_field=BooleanField()) if q else Value(True)
+
+
+def facets(queryset, filters):
+    """
+    Sidebar counts for ``filters``: matching total, per category, per price
+    bucket and in/out of stock. One GROUP BY over (category, price bucket,
+    in stock, within the price filter); the rows are few, so the facets are
+    summed up here.
+    """
+    edges = settings.SHOP_PRICE_FACETS
+    rows = (
+        queryset.filter(base_q(filters))
+        .annotate(bucket=price_bucket(edges), has_stock=flag(Q(stock__gt=0)), in_price=flag(price_q(filters)))
+        .values('category_id', 'category__name', 'category__slug', 'bucket', 'has_stock', 'in_price')
+        .annotate(count=Count('pk')).order_by()
+    )
+    total, categories, prices, stock = 0, {}, [0] * len(edges), {True: 0, False: 0}
+    for row in rows:
+        in_category = 'category' not in filters or row['category_id'] in filters['category']
+        in_stock = filters.get('in_stock', row['has_stock']) == row['has_stock']
+        category = categories.setdefault(row['category_id'], {
+            'id': row['category_id'], 'name': row['category__name'], 'slug': row['category__slug'], 'count': 0,
+        })
+        if row['in_price'] and in_stock:
+            category['count'] += row['count']
+        if in_category and in_stock:
+            prices[row['bucket']] += row['count']
+        if in_category and row['in_price']:
+            stock[row['has_stock']] += row['count']
+        if in_category and row['in_price'] and in_stock:
+            total += row['count']
+    return {
+        'total': total,
+        'categories': sorted(categories.values(), key=lambda category: category['name']),
+        'price': [
+            {'min': edge, 'max': edges[number + 1] if number + 1 < len(edges) else None, 'count': prices[number]}
+            for number, edge in enumerate(edges)
+        ],
+        'in_stock': {'true': stock[True], 'false': stock[False]},
+    }
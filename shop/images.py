@@ -0,0 +1,35 @@
+import io
+import os
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image
+
+# Resized copies of product images for listings (srcset). They go through the
+# default storage like any upload, so identical copies are stored once.
+
+
+def make_variants(name):
+    """{width: stored name} for each SHOP_IMAGE_VARIANT_WIDTHS narrower than the image at ``name``."""
+    variants = {}
+    try:
+        with default_storage.open(name) as f, Image.open(f) as image:
+            image.draft('RGB', (max(settings.SHOP_IMAGE_VARIANT_WIDTHS), image.height))  # JPEGs decode at a reduced scale
+            image = image.convert('RGB')
+            stem = os.path.splitext(os.path.basename(name))[0]
+            for width in sorted(settings.SHOP_IMAGE_VARIANT_WIDTHS):
+                if width >= image.width:
+                    break
+                copy = image.resize((width, round(image.height * width / image.width)), Image.Resampling.LANCZOS)
+                buffer = io.BytesIO()
+                copy.save(buffer, 'JPEG', quality=82, optimize=True, progressive=True)
+                variants[str(width)] = default_storage.save(f'products/variants/{stem}-{width}w.jpg', ContentFile(buffer.getvalue()))
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return {}
+    return variants
+
+
+def delete_variants(variants):
+    for name in variants.values():
+        default_storage.delete(name)
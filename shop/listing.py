@@ -0,0 +1,83 @@
+from django.db import transaction
+from django.db.models import Avg, Count, F, Q
+from django.core.files.storage import default_storage
+from django.utils import timezone
+
+from fameuxarte.renderers import dumps
+from .images import delete_variants, make_variants
+from .models import Product, ProductListing
+
+# The listing read model: ProductListing rows hold each product's listing
+# document as JSON text, so /api/shop/listings/ only filters flat rows and
+# concatenates them. Signals queue refresh_listings jobs for the products a
+# change touches (shop/signals.py); `manage.py refresh_listings` reconciles
+# whatever they missed (bulk updates, reviews edited in the shell...) from cron.
+
+BATCH_SIZE = 500
+ORDERINGS = {
+    'newest': ('-created_at', '-pk'),
+    'price': ('price', 'pk'),
+    '-price': ('-price', '-pk'),
+}
+
+
+def document(product, variants):
+    return {
+        'id': product.pk,
+        'name': product.name,
+        'slug': product.slug,
+        'price': str(product.price),
+        'category': {'name': product.category.name, 'slug': product.category.slug},
+        'image': {
+            'url': product.image.url,
+            'variants': {width: default_storage.url(name) for width, name in variants.items()},
+        } if product.image else None,
+        'rating': {
+            'average': round(product.rating_average, 2) if product.rating_average is not None else None,
+            'count': product.rating_count,
+        },
+        'available': product.available,
+        'in_stock': product.stock > 0,
+    }
+
+
+def refresh(product_ids):
+    """Rebuild the listings of ``product_ids``: one query for the products and their ratings, one upsert."""
+    for start in range(0, len(product_ids), BATCH_SIZE):
+        batch = product_ids[start:start + BATCH_SIZE]
+        read_at = timezone.now()  # Before reading, so a change made meanwhile still counts as newer
+        products = (
+            Product.objects.filter(pk__in=batch).select_related('category')
+            .annotate(rating_average=Avg('reviews__rating'), rating_count=Count('reviews'))
+        )
+        current = {row.pk: row for row in ProductListing.objects.filter(pk__in=batch).only('pk', 'image', 'image_variants')}
+        rows, stale_variants = [], []
+        for product in products:
+            image = product.image.name if product.image else ''
+            listing = current.get(product.pk)
+            variants = listing.image_variants if listing is not None and listing.image == image else None
+            if variants is None:  # New product or a new image
+                if listing is not None:
+                    stale_variants.append(listing.image_variants)
+                variants = make_variants(image) if image else {}
+            rows.append(ProductListing(
+                product=product, category_id=product.category_id, price=product.price, stock=product.stock,
+                available=product.available, created_at=product.created_at, image=image, image_variants=variants,
+                document=dumps(document(product, variants)).decode(), refreshed_at=read_at,
+            ))
+        ProductListing.objects.bulk_create(
+            rows, update_conflicts=True, unique_fields=['product'],
+            update_fields=['category', 'price', 'stock', 'available', 'created_at', 'image', 'image_variants', 'document', 'refreshed_at'],
+        )
+        transaction.on_commit(lambda stale=stale_variants: [delete_variants(variants) for variants in stale])
+
+
+def stale_product_ids():
+    """Products whose listing is missing or older than the product, its category or its newest review."""
+    listing_time = F('listing__refreshed_at')
+    return list(
+        Product.objects.filter(
+            Q(listing__isnull=True) | Q(updated_at__gt=listing_time)
+            | Q(category__updated_at__gt=listing_time) | Q(reviews__created_at__gt=listing_time)
+        ).order_by('pk').values_list('pk', flat=True).distinct()
+    )
@@ -0,0 +1,39 @@
+import json
+
+from django.conf import settings
+
+from fameuxarte.broker import get_broker
+from .models import Product
+
+# Live stock and price changes (GET /api/shop/products/live/?ids=12,40, see
+# shop/views.py): a server-sent event stream that starts with the current values
+# of the requested products, then sends an event each time one's stock,
+# availability or price changes (published by shop/signals.py). Without ?ids=
+# every product's changes are sent, and no snapshot. Needs an ASGI server; each
+# open stream would hold a worker thread under WSGI.
+CHANNEL = 'shop.products'
+LIVE_FIELDS = ('stock', 'available', 'price')
+MAX_IDS = 200
+
+
+def live_values(product):
+    return {'key': product.pk, 'id': product.pk, 'stock': product.stock, 'available': product.available, 'price': str(product.price)}
+
+
+def event(data, name='product'):
+    return f"event: {name}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+async def stream(ids):
+    """The event stream body for product ``ids`` (all products when empty)."""
+    subscription = get_broker().subscribe(CHANNEL, keys=ids, max_pending=settings.LIVE_MAX_PENDING)
+    try:
+        yield f"retry: {settings.LIVE_RETRY_MS}\n\n".encode()
+        if ids:  # Subscribed first, so no change can slip in between the snapshot and the stream
+            async for product in Product.objects.filter(pk__in=ids).only('pk', *LIVE_FIELDS):
+                yield event(live_values(product))
+        while not subscription.closed:
+            message = await subscription.get(timeout=settings.LIVE_HEARTBEAT)
+            yield b": keep-alive\n\n" if message is None else event(message)
+    finally:
+        subscription.close()
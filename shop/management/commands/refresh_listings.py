@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from shop.listing import BATCH_SIZE, refresh, stale_product_ids
+from shop.models import Product
+
+
+class Command(BaseCommand):
+    help = "Rebuild product listing documents that are missing or stale (run it periodically), or all of them with --all."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help="Rebuild every listing, e.g. after changing the document format.")
+
+    def handle(self, *args, **options):
+        if options['all']:
+            product_ids = list(Product.objects.order_by('pk').values_list('pk', flat=True))
+        else:
+            product_ids = stale_product_ids()
+        for start in range(0, len(product_ids), BATCH_SIZE):
+            refresh(product_ids[start:start + BATCH_SIZE])
+            self.stdout.write(f"{min(start + BATCH_SIZE, len(product_ids))}/{len(product_ids)}")
+        self.stdout.write(self.style.SUCCESS(f"Refreshed {len(product_ids)} listing(s)."))
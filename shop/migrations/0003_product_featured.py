@@ -0,0 +1,26 @@
+# Generated by Django 5.1.15 on 2026-10-19 18:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0002_category_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='featured',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['available', '-created_at'], name='shop_product_new'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['featured', 'available'], name='shop_product_featured'),
+        ),
+    ]
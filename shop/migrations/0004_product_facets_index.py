@@ -0,0 +1,17 @@
+# Generated by Django 5.1.15 on 2026-10-19 19:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0003_product_featured'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['available', 'category', 'price', 'stock'], name='shop_product_facets'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.15 on 2026-10-19 19:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shop', '0005_review_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductListing',
+            fields=[
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='listing', serialize=False, to='shop.product')),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('stock', models.PositiveIntegerField(default=0)),
+                ('available', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField()),
+                ('image', models.CharField(blank=True, max_length=255)),
+                ('image_variants', models.JSONField(blank=True, default=dict)),
+                ('document', models.TextField()),
+                ('refreshed_at', models.DateTimeField()),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='shop.category')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['available', 'category', 'price'], name='shop_listing_filter'), models.Index(fields=['available', '-created_at'], name='shop_listing_new')],
+            },
+        ),
+    ]
@@ -4,6 +4,7 @@ from django.core.validators import MinValueValidator, MaxValueValidator  # Corre
 class Category(models.Model):
     name = models.CharField(max_length=100, unique=True)
     slug = models.SlugField(unique=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Categories"
@@ -20,12 +21,46 @@ class Product(models.Model):
     image = models.ImageField(upload_to='products/', blank=True, null=True)
     stock = models.PositiveIntegerField(default=0, validators=[MinValueValidator(0)])
     available = models.BooleanField(default=True)
+    featured = models.BooleanField(default=False) # Shown on the home page
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['available', '-created_at'], name='shop_product_new'), # New arrivals
+            models.Index(fields=['featured', 'available'], name='shop_product_featured'), # Home page picks
+            models.Index(fields=['available', 'category', 'price', 'stock'], name='shop_product_facets'), # Filters and facet counts
+        ]
+
     def __str__(self):
         return self.name
 
+class ProductListing(models.Model):
+    """
+    Read model behind /api/shop/listings/: one flat row per product with its
+    listing JSON already rendered (see shop/listing.py). The filter columns
+    are copies of the product's own.
+    """
+    product = models.OneToOneField(Product, on_delete=models.CASCADE, primary_key=True, related_name='listing')
+    category = models.ForeignKey(Category, on_delete=models.CASCADE, related_name='+')
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    stock = models.PositiveIntegerField(default=0)
+    available = models.BooleanField(default=True)
+    created_at = models.DateTimeField() # The product's, for "newest first"
+    image = models.CharField(max_length=255, blank=True) # Image name the variants were made from
+    image_variants = models.JSONField(default=dict, blank=True) # {"320": stored name, ...}
+    document = models.TextField() # {"id", "name", "slug", "price", "category", "image", "rating", "available", "in_stock"}
+    refreshed_at = models.DateTimeField() # When the product was read; later changes make the row stale
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['available', 'category', 'price'], name='shop_listing_filter'),
+            models.Index(fields=['available', '-created_at'], name='shop_listing_new'),
+        ]
+
+    def __str__(self):
+        return f"Listing of product {self.product_id}"
+
 class Review(models.Model):  # Review class is now OUTSIDE of Product
     product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='reviews')
     author = models.ForeignKey('auth.User', on_delete=models.CASCADE, related_name='reviews')
@@ -33,6 +68,12 @@ class Review(models.Model):  # Review class is now OUTSIDE of Product
     rating = models.PositiveIntegerField(default=5, validators=[MinValueValidator(1), MaxValueValidator(5)])
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['product', '-created_at'], name='shop_review_product_recent'), # Latest reviews of a product
+            models.Index(fields=['-created_at'], name='shop_review_recent'), # Admin changelist
+        ]
+
     def __str__(self):
         return f"Review for {self.product.name} by {self.author.username}"
         
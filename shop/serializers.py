@@ -1,15 +1,17 @@
 from rest_framework import serializers
+from fameuxarte.sparse import SparseFieldsMixin
+from uploads.serializers import ChunkedUploadFieldMixin
 from .models import Category, Product, Review
 
 #Category Serializer
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = '__all__'
 
 #Product Serializer
-class ProductSerializer(serializers.ModelSerializer):
+class ProductSerializer(SparseFieldsMixin, ChunkedUploadFieldMixin, serializers.ModelSerializer):  # image or upload=<chunked upload id>
     category = CategorySerializer(read_only=True) # show category details in product API
     category_id = serializers.PrimaryKeyRelatedField(
         queryset=Category.objects.all(), source='category', write_only=True
@@ -22,7 +24,7 @@ class ProductSerializer(serializers.ModelSerializer):
 
 #Review Serializer
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     product = ProductSerializer(read_only=True)  # Show product details i review API
     product_id = serializers.PrimaryKeyRelatedField(
         queryset=Product.objects.all(), source='product', write_only=True
@@ -0,0 +1,54 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from fameuxarte.broker import get_broker
+from .images import delete_variants
+from .live import CHANNEL, LIVE_FIELDS, live_values
+from .models import Category, Product, ProductListing, Review
+from .tasks import refresh_category_listings, refresh_listings
+
+
+@receiver(post_init, sender=Product)
+def remember_live_values(sender, instance, **kwargs):
+    # Read from __dict__ so deferred fields (.only() querysets) are not fetched
+    instance._live_values = tuple(instance.__dict__.get(name) for name in LIVE_FIELDS)
+
+
+# Stock, availability and price changes go to live stream subscribers once committed
+@receiver(post_save, sender=Product)
+def publish_changes(sender, instance, created, **kwargs):
+    values = tuple(instance.__dict__.get(name) for name in LIVE_FIELDS)
+    if created or values == instance._live_values:
+        return
+    instance._live_values = values
+    message = live_values(instance)
+    transaction.on_commit(lambda: get_broker().publish(CHANNEL, message))
+
+
+# Listing documents (shop/listing.py) are rebuilt by the job worker; a burst of
+# saves to one product coalesces into a single queued job
+def queue_listing_refresh(product_id):
+    refresh_listings.enqueue(args=[[product_id]], unique_key=f'shop-listing-{product_id}')
+
+
+@receiver(post_save, sender=Product)
+def product_saved(sender, instance, **kwargs):
+    queue_listing_refresh(instance.pk)
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def review_changed(sender, instance, **kwargs):
+    queue_listing_refresh(instance.product_id)
+
+
+@receiver(post_save, sender=Category)
+def category_saved(sender, instance, created, **kwargs):
+    if not created:
+        refresh_category_listings.enqueue(args=[instance.pk], unique_key=f'shop-category-listings-{instance.pk}')
+
+
+@receiver(post_delete, sender=ProductListing)
+def listing_deleted(sender, instance, **kwargs):
+    transaction.on_commit(lambda: delete_variants(instance.image_variants))
@@ -0,0 +1,15 @@
+from jobs.registry import task
+from . import listing
+from .models import Product
+
+
+@task(priority=5)
+def refresh_listings(product_ids):
+    """Rebuild the listing documents of some products (queued by shop/signals.py)."""
+    listing.refresh(product_ids)
+
+
+@task
+def refresh_category_listings(category_id):
+    """A category was renamed: rebuild the listings of all its products."""
+    listing.refresh(list(Product.objects.filter(category_id=category_id).values_list('pk', flat=True)))
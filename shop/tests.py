@@ -1,3 +1,292 @@
-from django.test import TestCase
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+
+from fameuxarte.broker import get_broker
+from jobs.worker import claim, run
+from .listing import refresh, stale_product_ids
+from .live import CHANNEL, MAX_IDS, stream
+from .models import Category, Product, ProductListing, Review
 
 # Create your tests here.
+
+
+def png_bytes(width, colour='teal'):
+    buffer = BytesIO()
+    Image.new('RGB', (width, width // 2), colour).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+class ProductDetailRoutesTests(TestCase):
+    def setUp(self):
+        self.category = Category.objects.create(name='Oil', slug='oil')
+        self.product = Product.objects.create(name='Nocturne', slug='nocturne', price='120.00', category=self.category, stock=3)
+        self.admin = User.objects.create_superuser('admin', 'admin@example.com', 'pw')
+
+    def test_pk_route_reads_updates_and_deletes(self):
+        url = f'/api/shop/products/{self.product.pk}/'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['slug'], 'nocturne')
+
+        self.client.force_login(self.admin)
+        response = self.client.patch(url, {'stock': 5}, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['stock'], 5)
+        self.assertEqual(self.client.delete(url).status_code, 204)
+        self.assertFalse(Product.objects.filter(pk=self.product.pk).exists())
+
+    def test_slug_route(self):
+        response = self.client.get('/api/shop/products/slug/nocturne/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['id'], self.product.pk)
+        self.assertEqual(self.client.get('/api/shop/products/slug/missing/').status_code, 404)
+
+
+class AsyncReadApiTests(TestCase):
+    def setUp(self):
+        category = Category.objects.create(name='Oil', slug='oil')
+        self.product = Product.objects.create(name='Nocturne', slug='nocturne', price='120.00', category=category, stock=3)
+
+    async def test_same_json_as_the_drf_views(self):
+        detail = await self.async_client.get(f'/api/shop/async/products/{self.product.pk}/')
+        self.assertEqual(detail.status_code, 200)
+        expected = await self.async_client.get(f'/api/shop/products/{self.product.pk}/')
+        self.assertEqual(detail.json(), expected.json())
+
+        listing = await self.async_client.get('/api/shop/async/products/')
+        self.assertEqual([item['id'] for item in listing.json()], [self.product.pk])
+        self.assertEqual((await self.async_client.get('/api/shop/async/products/0/')).status_code, 404)
+        self.assertEqual((await self.async_client.post('/api/shop/async/products/')).status_code, 405)
+
+
+class ReviewApiTests(TestCase):
+    def setUp(self):
+        category = Category.objects.create(name='Oil', slug='oil')
+        for index in range(10):
+            product = Product.objects.create(name=f'Work {index}', slug=f'work-{index}', price='10.00', category=category)
+            author = User.objects.create_user(f'critic-{index}')
+            for rating in range(1, 4):
+                Review.objects.create(product=product, author=author, content='Fine', rating=rating)
+
+    def test_list_is_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/shop/reviews/')
+        reviews = response.json()
+        self.assertEqual(len(reviews), 30)
+        self.assertEqual(reviews[0]['author'], 'critic-0')
+        self.assertEqual(reviews[0]['product']['category']['slug'], 'oil')
+
+    def test_sparse_fields(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/shop/reviews/?fields=id,rating,product')
+        review = response.json()[0]
+        self.assertEqual(set(review), {'id', 'rating', 'product'})
+        self.assertIsInstance(review['product'], int)  # Not expanded: an id
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/shop/reviews/?fields=id,product.name,author')
+        review = response.json()[0]
+        self.assertEqual(review['product'], {'name': 'Work 0'})
+        self.assertEqual(review['author'], 'critic-0')
+
+        response = self.client.get('/api/shop/reviews/?expand=product')
+        review = response.json()[0]
+        self.assertIsInstance(review['product']['category'], int)
+
+
+class ProductFacetTests(TestCase):
+    def setUp(self):
+        self.oil = Category.objects.create(name='Oil', slug='oil')
+        self.ink = Category.objects.create(name='Ink', slug='ink')
+        for name, category, price, stock, available in [
+            ('dawn', self.oil, '30.00', 1, True),
+            ('noon', self.oil, '120.00', 0, True),
+            ('dusk', self.oil, '600.00', 2, False),
+            ('rain', self.ink, '45.00', 0, True),
+            ('tide', self.ink, '300.00', 1, True),
+        ]:
+            Product.objects.create(name=name, slug=name, category=category, price=price, stock=stock, available=available)
+
+    def test_each_dimension_ignores_its_own_filter(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/api/shop/products/facets/?category={self.oil.pk}&max_price=200&available=true')
+        data = response.json()
+        self.assertEqual(data['total'], 2)
+        self.assertEqual([(c['slug'], c['count']) for c in data['categories']], [('ink', 1), ('oil', 2)])
+        self.assertEqual([bucket['count'] for bucket in data['price']], [1, 0, 1, 0, 0, 0, 0, 0])
+        self.assertEqual(data['price'][-1], {'min': 5000, 'max': None, 'count': 0})
+        self.assertEqual(data['in_stock'], {'true': 1, 'false': 1})
+
+    def test_list_filters(self):
+        def slugs(query):
+            return sorted(product['slug'] for product in self.client.get(f'/api/shop/products/?{query}').json())
+        self.assertEqual(slugs(f'category={self.ink.pk}&in_stock=false'), ['rain'])
+        self.assertEqual(slugs('min_price=100&max_price=600'), ['dusk', 'noon', 'tide'])
+        self.assertEqual(slugs(f'category={self.oil.pk},{self.ink.pk}&available=false'), ['dusk'])
+        self.assertEqual(self.client.get('/api/shop/products/?min_price=cheap').status_code, 400)
+        self.assertEqual(self.client.get('/api/shop/products/facets/?in_stock=maybe').status_code, 400)
+
+
+class LiveStreamTests(TestCase):
+    def setUp(self):
+        category = Category.objects.create(name='Oil', slug='oil')
+        self.product = Product.objects.create(name='Nocturne', slug='nocturne', price='120.00', category=category, stock=3)
+
+    def test_only_live_fields_are_published(self):
+        with mock.patch.object(get_broker(), 'publish') as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.product.name = 'Night piece'
+                self.product.save()
+            publish.assert_not_called()
+            with self.captureOnCommitCallbacks(execute=True):
+                self.product.stock = 2
+                self.product.save()
+                publish.assert_not_called()  # Not before commit
+        publish.assert_called_once_with(CHANNEL, {
+            'key': self.product.pk, 'id': self.product.pk, 'stock': 2, 'available': True, 'price': '120.00',
+        })
+
+    @override_settings(LIVE_HEARTBEAT=0.01)
+    async def test_snapshot_then_changes(self):
+        events = stream([self.product.pk])
+        self.assertEqual(await anext(events), b'retry: 3000\n\n')
+        self.assertIn(b'"stock": 3', await anext(events))
+        get_broker().publish(CHANNEL, {'key': self.product.pk, 'stock': 1})
+        get_broker().publish(CHANNEL, {'key': 0, 'stock': 1})  # Not watched
+        self.assertEqual(await anext(events), b'event: product\ndata: {"key": %d, "stock": 1}\n\n' % self.product.pk)
+        self.assertEqual(await anext(events), b': keep-alive\n\n')
+        await events.aclose()
+        self.assertEqual(get_broker().channels[CHANNEL]['keys'], {})
+
+    async def test_bad_ids(self):
+        self.assertEqual((await self.async_client.get('/api/shop/products/live/?ids=a')).status_code, 400)
+        ids = ','.join(str(pk) for pk in range(MAX_IDS + 1))
+        self.assertEqual((await self.async_client.get(f'/api/shop/products/live/?ids={ids}')).status_code, 400)
+
+
+@override_settings(STORAGES={
+    **settings.STORAGES, 'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+})  # No collectstatic manifest in tests
+class AdminChangelistTests(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'pw'))
+        self.category = Category.objects.create(name='Oil', slug='oil')
+        self.product = Product.objects.create(name='Nocturne', slug='nocturne', price='120.00', category=self.category)
+
+    def add_reviews(self, count):
+        for index in range(count):
+            author = User.objects.create_user(f'critic-{Review.objects.count()}')
+            product = Product.objects.create(
+                name=f'Work {author.pk}', slug=f'work-{author.pk}', price='10.00', category=self.category,
+            )
+            Review.objects.create(product=product, author=author, content=f'Review {index}', rating=4)
+
+    def queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        return len(context)
+
+    def test_changelists_do_not_grow_with_rows(self):
+        self.add_reviews(2)
+        before = {url: self.queries(url) for url in ['/admin/shop/review/', '/admin/shop/product/']}
+        self.add_reviews(10)
+        self.assertEqual({url: self.queries(url) for url in before}, before)
+
+    def test_product_page_shows_the_latest_reviews_read_only(self):
+        author = User.objects.create_user('critic')
+        for index in range(25):
+            Review.objects.create(product=self.product, author=author, content=f'Review {index}', rating=4)
+        response = self.client.get(f'/admin/shop/product/{self.product.pk}/change/')
+        formset = response.context['inline_admin_formsets'][0].formset
+        self.assertEqual(len(formset.forms), 20)
+        self.assertEqual(formset.forms[0].instance.content, 'Review 24')  # Newest first
+        self.assertNotContains(response, 'name="reviews-0-content"')  # Read-only
+
+    def test_autocomplete_instead_of_every_product(self):
+        response = self.client.get('/admin/shop/review/add/')
+        self.assertContains(response, 'admin-autocomplete')
+        self.assertNotContains(response, '>Nocturne</option>')
+
+
+class ProductListingTests(TestCase):
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=root)
+        media.enable()
+        self.addCleanup(media.disable)
+        self.category = Category.objects.create(name='Oil', slug='oil')
+        self.products = [
+            Product.objects.create(name=name, slug=name, price=price, category=self.category, stock=stock)
+            for name, price, stock in [('dawn', '30.00', 1), ('noon', '120.00', 0), ('dusk', '60.00', 2)]
+        ]
+
+    def run_jobs(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            while (job := claim('test')) is not None:  # work() would close the test's connection
+                run(job)
+
+    def listings(self, query=''):
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/api/shop/listings/?{query}')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_saves_queue_refreshes(self):
+        self.assertEqual(self.listings(), [])
+        self.run_jobs()
+        self.assertEqual([item['slug'] for item in self.listings()], ['dusk', 'noon', 'dawn'])
+        Review.objects.create(product=self.products[0], author=User.objects.create_user('critic'), content='Fine', rating=4)
+        self.category.name = 'Oils'
+        self.category.save()
+        self.run_jobs()
+        dawn = self.listings('ordering=price&limit=1')[0]
+        self.assertEqual(dawn['rating'], {'average': 4.0, 'count': 1})
+        self.assertEqual(dawn['category'], {'name': 'Oils', 'slug': 'oil'})
+        self.assertEqual((dawn['price'], dawn['in_stock'], dawn['image']), ('30.00', True, None))
+
+    def test_filters_and_ordering(self):
+        call_command('refresh_listings', stdout=StringIO())
+        self.assertEqual([item['slug'] for item in self.listings('ordering=-price')], ['noon', 'dusk', 'dawn'])
+        self.assertEqual([item['slug'] for item in self.listings('in_stock=true&max_price=50')], ['dawn'])
+        self.assertEqual([item['slug'] for item in self.listings('ordering=price&offset=1&limit=1')], ['dusk'])
+        self.assertEqual(self.client.get('/api/shop/listings/?ordering=name').status_code, 400)
+        self.assertEqual(self.client.get('/api/shop/listings/?limit=all').status_code, 400)
+
+    def test_reconcile_finds_changes_made_around_signals(self):
+        call_command('refresh_listings', stdout=StringIO())
+        self.assertEqual(stale_product_ids(), [])
+        Product.objects.filter(pk=self.products[1].pk).update(stock=4, updated_at=timezone.now())
+        self.assertEqual(stale_product_ids(), [self.products[1].pk])
+        call_command('refresh_listings', stdout=StringIO())
+        self.assertEqual([item['slug'] for item in self.listings('in_stock=false')], [])
+
+    def test_image_variants(self):
+        product = self.products[0]
+        product.image = SimpleUploadedFile('dawn.png', png_bytes(800), content_type='image/png')
+        product.save()
+        refresh([product.pk])
+        listing = ProductListing.objects.get(pk=product.pk)
+        self.assertEqual(set(listing.image_variants), {'320', '640'})  # Narrower than the image only
+        self.assertEqual(set(self.listings('ordering=price')[0]['image']['variants']), {'320', '640'})
+
+        old = listing.image_variants
+        product.image = SimpleUploadedFile('dawn.png', png_bytes(500, 'navy'), content_type='image/png')
+        product.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            refresh([product.pk])
+        self.assertEqual(set(ProductListing.objects.get(pk=product.pk).image_variants), {'320'})
+        self.assertFalse(any(default_storage.exists(name) for name in old.values()))
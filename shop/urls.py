@@ -1,20 +1,33 @@
 from django.urls import path
 from .views import (
-    CategoryListCreateView, CategoryRetrieveUpdateDestroyView,
-    ProductListCreateView, ProductRetrieveUpdateDestroyView,
-    ReviewListCreateView, ReviewRetrieveUpdateDestroyView
+    CategoryListCreateView, CategoryRetrieveUpdateDestroyView, CategoryBySlugView,
+    ProductListCreateView, ProductRetrieveUpdateDestroyView, ProductBySlugView, ProductFacetsView, ProductListingView,
+    ReviewListCreateView, ReviewRetrieveUpdateDestroyView,
+    category_list_async, category_detail_async,
+    product_list_async, product_detail_async, product_stream,
 )
 
 urlpatterns = [
     # Categories
     path('categories/', CategoryListCreateView.as_view(), name='category-list-create'),
     path('categories/<int:pk>/', CategoryRetrieveUpdateDestroyView.as_view(), name='category-detail'),
+    path('categories/slug/<slug:slug>/', CategoryBySlugView.as_view(), name='category-detail-slug'),
 
     # Products
     path('products/', ProductListCreateView.as_view(), name='product-list-create'),
     path('products/<int:pk>/', ProductRetrieveUpdateDestroyView.as_view(), name='product-detail'),
+    path('products/slug/<slug:slug>/', ProductBySlugView.as_view(), name='product-detail-slug'),
+    path('products/facets/', ProductFacetsView.as_view(), name='product-facets'),
+    path('products/live/', product_stream, name='product-stream'),  # Server-sent events, ASGI only
+    path('listings/', ProductListingView.as_view(), name='product-listings'),  # Pre-built listing documents
 
     # Reviews
     path('reviews/', ReviewListCreateView.as_view(), name='review-list-create'),
     path('reviews/<int:pk>/', ReviewRetrieveUpdateDestroyView.as_view(), name='review-detail'),
+
+    # Async read-only versions
+    path('async/categories/', category_list_async, name='category-list-async'),
+    path('async/categories/<int:pk>/', category_detail_async, name='category-detail-async'),
+    path('async/products/', product_list_async, name='product-list-async'),
+    path('async/products/<int:pk>/', product_detail_async, name='product-detail-async'),
 ]
@@ -1,33 +1,114 @@
-from rest_framework import generics
-from .models import Category, Product, Review
+from django.http import HttpResponse, HttpResponseBadRequest, StreamingHttpResponse
+from django.views.decorators.http import require_safe
+from rest_framework import generics, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from fameuxarte.async_api import detail_response, list_response
+from fameuxarte.sparse import SparseFieldsViewMixin
+from fameuxarte.streaming import NDJSONStreamingMixin
+from imagery.views import SimilarImagesMixin
+from slugs.lookup import SlugLookupMixin
+from .filters import ProductFilterBackend, facets, parse_filters
+from .listing import ORDERINGS
+from .live import MAX_IDS, stream
+from .models import Category, Product, ProductListing, Review
 from .serializers import CategorySerializer, ProductSerializer, ReviewSerializer
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 
 # Category API
-class CategoryListCreateView(generics.ListCreateAPIView):
+class CategoryListCreateView(SparseFieldsViewMixin, generics.ListCreateAPIView):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
 
-class CategoryRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+class CategoryRetrieveUpdateDestroyView(SparseFieldsViewMixin, generics.RetrieveUpdateDestroyAPIView):
+    queryset = Category.objects.all()
+    serializer_class = CategorySerializer
+
+class CategoryBySlugView(SlugLookupMixin, SparseFieldsViewMixin, generics.RetrieveAPIView):  # Former slugs redirect
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
 
 # Product API
-class ProductListCreateView(generics.ListCreateAPIView):
-    queryset = Product.objects.all()
+class ProductListCreateView(SparseFieldsViewMixin, NDJSONStreamingMixin, generics.ListCreateAPIView):  # ?format=ndjson streams rows
+    queryset = Product.objects.select_related('category')
+    serializer_class = ProductSerializer
+    filter_backends = [ProductFilterBackend]  # ?category=&min_price=&max_price=&available=&in_stock=
+
+# Catalog listing from the read model: flat rows, JSON built ahead of time (see shop/listing.py)
+# Same filters as the product list, plus ?ordering=newest|price|-price and ?limit=&offset=
+class ProductListingView(generics.GenericAPIView):
+    queryset = ProductListing.objects.all()
+    filter_backends = [ProductFilterBackend]
+
+    def get(self, request):
+        ordering = ORDERINGS.get(request.query_params.get('ordering', 'newest'))
+        try:
+            limit = min(int(request.query_params.get('limit', 48)), 200)
+            offset = max(int(request.query_params.get('offset', 0)), 0)
+        except ValueError:
+            return Response({'detail': "limit and offset must be numbers."}, status=status.HTTP_400_BAD_REQUEST)
+        if ordering is None:
+            return Response({'detail': f"ordering must be one of {', '.join(ORDERINGS)}."}, status=status.HTTP_400_BAD_REQUEST)
+        documents = (
+            self.filter_queryset(self.get_queryset()).order_by(*ordering)
+            .values_list('document', flat=True)[offset:offset + limit]
+        )
+        return HttpResponse('[' + ','.join(documents) + ']', content_type='application/json')
+
+# Filter sidebar counts for the same query parameters as the product list
+class ProductFacetsView(APIView):
+    def get(self, request):
+        return Response(facets(Product.objects.all(), parse_filters(request.query_params)))
+
+class ProductRetrieveUpdateDestroyView(SparseFieldsViewMixin, SimilarImagesMixin, generics.RetrieveUpdateDestroyAPIView):  # ?similar=6 adds look-alikes
+    queryset = Product.objects.select_related('category')
     serializer_class = ProductSerializer
+    similar_kind = 'product'
 
-class ProductRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Product.objects.all()
+class ProductBySlugView(SimilarImagesMixin, SlugLookupMixin, SparseFieldsViewMixin, generics.RetrieveAPIView):  # Former slugs redirect
+    queryset = Product.objects.select_related('category')
     serializer_class = ProductSerializer
+    similar_kind = 'product'
 
 # Review API (Only Authenticated Users Can Post Reviews)
-class ReviewListCreateView(generics.ListCreateAPIView):
-    queryset = Review.objects.all()
+class ReviewListCreateView(SparseFieldsViewMixin, generics.ListCreateAPIView):
+    queryset = Review.objects.select_related('author', 'product__category')  # Every review renders its author and nested product
     serializer_class = ReviewSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]  # Users must be logged in to add a review
 
-class ReviewRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Review.objects.all()
+class ReviewRetrieveUpdateDestroyView(SparseFieldsViewMixin, generics.RetrieveUpdateDestroyAPIView):
+    queryset = Review.objects.select_related('author', 'product__category')
     serializer_class = ReviewSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+
+
+# Async read-only API (for ASGI workers, see fameuxarte/async_api.py)
+@require_safe
+async def category_list_async(request):
+    return await list_response(request, Category.objects.all(), CategorySerializer)
+
+@require_safe
+async def category_detail_async(request, pk):
+    return await detail_response(request, Category.objects.all(), CategorySerializer, pk=pk)
+
+@require_safe
+async def product_list_async(request):
+    return await list_response(request, Product.objects.select_related('category'), ProductSerializer)
+
+@require_safe
+async def product_detail_async(request, pk):
+    return await detail_response(request, Product.objects.select_related('category'), ProductSerializer, pk=pk)
+
+# Live stock/price changes as server-sent events: /api/shop/products/live/?ids=12,40 (see shop/live.py)
+@require_safe
+async def product_stream(request):
+    try:
+        ids = [int(value) for value in request.GET.get('ids', '').split(',') if value.strip()]
+    except ValueError:
+        return HttpResponseBadRequest("ids must be product ids, e.g. ?ids=12,40")
+    if len(ids) > MAX_IDS:
+        return HttpResponseBadRequest(f"At most {MAX_IDS} ids per stream.")
+    response = StreamingHttpResponse(stream(ids), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # Let nginx pass events through as they are produced
+    return response
@@ -0,0 +1,126 @@
+import json
+import os
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Max
+
+from .sections import SECTIONS
+
+URLS_PER_SHARD = 50000  # Hard limit from the sitemaps.org protocol
+MANIFEST_NAME = 'manifest.json'
+INDEX_NAME = 'sitemap.xml'
+
+
+def shard_name(section, shard):
+    return f'{section.name}-{shard}.xml'
+
+
+def shard_fingerprints(section, shard_size=URLS_PER_SHARD):
+    """
+    Row count and newest lastmod of every shard of ``section``, in one grouped query.
+
+    Shards are fixed primary key ranges (pk 1..50000 is shard 0 and so on), so a
+    shard never holds more than ``shard_size`` URLs and a new or edited row only
+    ever touches the shard its pk falls into.
+    """
+    rows = (
+        section.get_queryset()
+        .order_by()
+        .annotate(shard=(F('pk') - 1) / shard_size)
+        .values('shard')
+        .annotate(rows=Count('pk'), lastmod=Max(section.lastmod_field))
+        .order_by('shard')
+    )
+    return {
+        str(row['shard']): {'rows': row['rows'], 'lastmod': row['lastmod'].isoformat() if row['lastmod'] else None}
+        for row in rows
+    }
+
+
+def write_shard(section, shard, path, shard_size=URLS_PER_SHARD):
+    """Stream one shard to disk, reading rows through a server-side cursor."""
+    low = int(shard) * shard_size
+    queryset = (
+        section.get_queryset()
+        .filter(pk__gt=low, pk__lte=low + shard_size)
+        .order_by('pk')
+        .values_list(*section.columns())
+    )
+    tmp_path = path + '.tmp'
+    # The cursor lives inside one transaction so it also works behind PgBouncer in transaction mode
+    with transaction.atomic(), open(tmp_path, 'w', encoding='utf-8') as out:
+        out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        out.write('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+        for row in queryset.iterator(chunk_size=2000):
+            out.write('<url><loc>%s</loc>' % escape(section.location(row)))
+            if row[1]:
+                out.write('<lastmod>%s</lastmod>' % row[1].isoformat())
+            out.write('<changefreq>%s</changefreq><priority>%.1f</priority></url>\n' % (section.changefreq, section.priority))
+        out.write('</urlset>\n')
+    os.replace(tmp_path, path)  # Readers never see a half-written shard
+
+
+def write_index(root, manifest):
+    base = settings.SITE_URL.rstrip('/') + settings.SITEMAP_URL_PREFIX
+    tmp_path = os.path.join(root, INDEX_NAME + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as out:
+        out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        out.write('<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+        for section in SECTIONS:
+            shards = manifest.get(section.name, {})
+            for shard in sorted(shards, key=int):
+                out.write('<sitemap><loc>%s</loc>' % escape(base + shard_name(section, shard)))
+                if shards[shard]['lastmod']:
+                    out.write('<lastmod>%s</lastmod>' % shards[shard]['lastmod'])
+                out.write('</sitemap>\n')
+        out.write('</sitemapindex>\n')
+    os.replace(tmp_path, os.path.join(root, INDEX_NAME))
+
+
+def load_manifest(root):
+    try:
+        with open(os.path.join(root, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def generate(root=None, force=False, shard_size=URLS_PER_SHARD):
+    """
+    Bring the sitemap files under ``root`` up to date.
+
+    Only shards whose row count or newest lastmod changed since the last run
+    are rewritten; shards that became empty are removed. Returns a
+    ``{'written': [...], 'removed': [...], 'unchanged': n}`` summary.
+    """
+    root = root or settings.SITEMAP_ROOT
+    os.makedirs(root, exist_ok=True)
+    old_manifest = {} if force else load_manifest(root)
+    manifest = {}
+    summary = {'written': [], 'removed': [], 'unchanged': 0}
+
+    for section in SECTIONS:
+        current = shard_fingerprints(section, shard_size)
+        previous = old_manifest.get(section.name, {})
+        for shard, fingerprint in current.items():
+            path = os.path.join(root, shard_name(section, shard))
+            if previous.get(shard) == fingerprint and os.path.exists(path):
+                summary['unchanged'] += 1
+                continue
+            write_shard(section, shard, path, shard_size)
+            summary['written'].append(shard_name(section, shard))
+        for shard in set(previous) - set(current):
+            try:
+                os.remove(os.path.join(root, shard_name(section, shard)))
+            except FileNotFoundError:
+                pass
+            summary['removed'].append(shard_name(section, shard))
+        manifest[section.name] = current
+
+    if force or manifest != old_manifest or not os.path.exists(os.path.join(root, INDEX_NAME)):
+        write_index(root, manifest)
+        with open(os.path.join(root, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+    return summary
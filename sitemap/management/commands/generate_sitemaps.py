@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from sitemap.builder import generate
+
+
+class Command(BaseCommand):
+    help = "Write sitemap shards and the sitemap index, rewriting only the shards whose rows changed."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help="Rewrite every shard.")
+        parser.add_argument('--root', help="Output directory (defaults to SITEMAP_ROOT).")
+
+    def handle(self, *args, **options):
+        summary = generate(root=options['root'], force=options['force'])
+        for name in summary['written']:
+            self.stdout.write(f"wrote {name}")
+        for name in summary['removed']:
+            self.stdout.write(f"removed {name}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(summary['written'])} shard(s) written, {len(summary['removed'])} removed, "
+            f"{summary['unchanged']} unchanged."
+        ))
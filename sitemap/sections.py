@@ -0,0 +1,57 @@
+from django.conf import settings
+
+from artists.models import Artist
+from blog.models import Post, Tag
+from gallery.models import GalleryImage
+from shop.models import Category, Product
+
+
+class Section:
+    """
+    One group of sitemap URLs backed by a model.
+
+    ``path`` is formatted with the row's ``pk`` and ``slug`` (when the model has
+    one) and is appended to SITE_URL. ``lastmod_field`` must be a timestamp that
+    moves forward whenever the row changes, so a shard's MAX() tells us whether
+    it needs rewriting.
+    """
+
+    def __init__(self, name, queryset, path, lastmod_field, changefreq='weekly', priority=0.5, slug_field=None):
+        self.name = name
+        self._queryset = queryset
+        self.path = settings.SITEMAP_PATHS.get(name, path)
+        self.lastmod_field = lastmod_field
+        self.changefreq = changefreq
+        self.priority = priority
+        self.slug_field = slug_field
+
+    def get_queryset(self):
+        return self._queryset.all()
+
+    def columns(self):
+        columns = ['pk', self.lastmod_field]
+        if self.slug_field:
+            columns.append(self.slug_field)
+        return columns
+
+    def location(self, row):
+        values = {'pk': row[0]}
+        if self.slug_field:
+            values['slug'] = row[2]
+        return settings.SITE_URL.rstrip('/') + self.path.format(**values)
+
+
+SECTIONS = [
+    Section('products', Product.objects.filter(available=True), '/artworks/{slug}', 'updated_at',
+            changefreq='daily', priority=0.9, slug_field='slug'),
+    Section('categories', Category.objects.all(), '/category/{slug}', 'updated_at',
+            changefreq='weekly', priority=0.7, slug_field='slug'),
+    Section('posts', Post.objects.all(), '/blog/{slug}', 'published_at',
+            changefreq='weekly', priority=0.8, slug_field='slug'),
+    Section('tags', Tag.objects.all(), '/blog?tag={slug}', 'updated_at',
+            changefreq='weekly', priority=0.4, slug_field='slug'),
+    Section('artists', Artist.objects.all(), '/artists/{pk}', 'updated_at',
+            changefreq='weekly', priority=0.8),
+    Section('gallery', GalleryImage.objects.all(), '/discover/gallery/{pk}', 'updated_at',
+            changefreq='monthly', priority=0.5),
+]
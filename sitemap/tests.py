@@ -0,0 +1,72 @@
+import os
+import shutil
+import tempfile
+
+from django.test import TestCase, override_settings
+
+from shop.models import Category, Product
+from .builder import INDEX_NAME, generate
+
+# Create your tests here.
+
+@override_settings(SITE_URL='https://example.com')
+class GenerateTests(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        self.category = Category.objects.create(name='Oil', slug='oil')
+        self.products = [
+            Product.objects.create(name=name, slug=name, price='10.00', category=self.category)
+            for name in ['dawn', 'noon', 'dusk']
+        ]
+
+    def read(self, name):
+        with open(os.path.join(self.root, name), encoding='utf-8') as f:
+            return f.read()
+
+    def product_shards(self, summary):
+        return sorted(name for name in summary if name.startswith('products-'))
+
+    def test_shards_and_index(self):
+        Product.objects.filter(slug='noon').update(available=False)
+        summary = generate(self.root, shard_size=2)
+        self.assertEqual(len(self.product_shards(summary['written'])), 2)  # pks span two ranges of two
+        products = ''.join(self.read(name) for name in self.product_shards(summary['written']))
+        self.assertIn('<loc>https://example.com/artworks/dawn</loc>', products)
+        self.assertNotIn('noon', products)  # Unavailable
+        index = self.read(INDEX_NAME)
+        for name in summary['written']:
+            self.assertIn(f'https://example.com/sitemaps/{name}', index)
+
+    def test_only_changed_shards_are_rewritten(self):
+        first = generate(self.root, shard_size=2)
+        self.assertEqual(generate(self.root, shard_size=2), {'written': [], 'removed': [], 'unchanged': len(first['written'])})
+
+        self.products[-1].name = 'Dusk'
+        self.products[-1].save()
+        summary = generate(self.root, shard_size=2)
+        self.assertEqual(len(summary['written']), 1)
+        self.assertIn(summary['written'][0], first['written'])
+
+        self.assertEqual(len(generate(self.root, force=True, shard_size=2)['written']), len(first['written']))
+
+    def test_empty_shards_are_removed(self):
+        generate(self.root, shard_size=1)
+        dusk = self.products[-1]
+        dusk.delete()
+        summary = generate(self.root, shard_size=1)
+        self.assertEqual(len(summary['removed']), 1)
+        self.assertFalse(os.path.exists(os.path.join(self.root, summary['removed'][0])))
+        self.assertNotIn(summary['removed'][0], self.read(INDEX_NAME))
+
+    def test_files_are_served_from_disk(self):
+        with override_settings(SITEMAP_ROOT=self.root):
+            self.assertEqual(self.client.get('/sitemap.xml').status_code, 404)  # Not generated yet
+            generate()
+            response = self.client.get('/sitemap.xml')
+            self.assertEqual(response['Content-Type'], 'application/xml')
+            self.assertIn(b'<sitemapindex', b''.join(response.streaming_content))
+            with self.assertNumQueries(0):
+                response = self.client.get('/sitemaps/categories-0.xml')
+            self.assertIn(b'/category/oil', b''.join(response.streaming_content))
+            self.assertEqual(self.client.post('/sitemap.xml').status_code, 405)
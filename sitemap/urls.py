@@ -0,0 +1,7 @@
+from django.urls import path, re_path
+from . import views
+
+urlpatterns = [
+    path('sitemap.xml', views.sitemap_index, name='sitemap-index'),
+    re_path(r'^sitemaps/(?P<name>[a-z]+-\d+)\.xml$', views.sitemap_shard, name='sitemap-shard'),
+]
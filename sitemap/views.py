@@ -0,0 +1,28 @@
+import os
+
+from django.conf import settings
+from django.http import FileResponse, Http404
+from django.views.decorators.http import require_safe
+
+from .builder import INDEX_NAME
+
+
+# Sitemaps are served straight from the files written by `manage.py generate_sitemaps`,
+# so a crawler walking every shard never touches the database.
+def _serve(filename):
+    path = os.path.join(settings.SITEMAP_ROOT, filename)
+    if not os.path.isfile(path):
+        raise Http404("Sitemap not generated yet.")
+    response = FileResponse(open(path, 'rb'), content_type='application/xml')
+    response['Cache-Control'] = 'public, max-age=3600'
+    return response
+
+
+@require_safe
+def sitemap_index(request):
+    return _serve(INDEX_NAME)
+
+
+@require_safe
+def sitemap_shard(request, name):
+    return _serve(f'{name}.xml')
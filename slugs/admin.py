@@ -0,0 +1,8 @@
+from django.contrib import admin
+from .models import SlugHistory
+
+@admin.register(SlugHistory)
+class SlugHistoryAdmin(admin.ModelAdmin):
+    list_display = ('kind', 'slug', 'object_id', 'changed_at')
+    list_filter = ('kind',)
+    search_fields = ('slug',)
@@ -0,0 +1,54 @@
+from django.db.models import Subquery
+from django.http import Http404, HttpResponsePermanentRedirect
+from django.urls import reverse
+
+from .models import SlugHistory
+
+# Slug-addressed detail views. The current slug is found with one query on its
+# unique index; only a miss looks in SlugHistory, and a former slug is answered
+# with a 301 to the current one.
+
+SLUGGED_MODELS = ('shop.Product', 'shop.Category', 'blog.Post', 'blog.Tag')
+
+
+def kind_of(model):
+    return model._meta.label_lower
+
+
+class SlugMoved(Exception):
+    def __init__(self, slug):
+        self.slug = slug
+
+
+def resolve(queryset, slug):
+    """The object of ``queryset`` whose slug is ``slug``; raises SlugMoved for a former slug, Http404 otherwise."""
+    obj = queryset.filter(slug=slug).first()
+    if obj is not None:
+        return obj
+    kind = kind_of(queryset.model)
+    history = SlugHistory.objects.filter(kind=kind, slug=slug).values('object_id')[:1]
+    current = queryset.model._default_manager.filter(pk=Subquery(history)).values_list('slug', flat=True).first()
+    if current is not None and current != slug:
+        raise SlugMoved(current)
+    raise Http404(f"No {queryset.model._meta.object_name} matches the given query.")
+
+
+class SlugLookupMixin:
+    """
+    For detail views routed by ``<slug:slug>``: looks the object up as above
+    and answers former slugs with a permanent redirect to the same route.
+    """
+
+    lookup_field = 'slug'
+
+    def get_object(self):
+        obj = resolve(self.filter_queryset(self.get_queryset()), self.kwargs['slug'])
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    def handle_exception(self, exc):
+        if isinstance(exc, SlugMoved):
+            url = reverse(self.request.resolver_match.view_name, kwargs={**self.kwargs, 'slug': exc.slug})
+            query = self.request.META.get('QUERY_STRING')
+            return HttpResponsePermanentRedirect(f'{url}?{query}' if query else url)
+        return super().handle_exception(exc)
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.15 on 2026-10-19 19:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SlugHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=50)),
+                ('slug', models.SlugField(max_length=200)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('changed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Slug history',
+                'constraints': [models.UniqueConstraint(fields=('kind', 'slug'), name='slugs_history_unique_slug')],
+            },
+        ),
+    ]
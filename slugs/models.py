@@ -0,0 +1,19 @@
+from django.db import models
+
+# Create your models here.
+
+class SlugHistory(models.Model):
+    """A slug an object used to have; requests for it are redirected to the current one."""
+    kind = models.CharField(max_length=50) # Model label, e.g. "shop.product" (see slugs/lookup.py)
+    slug = models.SlugField(max_length=200)
+    object_id = models.PositiveBigIntegerField()
+    changed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "Slug history"
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'slug'], name='slugs_history_unique_slug'), # The redirect lookup
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.slug} -> {self.object_id}"
@@ -0,0 +1,25 @@
+from django.apps import apps
+from django.db.models.signals import post_init, post_save
+
+from .lookup import SLUGGED_MODELS, kind_of
+from .models import SlugHistory
+
+
+def remember_slug(sender, instance, **kwargs):
+    instance._saved_slug = instance.__dict__.get('slug')  # Deferred slugs are not fetched
+
+
+# A changed slug goes into the history
+def slug_saved(sender, instance, created, **kwargs):
+    kind, old = kind_of(sender), instance._saved_slug
+    if created or old is None or old == instance.slug:
+        return
+    SlugHistory.objects.filter(kind=kind, slug=instance.slug).delete()  # The slug is current again
+    SlugHistory.objects.update_or_create(kind=kind, slug=old, defaults={'object_id': instance.pk})
+    instance._saved_slug = instance.slug
+
+
+for label in SLUGGED_MODELS:
+    model = apps.get_model(label)
+    post_init.connect(remember_slug, sender=model, dispatch_uid=f'slugs-init-{label}')
+    post_save.connect(slug_saved, sender=model, dispatch_uid=f'slugs-save-{label}')
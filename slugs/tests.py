@@ -0,0 +1,43 @@
+from django.test import TestCase
+
+from shop.models import Category, Product
+from .models import SlugHistory
+
+# Create your tests here.
+
+class SlugLookupTests(TestCase):
+    def setUp(self):
+        self.category = Category.objects.create(name='Oil', slug='oil')
+        self.product = Product.objects.create(name='Nocturne', slug='nocturne', price='120.00', category=self.category)
+
+    def rename(self, slug):
+        self.product.slug = slug
+        self.product.save()
+
+    def test_current_slug_is_one_query(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/shop/products/slug/nocturne/')
+        self.assertEqual(response.json()['id'], self.product.pk)
+
+    def test_former_slug_redirects(self):
+        self.rename('night-piece')
+        response = self.client.get('/api/shop/products/slug/nocturne/?fields=id')
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(response['Location'], '/api/shop/products/slug/night-piece/?fields=id')
+        self.assertEqual(self.client.get('/api/shop/products/slug/night-piece/').status_code, 200)
+
+    def test_reused_slug_leaves_the_history(self):
+        self.rename('night-piece')
+        self.rename('nocturne')
+        self.assertEqual(list(SlugHistory.objects.values_list('slug', flat=True)), ['night-piece'])
+        self.assertEqual(self.client.get('/api/shop/products/slug/nocturne/').status_code, 200)
+        self.assertEqual(self.client.get('/api/shop/products/slug/night-piece/').status_code, 301)
+
+    def test_history_is_per_model(self):
+        self.rename('night-piece')
+        self.assertEqual(self.client.get('/api/shop/categories/slug/nocturne/').status_code, 404)
+
+    def test_deleted_objects_are_not_found(self):
+        self.rename('night-piece')
+        self.product.delete()
+        self.assertEqual(self.client.get('/api/shop/products/slug/nocturne/').status_code, 404)
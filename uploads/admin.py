@@ -0,0 +1,9 @@
+from django.contrib import admin
+from .models import ChunkedUpload
+
+@admin.register(ChunkedUpload)
+class ChunkedUploadAdmin(admin.ModelAdmin):
+    list_display = ('filename', 'user', 'size', 'offset', 'status', 'updated_at')
+    list_filter = ('status',)
+    search_fields = ('id', 'filename')
+    readonly_fields = ('id', 'user', 'filename', 'size', 'offset', 'sha256', 'status', 'created_at', 'updated_at')
@@ -0,0 +1,59 @@
+import hashlib
+import os
+import re
+import shutil
+
+BLOCK_SIZE = 64 * 1024
+CONTENT_RANGE_RE = re.compile(r'^bytes (\d+)-(\d+)/(\d+)$')
+
+
+def parse_content_range(header):
+    """``bytes <start>-<end>/<total>`` -> (start, end, total); end is inclusive."""
+    match = CONTENT_RANGE_RE.match((header or '').strip())
+    if not match:
+        raise ValueError("Send each chunk with a 'Content-Range: bytes <start>-<end>/<total>' header.")
+    start, end, total = (int(value) for value in match.groups())
+    if start > end or end >= total:
+        raise ValueError("Invalid Content-Range.")
+    return start, end, total
+
+
+def write_part(stream, path, length):
+    """
+    Copy exactly ``length`` bytes from the request stream to ``path`` in small
+    blocks and return their SHA-256. Raises ValueError if the body is shorter.
+    """
+    sha = hashlib.sha256()
+    remaining = length
+    with open(path, 'wb') as f:
+        while remaining:
+            block = stream.read(min(BLOCK_SIZE, remaining)) if stream is not None else b''
+            if not block:
+                raise ValueError(f"Chunk body ended {remaining} bytes early.")
+            sha.update(block)
+            f.write(block)
+            remaining -= len(block)
+    return sha.hexdigest()
+
+
+def append_part(part, path, start):
+    """Append a received chunk to the upload file at ``start`` and remove it."""
+    with open(path, 'ab') as f, open(part, 'rb') as chunk:
+        f.truncate(start)  # Drop anything left behind by an append that crashed half way
+        shutil.copyfileobj(chunk, f, BLOCK_SIZE)
+    os.remove(part)
+
+
+def file_sha256(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(BLOCK_SIZE), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
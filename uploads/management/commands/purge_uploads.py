@@ -0,0 +1,32 @@
+import os
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from uploads.chunks import remove
+from uploads.models import ChunkedUpload
+
+
+class Command(BaseCommand):
+    help = "Delete chunked uploads that were abandoned or never attached, plus stray chunk files."
+
+    def handle(self, *args, **options):
+        expiry = timedelta(hours=settings.UPLOAD_EXPIRY_HOURS)
+        stale = ChunkedUpload.objects.filter(updated_at__lt=timezone.now() - expiry)
+        count = 0
+        for upload in stale.iterator():
+            upload.discard()
+            count += 1
+
+        parts = 0
+        if os.path.isdir(settings.UPLOAD_TEMP_DIR):
+            cutoff = time.time() - expiry.total_seconds()
+            with os.scandir(settings.UPLOAD_TEMP_DIR) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.part') and entry.stat().st_mtime < cutoff:
+                        remove(entry.path)
+                        parts += 1
+        self.stdout.write(self.style.SUCCESS(f"Deleted {count} expired upload(s) and {parts} stray chunk file(s)."))
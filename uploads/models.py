@@ -0,0 +1,67 @@
+import os
+import uuid
+
+from django.conf import settings
+from django.contrib.auth.models import User # For User
+from django.core.files import File
+from django.db import models
+
+# Create your models here.
+
+class AssembledFile(File):
+    """A finished upload on local disk; like TemporaryUploadedFile, it is validated and saved from its path."""
+
+    def temporary_file_path(self):
+        return self.file.name
+
+
+class ChunkedUpload(models.Model):
+    UPLOADING = 'uploading'
+    COMPLETE = 'complete'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (UPLOADING, 'Uploading'),
+        (COMPLETE, 'Complete'),
+        (FAILED, 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name='chunked_uploads')
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField() # Total bytes the client will send
+    offset = models.PositiveBigIntegerField(default=0) # Bytes received so far; the next chunk starts here
+    sha256 = models.CharField(max_length=64, blank=True) # Optional checksum of the whole file, checked at the end
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=UPLOADING)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'updated_at'], name='uploads_status_updated'), # purge_uploads
+        ]
+
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.size})"
+
+    @classmethod
+    def for_user(cls, user):
+        """Uploads a user may see: their own, or anonymous ones (found only by their random id)."""
+        return cls.objects.filter(user_id=user.pk if user.is_authenticated else None)
+
+    @property
+    def path(self):
+        return os.path.join(settings.UPLOAD_TEMP_DIR, str(self.id))
+
+    def part_path(self, start):
+        return f'{self.path}.{start}.part'
+
+    def as_file(self):
+        return AssembledFile(open(self.path, 'rb'), name=self.filename)
+
+    def discard(self):
+        """Delete the upload and its data on disk (stray .part files are left to purge_uploads)."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:  # Already moved into media storage
+            pass
+        self.delete()
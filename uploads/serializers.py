@@ -0,0 +1,67 @@
+from django.conf import settings
+from rest_framework import serializers
+from .models import ChunkedUpload
+
+class ChunkedUploadSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ChunkedUpload
+        fields = '__all__'
+        read_only_fields = ('user', 'offset', 'status', 'created_at', 'updated_at')
+
+    def validate_size(self, value):
+        if value > settings.UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(f"Uploads are limited to {settings.UPLOAD_MAX_SIZE} bytes.")
+        return value
+
+    def validate_sha256(self, value):
+        value = value.lower()
+        if value and (len(value) != 64 or any(c not in '0123456789abcdef' for c in value)):
+            raise serializers.ValidationError("Expected a hex SHA-256 digest.")
+        return value
+
+
+class ChunkedUploadFieldMixin:
+    """
+    Lets a model serializer take ``upload=<id>`` of a completed chunked upload
+    instead of the file itself in ``upload_field``. The file goes through the
+    field's normal validation from its path on disk and is consumed on save.
+    """
+
+    upload_field = 'image'
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get('request')
+        uploads = ChunkedUpload.objects.none()
+        if request is not None:
+            uploads = ChunkedUpload.for_user(request.user).filter(status=ChunkedUpload.COMPLETE)
+        fields['upload'] = serializers.PrimaryKeyRelatedField(queryset=uploads, write_only=True, required=False)
+        self._upload_field_required = fields[self.upload_field].required
+        fields[self.upload_field].required = False  # Either the file or an upload id
+        return fields
+
+    def validate(self, attrs):
+        upload = attrs.pop('upload', None)
+        if upload is not None:
+            field = self.fields[self.upload_field]
+            file = upload.as_file()
+            try:
+                attrs[self.upload_field] = field.run_validation(file)
+                attrs = super().validate(attrs)
+            except Exception:
+                file.close()  # Rejected (not an image, another field invalid): save() won't close it
+                raise
+            self._upload = upload
+            return attrs
+        if self._upload_field_required and self.upload_field not in attrs and not self.partial:
+            raise serializers.ValidationError({self.upload_field: [self.fields[self.upload_field].error_messages['required']]})
+        return super().validate(attrs)
+
+    def save(self, **kwargs):
+        upload = getattr(self, '_upload', None)
+        try:
+            return super().save(**kwargs)
+        finally:
+            if upload is not None:
+                self.validated_data[self.upload_field].close()
+                upload.discard()
@@ -0,0 +1,98 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from io import BytesIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.throttling import ScopedRateThrottle
+from rest_framework_simplejwt.tokens import AccessToken
+
+from gallery.models import GalleryImage
+from .models import ChunkedUpload
+
+# Create your tests here.
+
+
+def png_bytes():
+    buffer = BytesIO()
+    Image.new('RGB', (64, 64), 'teal').save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+class ChunkedUploadTests(TestCase):
+    def setUp(self):
+        cache.clear()  # Throttle history
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        settings = override_settings(UPLOAD_TEMP_DIR=os.path.join(self.root, 'tmp'), MEDIA_ROOT=os.path.join(self.root, 'media'))
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.user = User.objects.create_user('artist')
+        self.auth = {'HTTP_AUTHORIZATION': f'Bearer {AccessToken.for_user(self.user)}'}
+
+    def start(self, data):
+        response = self.client.post('/api/uploads/', {
+            'filename': 'work.png', 'size': len(data), 'sha256': hashlib.sha256(data).hexdigest(),
+        }, **self.auth)
+        self.assertEqual(response.status_code, 201)
+        return response.json()['id']
+
+    def put(self, upload_id, data, start, end):
+        return self.client.put(
+            f'/api/uploads/{upload_id}/', data[start:end + 1], content_type='application/octet-stream',
+            HTTP_CONTENT_RANGE=f'bytes {start}-{end}/{len(data)}', **self.auth,
+        )
+
+    def upload(self, data):
+        upload_id = self.start(data)
+        middle = len(data) // 2
+        self.assertEqual(self.put(upload_id, data, 0, middle - 1).json()['offset'], middle)
+        self.assertEqual(self.put(upload_id, data, 0, middle - 1).status_code, 409)  # Already received
+        self.assertEqual(self.client.get(f'/api/uploads/{upload_id}/', **self.auth).json()['offset'], middle)
+        self.assertEqual(self.put(upload_id, data, middle, len(data) - 1).json()['status'], 'complete')
+        return upload_id
+
+    def test_anonymous_clients_cannot_upload(self):
+        response = self.client.post('/api/uploads/', {'filename': 'work.png', 'size': 10})
+        self.assertEqual(response.status_code, 401)
+
+    def test_resumable_upload_becomes_an_image(self):
+        upload_id = self.upload(png_bytes())
+        response = self.client.post('/api/gallery/gallery/', {'title': 'Teal', 'upload': upload_id}, **self.auth)
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(GalleryImage.objects.get().image.name.endswith('.png'))
+        self.assertFalse(ChunkedUpload.objects.exists())
+
+    def test_rejected_files_are_closed(self):
+        upload_id = self.upload(b'not an image at all')
+        opened = []
+        as_file = ChunkedUpload.as_file
+
+        def tracking_as_file(upload):
+            opened.append(as_file(upload))
+            return opened[-1]
+
+        with mock.patch.object(ChunkedUpload, 'as_file', tracking_as_file):
+            response = self.client.post('/api/gallery/gallery/', {'title': 'Broken', 'upload': upload_id}, **self.auth)
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(opened and all(file.closed for file in opened))
+        self.assertTrue(ChunkedUpload.objects.filter(pk=upload_id).exists())  # Kept: the client may retry
+
+    def test_checksum_mismatch_fails_the_upload(self):
+        data = png_bytes()
+        upload_id = self.start(data)
+        response = self.put(upload_id, data[:-1] + b'x', 0, len(data) - 1)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(ChunkedUpload.objects.get(pk=upload_id).status, ChunkedUpload.FAILED)
+
+    def test_starting_uploads_is_rate_limited(self):
+        with mock.patch.dict(ScopedRateThrottle.THROTTLE_RATES, {'uploads': '2/hour'}):
+            self.start(b'a')
+            self.start(b'b')
+            response = self.client.post('/api/uploads/', {'filename': 'c.png', 'size': 1}, **self.auth)
+        self.assertEqual(response.status_code, 429)
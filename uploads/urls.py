@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import ChunkedUploadCreateView, ChunkedUploadDetailView
+
+urlpatterns = [
+    path('', ChunkedUploadCreateView.as_view(), name='upload-create'),
+    path('<uuid:pk>/', ChunkedUploadDetailView.as_view(), name='upload-detail'),
+]
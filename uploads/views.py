@@ -0,0 +1,91 @@
+import os
+
+from django.conf import settings
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from rest_framework import generics, status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle
+from .chunks import append_part, file_sha256, parse_content_range, remove, write_part
+from .models import ChunkedUpload
+from .serializers import ChunkedUploadSerializer
+
+# Start an upload: POST {"filename", "size", "sha256"?}
+# Logged-in users only, and rate limited: each upload reserves up to UPLOAD_MAX_SIZE of disk
+class ChunkedUploadCreateView(generics.CreateAPIView):
+    serializer_class = ChunkedUploadSerializer
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'uploads'
+
+    def perform_create(self, serializer):
+        user = self.request.user if self.request.user.is_authenticated else None
+        upload = serializer.save(user=user)
+        os.makedirs(settings.UPLOAD_TEMP_DIR, exist_ok=True)
+        open(upload.path, 'wb').close()
+
+
+# GET shows how far an upload got (resume from `offset`), PUT sends the next chunk, DELETE aborts it.
+# Every chunk is its own short request, so no worker is held for the whole transfer.
+class ChunkedUploadDetailView(generics.RetrieveDestroyAPIView):
+    serializer_class = ChunkedUploadSerializer
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'upload_chunks'
+
+    def get_queryset(self):
+        return ChunkedUpload.for_user(self.request.user)
+
+    def perform_destroy(self, instance):
+        instance.discard()
+
+    def put(self, request, *args, **kwargs):
+        upload = self.get_object()
+        if upload.status != ChunkedUpload.UPLOADING:
+            return Response({'detail': f"Upload is {upload.status}."}, status=status.HTTP_409_CONFLICT)
+        try:
+            start, end, total = parse_content_range(request.META.get('HTTP_CONTENT_RANGE'))
+        except ValueError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        length = end - start + 1
+        if total != upload.size:
+            return Response({'detail': f"Upload size is {upload.size} bytes."}, status=status.HTTP_400_BAD_REQUEST)
+        if length > settings.UPLOAD_CHUNK_MAX_SIZE:
+            return Response({'detail': f"Chunks are limited to {settings.UPLOAD_CHUNK_MAX_SIZE} bytes."},
+                            status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        if start != upload.offset:
+            return Response({'detail': "Chunk does not start at the current offset.", 'offset': upload.offset},
+                            status=status.HTTP_409_CONFLICT)
+
+        # Receive into a separate part file, so a broken or duplicate chunk never touches the upload
+        part = upload.part_path(start)
+        try:
+            digest = write_part(request.stream, part, length)
+        except ValueError as e:
+            remove(part)
+            return Response({'detail': str(e), 'offset': upload.offset}, status=status.HTTP_400_BAD_REQUEST)
+        expected = request.META.get('HTTP_X_CHUNK_SHA256', '').lower()
+        if expected and expected != digest:
+            remove(part)
+            return Response({'detail': "Chunk checksum mismatch.", 'offset': upload.offset},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            upload = ChunkedUpload.objects.select_for_update().get(pk=upload.pk)
+            if upload.offset != start:  # A retry of the same chunk got there first
+                remove(part)
+                return Response({'detail': "Chunk does not start at the current offset.", 'offset': upload.offset},
+                                status=status.HTTP_409_CONFLICT)
+            append_part(part, upload.path, start)
+            upload.offset = end + 1
+            if upload.offset == upload.size:
+                if upload.sha256 and file_sha256(upload.path) != upload.sha256:
+                    upload.status = ChunkedUpload.FAILED
+                else:
+                    upload.status = ChunkedUpload.COMPLETE
+            upload.save(update_fields=['offset', 'status', 'updated_at'])
+
+        if upload.status == ChunkedUpload.FAILED:
+            return Response({'detail': "File checksum mismatch."}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(self.get_serializer(upload).data)